@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark scaling of the simulator's thread and process backends.
+
+Plays the same games serially and with 1, 2 and 4 threads or processes,
+for two workloads: ``parity`` against ``hunt``, which is almost pure Python,
+and ``density`` against ``parity``, which spends most of its time in NumPy
+kernels that release the GIL. Prints whether this interpreter is a
+free-threaded build and whether the GIL is enabled. Run it under both kinds
+of interpreter to compare, e.g. ``python3.13t -X gil=0``.
+
+Run from the repository root::
+
+    $ python -m benchmarks.bench_backends
+
+Notes:
+    Project
+        SimpleGames
+    Path
+        benchmarks/bench_backends.py
+    Created
+        19 Oct 2026
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import os
+import sys
+import sysconfig
+
+# Third-party imports
+
+# Local application imports
+from src.battleships.engine.simulation import select_backend, simulate
+from src.battleships.loaders import load_fleet
+from src.battleships.settings import GameSettings
+
+# Module-level constants
+WORKLOADS = {'python': (['parity', 'hunt'], 2000),
+             'numpy': (['density', 'parity'], 100)}
+WORKERS = (1, 2, 4)
+
+
+def main() -> None:
+    settings = GameSettings()
+    fleet = load_fleet(settings.Fleet)
+
+    free_threaded = bool(sysconfig.get_config_var('Py_GIL_DISABLED'))
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"Python {sys.version.split()[0]}, free-threaded build: "
+          f"{free_threaded}, GIL enabled: {gil}, CPUs: {os.cpu_count()}")
+
+    for workload, (strategies, games) in WORKLOADS.items():
+        print(f"{workload}: {' vs '.join(strategies)}, {games} games")
+        serial = simulate(settings, fleet, strategies, games, progress=None)
+        print(f"  {'serial':<10}    {serial.wall_time:7.2f} s")
+        for backend in ('threads', 'processes'):
+            for workers in WORKERS:
+                report = simulate(settings, fleet, strategies, games,
+                                  workers=workers, backend=backend,
+                                  progress=None)
+                print(f"  {backend:<10} x{workers} {report.wall_time:7.2f} s"
+                      f"  {serial.wall_time / report.wall_time:5.2f}x")
+        choice = select_backend(settings, fleet, strategies, games,
+                                max(WORKERS))
+        print(f"  auto-selected for x{max(WORKERS)}: {choice}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Measure the overhead of engine instrumentation.
+
+Plays the same batch of games three times: before instrumentation was ever
+enabled, with it enabled, and after disabling it again. The disabled run must
+execute the original functions (checked by identity) and match the baseline
+within timing noise.
+
+Run from the repository root::
+
+    $ python -m benchmarks.bench_instrumentation
+
+Notes:
+    Project
+        SimpleGames
+    Path
+        benchmarks/bench_instrumentation.py
+    Created
+        19 Oct 2026
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import time
+
+# Third-party imports
+
+# Local application imports
+from src.battleships import instrumentation
+from src.battleships.domain.board import Board
+from src.battleships.domain.turns import Arena
+from src.battleships.engine.simulation import simulate
+from src.battleships.loaders import load_fleet, load_game_settings
+
+# Module-level constants
+GAMES = 500
+REPEATS = 5
+
+
+def _best_of(func) -> float:
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    settings = load_game_settings()
+    fleet = load_fleet(settings.Fleet)
+
+    def run():
+        simulate(settings, fleet, ['hunt', 'random'], GAMES, progress=None)
+
+    run()  # Warm caches before timing anything.
+    originals = (Board.receive_shot, Arena.fire)
+    baseline = _best_of(run)
+
+    instrumentation.enable()
+    enabled = _best_of(run)
+    shots = instrumentation.stats()['counters']['shots']
+    instrumentation.disable()
+
+    restored = (Board.receive_shot, Arena.fire) == originals
+    disabled = _best_of(run)
+
+    print(f"{GAMES} games, best of {REPEATS}:")
+    print(f"  baseline  {baseline:7.3f} s")
+    print(f"  enabled   {enabled:7.3f} s  ({enabled / baseline - 1:+.1%}, "
+          f"{shots:,} shots recorded)")
+    print(f"  disabled  {disabled:7.3f} s  ({disabled / baseline - 1:+.1%})")
+    print(f"  originals restored: {restored}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Measure the memory saved by interning fleet specs across sessions.
+
+Builds the roster and fleet of 10k sessions from the bundled ``rosters.yml``
+and ``fleet.yml``, once as independent copies and once through `REGISTRY`,
+and reports the memory retained by each.
+
+Run from the repository root::
+
+    $ python -m benchmarks.bench_interning
+
+Notes:
+    Project
+        SimpleGames
+    Path
+        benchmarks/bench_interning.py
+    Created
+        19 Oct 2026
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from pathlib import Path
+import tracemalloc
+
+# Third-party imports
+import yaml
+
+# Local application imports
+from src.battleships.domain.fleet import Fleet
+from src.battleships.settings import FleetSettings
+
+# Module-level constants
+CONFIG = Path(__file__).resolve().parents[1] / 'src' / 'battleships' / 'config'
+SESSIONS = 10_000
+
+
+def _fleet_kwargs() -> dict:
+    rosters = yaml.safe_load((CONFIG / 'rosters.yml').read_text())
+    fleet = yaml.safe_load((CONFIG / 'fleet.yml').read_text())
+    roster_id = fleet['roster']
+    return dict(id=roster_id,
+                roster=dict(id=roster_id, **rosters[roster_id]),
+                counts={name: ship['quantity']
+                        for name, ship in fleet['ships'].items()})
+
+
+def _retained(build) -> int:
+    tracemalloc.start()
+    sessions = [build() for _ in range(SESSIONS)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sessions
+    return retained
+
+
+def main() -> None:
+    settings = FleetSettings()
+    kwargs = _fleet_kwargs()
+    context = {"fleet_settings": settings}
+
+    copied = _retained(lambda: Fleet.model_validate(kwargs, context=context))
+    interned = _retained(lambda: Fleet.create(settings=settings, **kwargs))
+
+    print(f"Per {SESSIONS:,} sessions:")
+    print(f"  copies:   {copied / 2**20:8.2f} MiB")
+    print(f"  interned: {interned / 2**20:8.2f} MiB")
+    print(f"  saved:    {(copied - interned) / 2**20:8.2f} MiB "
+          f"({1 - interned / copied:.1%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark bulk coordinate parsing against the pydantic path.
+
+Parses one million coordinates, written as ``player.yml``-style tuple strings
+of five coordinates each and as A1 strings, with `parse_batch`. The reference
+is the straightforward pydantic route: `ast.literal_eval` of each string and
+validation as ``list[Coord]`` by a `TypeAdapter`.
+
+Run from the repository root::
+
+    $ python -m benchmarks.bench_parsing
+
+Notes:
+    Project
+        SimpleGames
+    Path
+        benchmarks/bench_parsing.py
+    Created
+        19 Oct 2026
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import ast
+import time
+
+# Third-party imports
+import numpy as np
+from pydantic import TypeAdapter
+
+# Local application imports
+from src.battleships.domain.coordinates import Coord
+from src.battleships.domain.parsing import parse_batch, to_a1
+
+# Module-level constants
+COORDINATES = 1_000_000
+PER_STRING = 5
+SIZE = 10
+
+
+def _timed(label: str, func) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:7.3f} s  "
+          f"{COORDINATES / elapsed / 1e6:6.2f} M coords/s")
+    return elapsed
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    pairs = rng.integers(SIZE, size=(COORDINATES // PER_STRING, PER_STRING, 2))
+    tuples = [str(tuple(map(tuple, ship))) for ship in pairs.tolist()]
+    a1 = [' '.join(to_a1(r, c) for r, c in ship) for ship in pairs.tolist()]
+
+    adapter = TypeAdapter(list[Coord])
+
+    print(f"{COORDINATES:,} coordinates in strings of {PER_STRING}:")
+    reference = _timed("literal_eval + pydantic",
+                       lambda: [adapter.validate_python(ast.literal_eval(s))
+                                for s in tuples])
+    fast = _timed("parse_batch (tuple strings)",
+                  lambda: parse_batch(tuples, SIZE, SIZE))
+    _timed("parse_batch (A1)", lambda: parse_batch(a1, SIZE, SIZE))
+    print(f"  speed-up on tuple strings: {reference / fast:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark `PlayerTable` against one `Player` model per live player.
+
+Builds 10,000 players, each having fired 40 shots, and compares the memory
+retained per player. Each model holds its own `Board`. The table holds a
+board slot id, so the shared-memory bytes of a `BoardPool` slot are added to
+its figure. It then times one shot for every player, recorded as a loop
+over models and as one `PlayerTable.record_shots` call.
+
+Run from the repository root::
+
+    $ python -m benchmarks.bench_players
+
+Notes:
+    Project
+        SimpleGames
+    Path
+        benchmarks/bench_players.py
+    Created
+        19 Oct 2026
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import time
+import tracemalloc
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.domain.board import Board
+from src.battleships.domain.player import Player, PlayerTable
+from src.battleships.loaders import load_fleet
+from src.battleships.settings import GameSettings
+
+# Module-level constants
+PLAYERS = 10_000
+SHOTS = 40
+
+
+def _retained(build) -> tuple[object, int]:
+    tracemalloc.start()
+    built = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return built, retained
+
+
+def main() -> None:
+    settings = GameSettings()
+    fleet = load_fleet(settings.Fleet)
+    context = {'fleet_settings': settings.Fleet}
+    board = settings.Board
+    rng = np.random.default_rng(0)
+    shots = rng.integers(board.height * board.width, size=(PLAYERS, SHOTS))
+    width = board.width
+
+    def models():
+        return [Player.model_validate(
+                    dict(name=f"player{i}",
+                         board=Board.from_settings(board), fleet=fleet,
+                         guesses=[divmod(c, width) for c in row]),
+                    context=context)
+                for i, row in enumerate(shots.tolist())]
+
+    def table():
+        players = PlayerTable(board, capacity=PLAYERS)
+        for i in range(PLAYERS):
+            players.add(f"player{i}", ships_afloat=fleet.total_ships,
+                        slot=(i, 1))
+        index = np.arange(PLAYERS)
+        for column in shots.T:
+            players.record_shots(index, column, np.zeros(PLAYERS, bool))
+        return players
+
+    players, model_bytes = _retained(models)
+    columns, table_bytes = _retained(table)
+    # grid (int8) + occupants (int32) + ship ids + slot metadata.
+    slot_bytes = (board.height * board.width * 5
+                  + 4 * settings.Fleet.max_ships + 4 * 8)
+
+    print(f"{PLAYERS:,} players, {SHOTS} shots each:")
+    print(f"  Player models: {model_bytes / PLAYERS:10,.0f} B/player")
+    print(f"  PlayerTable:   {table_bytes / PLAYERS:10,.0f} B/player "
+          f"(+{slot_bytes} B pool slot)")
+
+    cells = rng.integers(board.height * board.width, size=PLAYERS)
+    hits = rng.random(PLAYERS) < 0.2
+    start = time.perf_counter()
+    for player, cell in zip(players, cells.tolist()):
+        player.guesses.append(divmod(cell, width))
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns.record_shots(np.arange(PLAYERS), cells, hits)
+    vectorised = time.perf_counter() - start
+    print(f"One shot per player: loop over models {loop * 1e3:.2f} ms, "
+          f"record_shots {vectorised * 1e3:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark terminal rendering of many boards spectated live.
+
+Sixteen 30x30 boards each take one shot per frame. The reference prints every
+row of every board with ``print``, as `Board.show` used to; `BoardRenderer`
+writes one buffered frame and then only the changed cells. Output goes to an
+in-memory stream, so the figures measure formatting and write calls rather
+than the terminal.
+
+Run from the repository root::
+
+    $ python -m benchmarks.bench_render
+
+Notes:
+    Project
+        SimpleGames
+    Path
+        benchmarks/bench_render.py
+    Created
+        19 Oct 2026
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import contextlib
+import io
+import time
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.render import GLYPHS, BoardRenderer
+
+# Module-level constants
+BOARDS = 16
+SIZE = 30
+FRAMES = 500
+
+
+def _shots(rng: np.random.Generator) -> np.ndarray:
+    return rng.integers(SIZE, size=(FRAMES, BOARDS, 2))
+
+
+def _run(label: str, draw) -> float:
+    rng = np.random.default_rng(0)
+    grids = [np.zeros((SIZE, SIZE), dtype=np.int8) for _ in range(BOARDS)]
+    shots = _shots(rng)
+    out = io.StringIO()
+
+    start = time.perf_counter()
+    for frame in shots:
+        for grid, (r, c) in zip(grids, frame.tolist()):
+            grid[r, c] = 2
+        draw(grids, out)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<24} {elapsed:7.3f} s  {FRAMES / elapsed:8.0f} frames/s"
+          f"  {out.tell() / FRAMES / 1024:7.1f} KiB/frame")
+    return elapsed
+
+
+def _print_rows(grids, out) -> None:
+    with contextlib.redirect_stdout(out):
+        for grid in grids:
+            for row in grid:
+                print(' '.join(map(str, row)))
+
+
+def main() -> None:
+    renderer = BoardRenderer(symbols=GLYPHS, max_fps=float('inf'))
+
+    def live(grids, out):
+        renderer.stream = out
+        renderer.draw(grids)
+
+    print(f"{BOARDS} boards of {SIZE}x{SIZE}, {FRAMES} frames:")
+    reference = _run("print per row", _print_rows)
+    fast = _run("BoardRenderer (live)", live)
+    print(f"  speed-up: {reference / fast:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark appending to and querying the columnar results store.
+
+Fills a temporary store with synthetic results spread over a handful of
+settings and matchups, then times a filtered group-by aggregate over every
+row.
+
+Run from the repository root (``--rows`` defaults to 100 million)::
+
+    $ python -m benchmarks.bench_store --rows 100000000
+
+Notes:
+    Project
+        SimpleGames
+    Path
+        benchmarks/bench_store.py
+    Created
+        19 Oct 2026
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import argparse
+import shutil
+import tempfile
+import time
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.engine.store import (CHUNK_ROWS, RESULT_DTYPE,
+                                          ResultStore, encode_name)
+
+# Module-level constants
+STRATEGIES = ('random', 'hunt', 'density', 'parity')
+SETTINGS = 8
+
+
+def _rows(n: int, rng: np.random.Generator) -> np.ndarray:
+    rows = np.zeros(n, dtype=RESULT_DTYPE)
+    codes = np.array([encode_name(s) for s in STRATEGIES], dtype=np.uint32)
+    matchups = np.array([encode_name(f"{a}|{b}") for a in STRATEGIES
+                         for b in STRATEGIES], dtype=np.uint32)
+
+    rows['settings'] = rng.integers(SETTINGS, size=n) + 1
+    rows['matchup'] = matchups[rng.integers(len(matchups), size=n)]
+    rows['winner_strategy'] = codes[rng.integers(len(codes), size=n)]
+    rows['game'] = np.arange(n)
+    rows['winner'] = rng.integers(-1, 2, size=n)
+    rows['shots_to_win'] = rng.integers(17, 100, size=n)
+    rows['total_shots'] = rows['shots_to_win'] * 2
+    rows['max_streak'] = rng.integers(0, 10, size=n)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000_000)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix='bench_store_')
+    try:
+        store = ResultStore(root)
+        rng = np.random.default_rng(0)
+
+        start = time.perf_counter()
+        with store.writer() as writer:
+            for offset in range(0, args.rows, CHUNK_ROWS):
+                writer.append(_rows(min(CHUNK_ROWS, args.rows - offset), rng))
+        written = time.perf_counter() - start
+        print(f"append {args.rows:,} rows: {written:6.2f} s "
+              f"({args.rows / written / 1e6:.1f} M rows/s)")
+
+        for label, kwargs in [
+                ("group by matchup, winner", dict(
+                    group_by=['matchup', 'winner_strategy'],
+                    agg={'shots_to_win': ['mean', 'max']})),
+                ("filter settings, group by winner", dict(
+                    where={'settings': 3}, group_by=['winner_strategy'],
+                    agg={'max_streak': 'mean'})),
+                ("filter range, aggregate", dict(
+                    where={'shots_to_win': lambda c: c < 30},
+                    agg={'total_shots': ['sum', 'min']}))]:
+            start = time.perf_counter()
+            result = store.query(**kwargs)
+            elapsed = time.perf_counter() - start
+            print(f"query {label:<34} {elapsed:6.2f} s "
+                  f"({len(result['rows'])} groups)")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
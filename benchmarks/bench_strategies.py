@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark targeting strategies by speed and shots needed.
+
+Each registered strategy sinks every ship of random layouts on a 10x10 and a
+100x100 board, and reports moves per second of strategy time (`next_shot`
+plus `observe`) and the mean number of shots to clear a board. ``density``,
+whose cost grows with the number of placements, only plays a few games on
+the small board.
+
+Run from the repository root::
+
+    $ python -m benchmarks.bench_strategies
+
+Notes:
+    Project
+        SimpleGames
+    Path
+        benchmarks/bench_strategies.py
+    Created
+        19 Oct 2026
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import time
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.domain.board import HIT, MISS, SUNK
+from src.battleships.engine import batch  # noqa: F401  Registers 'density'.
+from src.battleships.engine.placement import random_layout
+from src.battleships.engine.strategies import STRATEGIES
+from src.battleships.settings import BoardSettings, FleetSettings
+
+# Module-level constants
+SIZES = [5, 4, 3, 3, 2]
+BOARDS = (10, 100)
+GAMES = {'density': 20}
+DEFAULT_GAMES = 200
+SMALL_ONLY = {'density'}
+
+
+def clear_board(strategy_cls, board: BoardSettings, fleet: FleetSettings,
+                rng: np.random.Generator) -> tuple[int, int]:
+    """Shoot until every ship is sunk; return ``(shots, nanoseconds)``."""
+    occupants = random_layout(SIZES, board, fleet, rng)
+    left = list(SIZES)
+    afloat = len(SIZES)
+    clock = time.perf_counter_ns
+
+    start = clock()
+    strategy = strategy_cls(board, SIZES, rng, fleet)
+    spent = clock() - start
+    shots = 0
+    while afloat:
+        start = clock()
+        cell = strategy.next_shot()
+        spent += clock() - start
+
+        ship = int(occupants[cell])
+        sunk = None
+        if ship < 0:
+            result = MISS
+        else:
+            left[ship] -= 1
+            result = HIT
+            if not left[ship]:
+                result, sunk = SUNK, SIZES[ship]
+                afloat -= 1
+        shots += 1
+
+        start = clock()
+        strategy.observe(cell, result, sunk)
+        spent += clock() - start
+    return shots, spent
+
+
+def main() -> None:
+    fleet = FleetSettings()
+    for size in BOARDS:
+        board = BoardSettings(width=size, height=size)
+        print(f"{size}x{size} board, ships {SIZES}:")
+        for name in sorted(STRATEGIES):
+            if name in SMALL_ONLY and size > min(BOARDS):
+                continue
+            games = GAMES.get(name, DEFAULT_GAMES)
+            rng = np.random.default_rng(0)
+            shots = spent = 0
+            for _ in range(games):
+                s, ns = clear_board(STRATEGIES[name], board, fleet, rng)
+                shots += s
+                spent += ns
+            print(f"  {name:<8} {shots / spent * 1e9:>12,.0f} moves/s  "
+                  f"{shots / games:>8.1f} shots/board")
+
+
+if __name__ == '__main__':
+    main()
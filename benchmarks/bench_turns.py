@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmark N-player turn scheduling and shot resolution.
+
+Plays complete free-for-all games at 2, 8 and 64 players, each shooter
+firing at a random unshot cell of the next live player, and reports turns
+per second.
+
+Run from the repository root::
+
+    $ python -m benchmarks.bench_turns
+
+Notes:
+    Project
+        SimpleGames
+    Path
+        benchmarks/bench_turns.py
+    Created
+        19 Oct 2026
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import time
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.domain.board import Board
+from src.battleships.domain.ship import ShipSpec
+from src.battleships.domain.turns import Arena
+from src.battleships.settings import (BoardSettings, GameSettings,
+                                      PlayerSettings)
+
+# Module-level constants
+PLAYER_COUNTS = (2, 8, 64)
+SHIP_SIZES = (5, 4, 3, 2, 2, 1, 1)
+
+
+def _board(settings: BoardSettings) -> Board:
+    board = Board.from_settings(settings)
+    for row, size in enumerate(SHIP_SIZES):
+        board.place_ship(f"ship{row}", ShipSpec(size=size),
+                         [(row, col) for col in range(size)])
+    return board
+
+
+def play(n_players: int, rng: np.random.Generator) -> int:
+    """Play one game to completion and return the number of turns."""
+    board_settings = BoardSettings(max_players=n_players)
+    settings = GameSettings(Board=board_settings,
+                            Player=PlayerSettings(shots_limit=100))
+    arena = Arena([_board(board_settings) for _ in range(n_players)],
+                  settings=settings)
+
+    n_cells = board_settings.width * board_settings.height
+    orders = [rng.permutation(n_cells).tolist() for _ in range(n_players)]
+    width = board_settings.width
+
+    scheduler = arena.scheduler
+    turns = 0
+    while not scheduler.is_over:
+        target = scheduler.next_target(scheduler.current)
+        cell = orders[target].pop()
+        arena.fire(target, divmod(cell, width))
+        turns += 1
+    return turns
+
+
+def main(games: int = 20) -> None:
+    rng = np.random.default_rng(0)
+    for n_players in PLAYER_COUNTS:
+        start = time.perf_counter()
+        turns = sum(play(n_players, rng) for _ in range(games))
+        elapsed = time.perf_counter() - start
+        print(f"{n_players:>3} players: {turns / elapsed:>10,.0f} turns/s "
+              f"({turns / games:,.0f} turns/game)")
+
+
+if __name__ == '__main__':
+    main()
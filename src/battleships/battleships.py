@@ -42,15 +42,24 @@ Notes:
 from __future__ import annotations
 
 # Standard library imports
+import argparse
+from pathlib import Path
+from typing import Optional, Sequence
 
 # Third-party imports
 
 # Local application imports
 from src.battleships.domain.board import Board
+from src.battleships.engine.openings import BOOK_DEPTH, SHELF, BookShelf
+from src.battleships.engine.replay import BATCH_SIZE, verify
+from src.battleships.engine.simulation import BACKENDS, simulate
+from src.battleships.engine.strategies import STRATEGIES
+from src.battleships.loaders import (CONFIG_DIR, fleet_ships, load_fleet,
+                                     load_game_settings)
 
 # Module-level constants
 
-__all__ = ['Battleships']
+__all__ = ['Battleships', 'main']
 
 
 class Battleships:
@@ -82,5 +91,93 @@ class Battleships:
         return
 
 
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='battleships')
+    commands = parser.add_subparsers(dest='command')
+
+    sim = commands.add_parser(
+        'simulate', help="Play computer-versus-computer games headlessly.")
+    sim.add_argument('--config', type=Path, default=None,
+                     help="YAML file of GameSettings (defaults if omitted).")
+    sim.add_argument('--fleet', type=Path, default=CONFIG_DIR / 'fleet.yml')
+    sim.add_argument('--rosters', type=Path,
+                     default=CONFIG_DIR / 'rosters.yml')
+    sim.add_argument('--strategies', nargs='+', default=['parity', 'hunt'],
+                     choices=sorted(STRATEGIES),
+                     help="Strategy of each player, in seat order.")
+    sim.add_argument('--games', type=int, default=1000)
+    sim.add_argument('--workers', type=int, default=1)
+    sim.add_argument('--backend', choices=BACKENDS, default='auto',
+                     help="Run workers as threads or processes; 'auto' "
+                          "picks from a short calibration run, or threads "
+                          "for short runs.")
+    sim.add_argument('--seed', type=int, default=0)
+    sim.add_argument('--out', type=Path, default=None,
+                     help="CSV file receiving one row per game.")
+    sim.add_argument('--replay', type=Path, default=None,
+                     help="JSON lines file receiving layouts and shots.")
+    sim.add_argument('--store', type=Path, default=None,
+                     help="Columnar results store directory to append to.")
+    sim.add_argument('--books', type=Path, default=None,
+                     help="Directory of opening books for the 'book' "
+                          "strategy.")
+
+    check = commands.add_parser(
+        'verify', help="Re-check the games of a replay log against the rules.")
+    check.add_argument('replay', type=Path,
+                       help="JSON lines replay log written by 'simulate'.")
+    check.add_argument('--config', type=Path, default=None,
+                       help="YAML file of the GameSettings the games used.")
+    check.add_argument('--fleet', type=Path, default=CONFIG_DIR / 'fleet.yml')
+    check.add_argument('--rosters', type=Path,
+                       default=CONFIG_DIR / 'rosters.yml')
+    check.add_argument('--batch', type=int, default=BATCH_SIZE,
+                       help="Games replayed together.")
+    check.add_argument('--limit', type=int, default=None,
+                       help="Verify only the first LIMIT games.")
+
+    books = commands.add_parser(
+        'books', help="Precompute the opening book of a configuration.")
+    books.add_argument('--config', type=Path, default=None,
+                       help="YAML file of GameSettings (defaults if omitted).")
+    books.add_argument('--fleet', type=Path, default=CONFIG_DIR / 'fleet.yml')
+    books.add_argument('--rosters', type=Path,
+                       default=CONFIG_DIR / 'rosters.yml')
+    books.add_argument('--depth', type=int, default=BOOK_DEPTH,
+                       help="Opening shots covered by the book.")
+    books.add_argument('--out', type=Path, required=True,
+                       help="Directory receiving the book file.")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command-line entry point."""
+    args = _parser().parse_args(argv)
+
+    if args.command not in ('simulate', 'verify', 'books'):
+        Battleships(autoplay=True)
+        return
+
+    settings = load_game_settings(args.config)
+    fleet = load_fleet(settings.Fleet, args.fleet, args.rosters)
+    sizes = [spec.size for _, spec in fleet_ships(fleet)]
+    if args.command == 'verify':
+        report = verify(args.replay, settings, args.batch, args.limit, sizes)
+        print(report.summary())
+        raise SystemExit(0 if report.ok else 1)
+
+    if args.command == 'books':
+        shelf = BookShelf(args.out, depth=args.depth)
+        print(shelf.build(settings.Board, settings.Fleet, sizes))
+        return
+
+    SHELF.use(args.books)
+    report = simulate(settings, fleet, args.strategies, args.games,
+                      workers=args.workers, seed=args.seed,
+                      out=args.out, replay=args.replay, store=args.store,
+                      backend=args.backend)
+    print(report.summary())
+
+
 if __name__ == '__main__':
-    Battleships(autoplay=True)
+    main()
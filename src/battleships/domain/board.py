@@ -48,70 +48,242 @@ Notes:
 .. _Google Python Style Guide:
    https://google.github.io/styleguide/pyguide.html
 """
-
 from __future__ import annotations
 
 # Standard library imports
 from dataclasses import dataclass, field
 import numpy as np
-from typing import Optional
+import sys
+from typing import Callable, Mapping, Optional, Sequence
 
 # Third-party imports
 
 # Local application imports
 from src.battleships.settings import BoardSettings
 from src.battleships.domain.fleet import Fleet
+from src.battleships.domain.registry import REGISTRY
+from src.battleships.domain.ship import ShipSpec
+from src.battleships.render import render_frame
 
 # Module-level constants
+EMPTY: int = 0
+SHIP: int = 1
+MISS: int = 2
+HIT: int = 3
+SUNK: int = 4
+
+__all__ = ['Board', 'EMPTY', 'SHIP', 'MISS', 'HIT', 'SUNK']
 
-__all__ = ['Board']
+Listener = Callable[['Board', Optional[np.ndarray]], None]
 
 
 @dataclass
 class Board:
-    """2D game board."""
+    """2D game board.
+
+    Each cell of ``grid`` holds one of the module-level cell states
+    (``EMPTY``, ``SHIP``, ``MISS``, ``HIT``, ``SUNK``). ``occupants`` records
+    which placed ship (an index into ``ships``) covers each cell, or ``-1``.
+    ``ships`` holds the `REGISTRY` ship-type id of each placed ship rather
+    than its name and spec.
+
+    Listeners registered with `subscribe` are called after every state change
+    with the flat indices of the cells that changed, or ``None`` when the
+    whole board changed.
+
+    A board whose arrays live in shared storage (see `BoardPool`) can be
+    ``bind``-ed to it: the storage is then asked before every change whether
+    the board may still write, and supplies ``ships`` on `resync`.
+    """
     length: int
     width: int
+    max_ships: Optional[int] = field(default=None, repr=False)
     grid: np.ndarray = field(init=False, repr=False)
+    occupants: np.ndarray = field(init=False, repr=False)
+    ships: list[int] = field(default_factory=list, init=False, repr=False)
 
+    _afloat: list[int] = field(default_factory=list, init=False, repr=False)
+    _sunk: int = field(default=0, init=False, repr=False)
+    _listeners: list[Listener] = field(default_factory=list, init=False,
+                                       repr=False)
     _has_loaded_fleet: bool = field(default=False, init=False, repr=False)
+    _check_writable: Optional[Callable[[], None]] = field(
+        default=None, init=False, repr=False)
+    _load_ships: Optional[Callable[[], list[int]]] = field(
+        default=None, init=False, repr=False)
 
     def __post_init__(self):
         """Initialise grid after dataclass is constructed."""
         # Initial grid of zeros is easily created using `reset` method.
         self.grid = self.reset_grid()
+        self.occupants = np.full((self.length, self.width), -1, dtype=np.int32)
+
+    @classmethod
+    def from_settings(cls, settings: BoardSettings) -> "Board":
+        """Create an empty board sized from `BoardSettings`."""
+        return cls(length=settings.height, width=settings.width)
 
     def reset_grid(self, inplace: bool = False) -> Optional[np.ndarray]:
         """Create a zeroed grid.
 
         Arguments:
-            inplace: If `True`, update ``self.grid``. Otherwise, return a new grid.
+            inplace: If `True`, clear ``self.grid`` and all placed ships
+                (existing views of the grid stay valid). Otherwise, return a
+                new grid.
         """
-        grid = np.zeros((self.length, self.width), dtype=int)
+        if not inplace:
+            return np.zeros((self.length, self.width), dtype=np.int8)
+
+        self._before_change()
+        self.grid.fill(EMPTY)
+        self.occupants.fill(-1)
+        self.ships.clear()
+        self._afloat.clear()
+        self._sunk = 0
+        self._has_loaded_fleet = False
+        self._notify(None)
+        return None
+
+    def subscribe(self, listener: Listener) -> None:
+        """Register ``listener`` to be called after each state change."""
+        self._listeners.append(listener)
 
-        if inplace:
-            self.grid = grid
-            return None
-        else:
-            return grid
+    def unsubscribe(self, listener: Listener) -> None:
+        """Remove a listener registered with `subscribe`."""
+        self._listeners.remove(listener)
+
+    def bind(self, check_writable: Callable[[], None],
+             load_ships: Callable[[], list[int]]) -> None:
+        """Attach the board to the shared storage holding its arrays.
+
+        Arguments:
+            check_writable: Called before every change; raises if the board
+                may no longer write to the storage.
+            load_ships: Returns the ship-type ids currently in the storage.
+        """
+        self._check_writable = check_writable
+        self._load_ships = load_ships
+
+    def _before_change(self) -> None:
+        if self._check_writable is not None:
+            self._check_writable()
+
+    def _notify(self, cells: Optional[np.ndarray]) -> None:
+        for listener in self._listeners:
+            listener(self, cells)
 
     def show(self) -> None:
-        """Print the current grid-state."""
-        for row in self.grid:
-            print(' '.join(map(str, row)))
+        """Print the current grid-state in a single write."""
+        sys.stdout.write(render_frame([self.grid]))
         return
 
-    def add_fleet(self, fleet: Fleet):
-        """Load a fleet onto the board."""
+    def place_ship(self, name: str, spec: ShipSpec,
+                   positions: Sequence[tuple[int, int]]) -> int:
+        """Place a single ship and return its index in ``ships``.
+
+        Arguments:
+            name: Ship type, as named in the roster.
+            spec: Specification of the ship type.
+            positions: ``(row, col)`` cells covered by the ship.
+        """
+        if len(positions) != spec.size:
+            raise ValueError(f"Ship '{name}' spans {spec.size} cells but "
+                             f"{len(positions)} positions were given.")
+
+        rows, cols = np.asarray(positions, dtype=np.intp).reshape(-1, 2).T
+        if (rows.min() < 0 or cols.min() < 0
+                or rows.max() >= self.length or cols.max() >= self.width):
+            raise ValueError(f"Ship '{name}' lies outside the board: "
+                             f"{positions}")
+
+        cells = rows * self.width + cols
+        if (self.occupants.flat[cells] >= 0).any():
+            raise ValueError(f"Ship '{name}' overlaps another ship: "
+                             f"{positions}")
+        if self.max_ships is not None and len(self.ships) >= self.max_ships:
+            raise ValueError(f"Board holds at most {self.max_ships} ships.")
+        self._before_change()
+
+        index = len(self.ships)
+        self.ships.append(REGISTRY.ship_type_id(name, spec))
+        self._afloat.append(spec.size)
+        self.occupants.flat[cells] = index
+        self.grid.flat[cells] = SHIP
+        self._notify(cells)
+        return index
+
+    def add_fleet(self, fleet: Fleet,
+                  positions: Mapping[str, Sequence[Sequence[tuple[int, int]]]]
+                  ) -> None:
+        """Load a fleet onto the board.
+
+        Arguments:
+            fleet: Fleet to place.
+            positions: For each ship type, the cells of every ship of that
+                type (e.g. as read from ``player.yml``).
+        """
 
         if self._has_loaded_fleet:
             raise RuntimeError(f"A fleet has already been loaded onto this "
                                f"board.")
 
-        for ship in fleet.roster.items():
+        for name, spec in fleet.roster.roster.items():
+            placed = positions.get(name, ())
+            if len(placed) != fleet.count(name):
+                raise ValueError(f"Fleet '{fleet.id}' has {fleet.count(name)}"
+                                 f" '{name}' but {len(placed)} were placed.")
+            for cells in placed:
+                self.place_ship(name, spec, cells)
+
+        self._has_loaded_fleet = True
 
+    def receive_shot(self, coord: tuple[int, int]) -> int:
+        """Resolve a shot at ``coord`` and return the resulting cell state.
+
+        Sinking a ship marks every cell of that ship as ``SUNK``.
+        """
+        row, col = coord
+        if not (0 <= row < self.length and 0 <= col < self.width):
+            raise ValueError(f"Shot {coord} lies outside the board.")
 
+        cell = row * self.width + col
+        state = self.grid.flat[cell]
+        if state >= MISS:
+            raise ValueError(f"Cell {coord} has already been shot.")
+        self._before_change()
 
+        if state == EMPTY:
+            self.grid.flat[cell] = MISS
+            self._notify(np.array([cell]))
+            return MISS
 
+        index = self.occupants.flat[cell]
+        self._afloat[index] -= 1
+        if self._afloat[index]:
+            self.grid.flat[cell] = HIT
+            self._notify(np.array([cell]))
+            return HIT
 
+        self._sunk += 1
+        cells = np.flatnonzero(self.occupants == index)
+        self.grid.flat[cells] = SUNK
+        self._notify(cells)
+        return SUNK
+
+    def resync(self) -> None:
+        """Recompute the per-ship counters from ``grid`` and ``occupants``.
+
+        Needed when the arrays are shared with, and were changed by, another
+        process. A bound board also reloads ``ships`` from its storage.
+        """
+        if self._load_ships is not None:
+            self.ships = self._load_ships()
+            self._has_loaded_fleet = bool(self.ships)
+        unhit = self.occupants[self.grid == SHIP]
+        self._afloat = np.bincount(unhit, minlength=len(self.ships)).tolist()
+        self._sunk = self._afloat.count(0)
 
+    @property
+    def ships_afloat(self) -> int:
+        """Number of placed ships that have not been sunk."""
+        return len(self.ships) - self._sunk
@@ -54,6 +54,7 @@ from pydantic import (
     field_validator)
 
 # Local application imports
+from src.battleships.domain.parsing import parse_coords
 
 __all__ = ['Coord']
 
@@ -64,15 +65,26 @@ Coord = tuple[int, int]
 
 class Placement(BaseModel):
     """"""
-    positions: list[Coord] = Field(
+    positions: list[list[Coord]] = Field(
         validation_alias=AliasChoices('positions', 'position')
     )
 
     @field_validator('positions', mode='before')
     @classmethod
     def _obtain_positions(cls, value: Any):
-        """Obtains coordinate positions.
+        """Obtains coordinate positions, one list of cells per ship.
 
         Accept the following formats:
-            -
+            - A tuple string, e.g. ``'((0, 0), (0, 1))'``, for one ship.
+            - A string in A1 notation, e.g. ``'A1 A2'``, for one ship.
+            - A list of such strings, one per ship, as in ``player.yml``.
+            - Anything else is passed on to field validation unchanged.
         """
+        if isinstance(value, str):
+            return [parse_coords(value).tolist()]
+
+        if (isinstance(value, (list, tuple)) and value
+                and all(isinstance(v, str) for v in value)):
+            return [parse_coords(v).tolist() for v in value]
+
+        return value
@@ -48,9 +48,11 @@ from pydantic import (
     ConfigDict,
     Field,
     model_validator,
+    PositiveInt,
     ValidationInfo, computed_field)
 
 # Local application imports
+from src.battleships.domain.registry import REGISTRY
 from src.battleships.domain.ship import ShipSpec
 
 # Module-level constants
@@ -72,7 +74,7 @@ class Roster(BaseModel):
         if node is None or "roster" not in node:
             raise KeyError(f"Roster id [{id_} not found.")
 
-        return cls(id=id_, roster=node["roster"])
+        return REGISTRY.intern(cls(id=id_, roster=node["roster"]))
 
 
 class Fleet(BaseModel):
@@ -92,7 +94,7 @@ class Fleet(BaseModel):
     id: str
     ships: dict[str, tuple[int, int]] = Field(default_factory=dict)
     roster: Roster = Field(default_factory=Roster)
-    counts: dict[str, int] = Field(default_factory=dict, gt=0)
+    counts: dict[str, PositiveInt] = Field(default_factory=dict)
 
     @model_validator(mode='after')
     def _validate_roster_counts(self, info: ValidationInfo) -> "Fleet":
@@ -107,7 +109,7 @@ class Fleet(BaseModel):
         Attributes:
             info:               Context from the `FleetSettings` instance.
         """
-        unknown = [k for k in self.counts if k not in self.roster]
+        unknown = [k for k in self.counts if k not in self.roster.roster]
         if unknown:
             raise ValueError(f"'counts' references unknown ship "
                              f"type: {unknown}")
@@ -136,7 +138,10 @@ class Fleet(BaseModel):
 
     @classmethod
     def create(cls, *, settings, **fleet_kwargs) -> "Fleet":
-        """Construct and validate a Fleet against FleetSettings."""
+        """Construct and validate a Fleet against FleetSettings.
 
-        return cls.model_validate(fleet_kwargs,
-                                  context={"fleet_settings": settings})
+        The returned fleet is the shared instance interned in `REGISTRY`.
+        """
+
+        return REGISTRY.intern(cls.model_validate(
+            fleet_kwargs, context={"fleet_settings": settings}))
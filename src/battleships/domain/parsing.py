@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Parse board coordinates written as tuple strings or in A1 notation.
+
+Two notations are accepted:
+
+* Tuple strings, as stored in ``player.yml``: ``((0,0), (0, 1), (0, 2))``.
+  Integers are read in pairs as ``(row, col)``.
+* A1 notation, for human-facing input: ``A1 B2, c3``. Letters give the row
+  (``A`` is row 0, ``Z`` row 25, ``AA`` row 26, ...) and the number gives the
+  1-based column.
+
+Parsing never uses `eval` or regular expressions. A string is tokenised in C
+by translating every separator to a space and splitting, so the per-character
+work happens inside `str.translate`. Tuple tokens are converted in bulk by
+NumPy, and A1 tokens go through a memoised lookup since the same short forms
+recur constantly. Whole lists of strings, or whole files, are parsed in one
+call and returned as NumPy arrays of ``(row, col)`` pairs or flat cell
+indices (``row * width + col``).
+
+Attributes:
+    A1_CACHE_SIZE (int): Distinct A1 tokens memoised by `parse_a1`.
+
+Examples:
+    Both notations give the same cells::
+
+        >>> parse_cells('((0, 0), (1, 2))', width=10, height=10)
+        array([ 0, 12])
+        >>> parse_cells('A1 B3', width=10, height=10)
+        array([ 0, 12])
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/domain/parsing.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from functools import lru_cache
+from pathlib import Path
+from string import ascii_letters
+from typing import Iterable
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+
+# Module-level constants
+A1_CACHE_SIZE: int = 4096
+
+__all__ = ['parse_a1', 'to_a1', 'parse_coords', 'parse_cells',
+           'parse_batch', 'parse_file', 'A1_CACHE_SIZE']
+
+# Only brackets, commas, semicolons and whitespace separate tokens. Any other
+# character stays in its token, which then fails to parse, so input such as
+# '(1.5, 2.0)' is rejected rather than read as the cells (1, 5) and (2, 0).
+_SEPARATORS = str.maketrans(dict.fromkeys('()[],;', ' '))
+
+
+def _tokens(text: str) -> list[str]:
+    return text.translate(_SEPARATORS).split()
+
+
+@lru_cache(maxsize=A1_CACHE_SIZE)
+def parse_a1(token: str) -> tuple[int, int]:
+    """Return the ``(row, col)`` of one A1 token such as ``'B7'``."""
+    split = len(token) - len(token.lstrip(ascii_letters))
+    letters, number = token[:split], token[split:]
+    if not letters or not number.isdigit() or number[0] == '0':
+        raise ValueError(f"'{token}' is not in A1 notation.")
+
+    row = 0
+    for letter in letters.upper():
+        row = row * 26 + ord(letter) - 64
+    return row - 1, int(number) - 1
+
+
+def to_a1(row: int, col: int) -> str:
+    """Return the A1 token of ``(row, col)``; the inverse of `parse_a1`."""
+    letters = ''
+    row += 1
+    while row:
+        row, rem = divmod(row - 1, 26)
+        letters = chr(65 + rem) + letters
+    return f"{letters}{col + 1}"
+
+
+def _pairs(tokens: list[str], source: str) -> np.ndarray:
+    """Convert the tokens of one or more strings into ``(row, col)`` rows."""
+    if not tokens:
+        return np.empty((0, 2), dtype=np.int64)
+
+    if tokens[0][0] in ascii_letters:
+        try:
+            return np.array([parse_a1(t) for t in tokens], dtype=np.int64)
+        except ValueError as exc:
+            raise ValueError(f"{exc} Mixed notations in {source!r}?") \
+                from None
+
+    try:
+        values = np.array(tokens, dtype=np.int64)
+    except ValueError:
+        raise ValueError(f"Could not parse coordinates from {source!r}.") \
+            from None
+    if values.size % 2:
+        raise ValueError(f"Odd number of integers in {source!r}.")
+    return values.reshape(-1, 2)
+
+
+def _flatten(pairs: np.ndarray, width: int, height: int) -> np.ndarray:
+    rows, cols = pairs[:, 0], pairs[:, 1]
+    outside = (rows < 0) | (rows >= height) | (cols < 0) | (cols >= width)
+    if outside.any():
+        bad = pairs[np.flatnonzero(outside)[0]].tolist()
+        raise ValueError(f"Coordinate {tuple(bad)} lies outside the "
+                         f"{height}x{width} board.")
+    return rows * width + cols
+
+
+def parse_coords(text: str) -> np.ndarray:
+    """Parse one string into an ``(n, 2)`` array of ``(row, col)``."""
+    return _pairs(_tokens(text), text)
+
+
+def parse_cells(text: str, width: int, height: int) -> np.ndarray:
+    """Parse one string into flat cell indices, checking board bounds."""
+    return _flatten(parse_coords(text), width, height)
+
+
+def parse_batch(texts: Iterable[str], width: int, height: int
+                ) -> tuple[np.ndarray, np.ndarray]:
+    """Parse many strings in one call.
+
+    Each string may use either notation, but not both.
+
+    Returns:
+        ``(cells, offsets)``: the flat cell indices of every string,
+        concatenated, and offsets such that the cells of string ``i`` are
+        ``cells[offsets[i]:offsets[i + 1]]``.
+    """
+    tuple_tokens: list[str] = []
+    a1_cells: list[tuple[int, int]] = []
+    order: list[tuple[bool, int, int]] = []
+
+    for text in texts:
+        tokens = _tokens(text)
+        if tokens and tokens[0][0] in ascii_letters:
+            start = len(a1_cells)
+            try:
+                a1_cells.extend(map(parse_a1, tokens))
+            except ValueError as exc:
+                raise ValueError(f"{exc} Mixed notations in {text!r}?") \
+                    from None
+            order.append((True, start, len(tokens)))
+        else:
+            if len(tokens) % 2:
+                raise ValueError(f"Odd number of integers in {text!r}.")
+            order.append((False, len(tuple_tokens) // 2, len(tokens) // 2))
+            tuple_tokens.extend(tokens)
+
+    try:
+        numeric = np.array(tuple_tokens, dtype=np.int64).reshape(-1, 2)
+    except ValueError:
+        raise ValueError("Could not parse tuple coordinates; a string mixes "
+                         "notations or holds non-integer tokens.") from None
+
+    lengths = np.fromiter((n for _, _, n in order), dtype=np.int64,
+                          count=len(order))
+    offsets = np.zeros(len(order) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    if not a1_cells:
+        pairs = numeric
+    elif not len(numeric):
+        pairs = np.array(a1_cells, dtype=np.int64)
+    else:
+        lettered = np.array(a1_cells, dtype=np.int64)
+        pairs = np.concatenate([lettered[start:start + n] if is_a1
+                                else numeric[start:start + n]
+                                for is_a1, start, n in order])
+
+    return _flatten(pairs.reshape(-1, 2), width, height), offsets
+
+
+def parse_file(path: Path, width: int, height: int
+               ) -> tuple[np.ndarray, np.ndarray]:
+    """Parse a file holding one coordinate string per non-blank line.
+
+    Returns:
+        ``(cells, offsets)`` as for `parse_batch`.
+    """
+    with open(path) as lines:
+        return parse_batch((line for line in lines if line.strip()),
+                           width, height)
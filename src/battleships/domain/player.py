@@ -1,23 +1,30 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-"""(One liner introducing this file player.py)
+"""Players: the configured `Player` model and the runtime `PlayerTable`.
 
-(
-Leading paragraphs explaining file in more detail.
-)
+`Player` describes one player as configured, with their board and fleet.
+During play, per-player state changes on every turn, and thousands of live
+players each held as a model cost kilobytes of object overhead. `PlayerTable`
+keeps the state of all live players instead in column arrays: shots used,
+current hit streak, ships afloat, board slot and a bitset of cells guessed.
+Whole-population updates are single vectorised operations, and any one
+player is still available as a `PlayerView` proxy holding only the table and
+its row.
 
-Attributes:
-    (Here, place any module-scope constants users will import.)
+Board slots are the ``(slot, generation)`` pairs of
+`src.battleships.engine.pool.SlotRef`.
 
-(
-Trailing paragraphs summarising final details.
-)
+Examples:
+    Record one turn of many games at once::
+
+        >>> table = PlayerTable(BoardSettings(), capacity=10_000)
+        >>> for name in names:
+        ...     table.add(name, ships_afloat=5)
+        >>> table.record_shots(shooters, cells, hits)
+        >>> table[0].shots_used
+        1
 
-Todo:
-    * (Optional section for module-wide tasks).
-    * (Use format: 'YYMMDD/task_identifier - one-liner task description'
-    
 References:
     Style guide: `Google Python Style Guide`_
 
@@ -42,17 +49,21 @@ Notes:
 from __future__ import annotations
 
 # Standard library imports
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Iterator, Optional
 
 # Third-party imports
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
 
 # Local application imports
 from src.battleships.domain.fleet import Fleet
 from src.battleships.domain.board import Board
+from src.battleships.settings import BoardSettings
 
 # Module-level constants
+_WORD_BITS = 64
 
-__all__ = ['Player']
+__all__ = ['Player', 'PlayerTable', 'PlayerView']
 
 
 class Player(BaseModel):
@@ -63,8 +74,198 @@ class Player(BaseModel):
     board: Board
     fleet: Fleet
 
-    shots: list[]
+    shots: list[tuple[int, int]] = Field(default_factory=list)
 
     guesses: list[tuple[int, int]] = Field(default_factory=list)
     active_ships: list[str] = Field(default_factory=list)
     ship_positions: dict[str, tuple[int, int]] = Field(default_factory=dict)
+
+
+class PlayerTable:
+    """Column store of the runtime state of live players.
+
+    Row ``i`` of every column belongs to the ``i``-th player added. Columns
+    grow by doubling when ``capacity`` is exceeded, so proxies and indices
+    stay valid for the lifetime of the table.
+
+    Attributes:
+        names:          Name of each player.
+
+        shots_used:     Shots fired by each player.
+
+        streak:         Consecutive hits of each player's current streak.
+
+        ships_afloat:   Ships each player still has afloat.
+
+        slot:           Board slot of each player, or -1 if none.
+
+        generation:     Generation of each player's board slot.
+
+        guesses:        ``(players, words)`` bitset of cells each player has
+                        shot, cell ``c`` at bit ``c % 64`` of word
+                        ``c // 64``.
+    """
+
+    def __init__(self, board: BoardSettings, capacity: int = 64):
+        self.board = board
+        self.cells = board.height * board.width
+        self.words = -(-self.cells // _WORD_BITS)
+        self.names: list[str] = []
+
+        self.shots_used = np.zeros(capacity, dtype=np.int32)
+        self.streak = np.zeros(capacity, dtype=np.int32)
+        self.ships_afloat = np.zeros(capacity, dtype=np.int16)
+        self.slot = np.full(capacity, -1, dtype=np.int32)
+        self.generation = np.zeros(capacity, dtype=np.int64)
+        self.guesses = np.zeros((capacity, self.words), dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> "PlayerView":
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Player {index} is not in the table.")
+        return PlayerView(self, index % len(self))
+
+    def __iter__(self) -> Iterator["PlayerView"]:
+        return (PlayerView(self, index) for index in range(len(self)))
+
+    @property
+    def capacity(self) -> int:
+        return len(self.shots_used)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays."""
+        return sum(column.nbytes for column in (
+            self.shots_used, self.streak, self.ships_afloat, self.slot,
+            self.generation, self.guesses))
+
+    @property
+    def alive(self) -> np.ndarray:
+        """Mask of players with ships afloat."""
+        return self.ships_afloat[:len(self)] > 0
+
+    @property
+    def n_alive(self) -> int:
+        return int(np.count_nonzero(self.alive))
+
+    def add(self, name: str, ships_afloat: int,
+            slot: Optional[tuple[int, int]] = None) -> int:
+        """Append a player and return their row index."""
+        index = len(self)
+        if index == self.capacity:
+            self._grow(2 * self.capacity)
+        self.names.append(name)
+        self.ships_afloat[index] = ships_afloat
+        if slot is not None:
+            self.slot[index], self.generation[index] = slot
+        return index
+
+    def _grow(self, capacity: int) -> None:
+        for attr, fill in (('shots_used', 0), ('streak', 0),
+                           ('ships_afloat', 0), ('slot', -1),
+                           ('generation', 0), ('guesses', 0)):
+            old = getattr(self, attr)
+            new = np.full((capacity,) + old.shape[1:], fill, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, attr, new)
+
+    def record_shots(self, players: np.ndarray, cells: np.ndarray,
+                     hits: np.ndarray) -> None:
+        """Record one shot by each of ``players``.
+
+        Arguments:
+            players: Row index of each shooter; no row may repeat.
+            cells: Flat cell index of each shot.
+            hits: Whether each shot hit a ship.
+        """
+        players = np.asarray(players, dtype=np.intp)
+        cells = np.asarray(cells, dtype=np.uint64)
+        hits = np.asarray(hits, dtype=bool)
+
+        self.shots_used[players] += 1
+        self.streak[players] = np.where(hits, self.streak[players] + 1, 0)
+        words = (cells // _WORD_BITS).astype(np.intp)
+        self.guesses[players, words] |= (np.uint64(1)
+                                         << (cells % _WORD_BITS))
+
+    def sink(self, players: np.ndarray) -> None:
+        """Take one ship afloat from each of ``players``, repeats allowed."""
+        np.subtract.at(self.ships_afloat, np.asarray(players, dtype=np.intp),
+                       1)
+
+    def has_guessed(self, players: np.ndarray, cells: np.ndarray
+                    ) -> np.ndarray:
+        """Whether each of ``players`` has already shot the matching cell."""
+        players = np.asarray(players, dtype=np.intp)
+        cells = np.asarray(cells, dtype=np.uint64)
+        words = (cells // _WORD_BITS).astype(np.intp)
+        bits = self.guesses[players, words] >> (cells % _WORD_BITS)
+        return (bits & np.uint64(1)).astype(bool)
+
+    def guessed_cells(self, index: int) -> np.ndarray:
+        """Flat indices of the cells player ``index`` has shot, ascending."""
+        bits = np.unpackbits(self.guesses[index].astype('<u8').view(np.uint8),
+                             bitorder='little')
+        return np.flatnonzero(bits[:self.cells])
+
+    def out_of_shots(self, shots_limit: int) -> np.ndarray:
+        """Mask of players who have used all ``shots_limit`` shots."""
+        return self.shots_used[:len(self)] >= shots_limit
+
+
+class PlayerView:
+    """Proxy on one row of a `PlayerTable`; holds no state of its own."""
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table: PlayerTable, index: int):
+        self.table = table
+        self.index = index
+
+    def __repr__(self) -> str:
+        return (f"PlayerView({self.name!r}, shots_used={self.shots_used}, "
+                f"streak={self.streak}, ships_afloat={self.ships_afloat})")
+
+    @property
+    def name(self) -> str:
+        return self.table.names[self.index]
+
+    @property
+    def shots_used(self) -> int:
+        return int(self.table.shots_used[self.index])
+
+    @property
+    def streak(self) -> int:
+        return int(self.table.streak[self.index])
+
+    @property
+    def ships_afloat(self) -> int:
+        return int(self.table.ships_afloat[self.index])
+
+    @property
+    def is_alive(self) -> bool:
+        return self.ships_afloat > 0
+
+    @property
+    def slot(self) -> Optional[tuple[int, int]]:
+        """``(slot, generation)`` of the player's board, if they have one."""
+        slot = int(self.table.slot[self.index])
+        if slot < 0:
+            return None
+        return slot, int(self.table.generation[self.index])
+
+    @property
+    def guesses(self) -> list[tuple[int, int]]:
+        """``(row, col)`` of every cell shot, in row-major order."""
+        width = self.table.board.width
+        return [divmod(cell, width)
+                for cell in self.table.guessed_cells(self.index).tolist()]
+
+    def has_guessed(self, row: int, col: int) -> bool:
+        cell = row * self.table.board.width + col
+        return bool(self.table.has_guessed([self.index], [cell])[0])
+
+    def record_shot(self, row: int, col: int, hit: bool) -> None:
+        cell = row * self.table.board.width + col
+        self.table.record_shots([self.index], [cell], [hit])
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Interning registry for frozen ship, roster and fleet specs.
+
+`ShipSpec`, `Roster` and `Fleet` are frozen pydantic models, so two equal
+instances are interchangeable. A host running many sessions would otherwise
+keep one copy of every ``rosters.yml`` entry per game. `SpecRegistry` maps
+each distinct spec to one canonical shared instance, gives it a stable 64-bit
+digest (identical across processes, unlike the salted built-in `hash`), and
+numbers every distinct ``(name, ShipSpec)`` pair with a small integer ship-type
+id. Per-game state such as `Board` stores those ids instead of names and
+nested models.
+
+Attributes:
+    REGISTRY (SpecRegistry): Process-wide registry used by `Board`, `Roster`
+        and `Fleet`.
+
+Examples:
+    Equal specs collapse to one instance::
+
+        >>> a = REGISTRY.intern(ShipSpec(size=3))
+        >>> b = REGISTRY.intern(ShipSpec(size=3))
+        >>> a is b
+        True
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/domain/registry.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from hashlib import blake2b
+from threading import Lock
+from typing import Any, Hashable, NamedTuple, TypeVar
+
+# Third-party imports
+from pydantic import BaseModel
+
+# Local application imports
+from src.battleships.domain.ship import ShipSpec
+
+# Module-level constants
+M = TypeVar('M', bound=BaseModel)
+
+__all__ = ['SpecRegistry', 'ShipType', 'REGISTRY']
+
+
+class ShipType(NamedTuple):
+    """A named ship spec, identified in per-game state by its type id."""
+    name: str
+    spec: ShipSpec
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert dumped model data into a canonical, hashable form."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class SpecRegistry:
+    """Canonical instances, stable digests and ship-type ids.
+
+    Interning is keyed on the model class and its dumped field values, so it
+    applies to any frozen pydantic model. Nested `ShipSpec` and `Roster`
+    values are interned first, so equal rosters inside different fleets
+    share their ship specs too.
+
+    Attributes:
+        ship_types:     Ship type of each id, indexed by id.
+
+        cloaked:        ``ShipSpec.is_cloaked`` of each id, indexed by id.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._canonical: dict[Hashable, BaseModel] = {}
+        self._digests: dict[int, int] = {}
+        self._type_ids: dict[tuple[str, ShipSpec], int] = {}
+        self.ship_types: list[ShipType] = []
+        self.cloaked: list[bool] = []
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def intern(self, model: M) -> M:
+        """Return the canonical instance equal to ``model``."""
+        if id(model) in self._digests:
+            return model
+
+        cls = type(model)
+        fields = _freeze(model.model_dump())
+        # Keyed by the class itself, so equal fields of distinct classes
+        # sharing a name stay apart; only the digest goes by name.
+        key = (cls, fields)
+        canonical = self._canonical.get(key)
+        if canonical is not None:
+            return canonical
+
+        model = self._share_children(model)
+        with self._lock:
+            canonical = self._canonical.setdefault(key, model)
+            if canonical is model:
+                name = f"{cls.__module__}.{cls.__qualname__}"
+                digest = blake2b(repr((name, fields)).encode(),
+                                 digest_size=8).digest()
+                self._digests[id(model)] = int.from_bytes(digest, 'little')
+        return canonical
+
+    def digest(self, model: BaseModel) -> int:
+        """Return the stable 64-bit digest of ``model``, interning it."""
+        return self._digests[id(self.intern(model))]
+
+    def ship_type_id(self, name: str, spec: ShipSpec) -> int:
+        """Return the small integer id of the ship type ``(name, spec)``."""
+        spec = self.intern(spec)
+        key = (name, spec)
+        type_id = self._type_ids.get(key)
+        if type_id is not None:
+            return type_id
+
+        with self._lock:
+            type_id = self._type_ids.setdefault(key, len(self.ship_types))
+            if type_id == len(self.ship_types):
+                self.ship_types.append(ShipType(name, spec))
+                self.cloaked.append(spec.is_cloaked)
+        return type_id
+
+    def ship_type(self, type_id: int) -> ShipType:
+        return self.ship_types[type_id]
+
+    def _share_children(self, model: M) -> M:
+        """Swap nested specs and rosters for their canonical instances."""
+        update = {}
+        for name, value in model:
+            if isinstance(value, BaseModel):
+                update[name] = self.intern(value)
+            elif isinstance(value, dict) and value and all(
+                    isinstance(v, BaseModel) for v in value.values()):
+                update[name] = {k: self.intern(v) for k, v in value.items()}
+
+        return model.model_copy(update=update) if update else model
+
+
+REGISTRY = SpecRegistry()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Turn scheduling and targeting for N-player free-for-all games.
+
+`BoardSettings.max_players` permits more than two players. `TurnScheduler`
+decides whose turn it is, honouring `PlayerSettings.hot_streak` turn
+retention and the per-player `PlayerSettings.shots_limit`, and drops players
+from the rotation once they are eliminated or out of shots. `Arena` couples
+a scheduler to the players' boards and resolves each shot against its target
+through a seat index.
+
+Turn order is kept as two rings of successor/predecessor pointers (one over
+players who may still shoot, one over players who still have ships), so
+advancing a turn, removing a player and finding the next target are all O(1)
+and never rebuild a list.
+
+Examples:
+    Three players, each aiming at the next live player::
+
+        >>> arena = Arena(boards, settings=GameSettings())
+        >>> shooter = arena.scheduler.current
+        >>> arena.fire(arena.scheduler.next_target(shooter), (0, 0))
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/domain/turns.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from typing import Hashable, Optional, Sequence
+
+# Third-party imports
+
+# Local application imports
+from src.battleships.domain.board import Board, HIT, SUNK
+from src.battleships.settings import GameSettings, PlayerSettings
+
+# Module-level constants
+
+__all__ = ['TurnScheduler', 'Arena']
+
+
+class TurnScheduler:
+    """Whose turn it is in an N-player game.
+
+    Players are identified by seat number ``0 .. n_players - 1``.
+
+    Attributes:
+        current:        Seat of the player whose turn it is.
+
+        shots_used:     Shots fired so far, per seat.
+
+        streak:         Consecutive hits, per seat. Reset by a miss.
+    """
+
+    def __init__(self, n_players: int, settings: PlayerSettings):
+        """Seat ``n_players`` players, with seat ``0`` to shoot first."""
+        if n_players < 2:
+            raise ValueError(f"At least two players are required, got "
+                             f"{n_players}.")
+
+        self.settings = settings
+        self.current = 0
+        self.shots_used = [0] * n_players
+        self.streak = [0] * n_players
+
+        # Shooting ring: players who are alive and have shots remaining.
+        self._next = [(i + 1) % n_players for i in range(n_players)]
+        self._prev = [(i - 1) % n_players for i in range(n_players)]
+        self._shooting = [True] * n_players
+        self._n_shooting = n_players
+
+        # Target ring: players who still have ships afloat.
+        self._next_alive = list(self._next)
+        self._prev_alive = list(self._prev)
+        self._alive = [True] * n_players
+        self._n_alive = n_players
+
+    @property
+    def n_players(self) -> int:
+        return len(self.shots_used)
+
+    @property
+    def n_alive(self) -> int:
+        """Number of players with ships afloat."""
+        return self._n_alive
+
+    @property
+    def is_over(self) -> bool:
+        """``True`` once one player remains or nobody can shoot."""
+        return self._n_alive <= 1 or self._n_shooting == 0
+
+    def is_alive(self, seat: int) -> bool:
+        return self._alive[seat]
+
+    def next_target(self, seat: int) -> int:
+        """Return the next live player after ``seat`` in the target ring."""
+        target = self._next_alive[seat]
+        if target == seat:
+            raise RuntimeError(f"Player {seat} has no opponents left.")
+        return target
+
+    def record_shot(self, hit: bool) -> int:
+        """Record a shot by the current player and return the next shooter.
+
+        A hit extends the shooter's streak; once the streak reaches
+        ``hot_streak`` the shooter keeps the turn until they miss. Reaching
+        ``shots_limit`` removes the shooter from the rotation.
+        """
+        seat = self.current
+        self.shots_used[seat] += 1
+
+        if hit:
+            self.streak[seat] += 1
+        else:
+            self.streak[seat] = 0
+
+        keep_turn = hit and self.streak[seat] >= self.settings.hot_streak
+
+        if self.shots_used[seat] >= self.settings.shots_limit:
+            self._stop_shooting(seat)
+        elif not keep_turn:
+            self.current = self._next[seat]
+
+        return self.current
+
+    def eliminate(self, seat: int) -> None:
+        """Remove ``seat``, whose last ship has sunk, from both rings."""
+        if not self._alive[seat]:
+            return
+
+        self._alive[seat] = False
+        self._n_alive -= 1
+        nxt, prev = self._next_alive[seat], self._prev_alive[seat]
+        self._next_alive[prev] = nxt
+        self._prev_alive[nxt] = prev
+
+        if self._shooting[seat]:
+            self._stop_shooting(seat)
+
+    def _stop_shooting(self, seat: int) -> None:
+        """Unlink ``seat`` from the shooting ring, passing the turn on."""
+        self._shooting[seat] = False
+        self._n_shooting -= 1
+        nxt, prev = self._next[seat], self._prev[seat]
+        self._next[prev] = nxt
+        self._prev[nxt] = prev
+
+        if self.current == seat:
+            self.current = nxt
+
+
+class Arena:
+    """Boards of every player in a free-for-all, indexed by seat.
+
+    Attributes:
+        boards:         Board of each seat.
+
+        seats:          Seat of each player name.
+
+        scheduler:      Turn order of this game.
+    """
+
+    def __init__(self, boards: Sequence[Board], *, settings: GameSettings,
+                 names: Optional[Sequence[Hashable]] = None):
+        """Seat one player per board, in order.
+
+        Arguments:
+            boards: Board of each player, with fleets already placed.
+            settings: Game settings; bounds the number of players.
+            names: Optional player names, used to look up seats.
+        """
+        if len(boards) > settings.Board.max_players:
+            raise ValueError(f"{len(boards)} players exceeds the maximum "
+                             f"[{settings.Board.max_players}] permitted.")
+
+        names = range(len(boards)) if names is None else names
+        if len(names) != len(boards):
+            raise ValueError("Exactly one name is required per board.")
+
+        self.boards = list(boards)
+        self.seats = {name: seat for seat, name in enumerate(names)}
+        self.scheduler = TurnScheduler(len(boards), settings.Player)
+
+    def seat_of(self, name: Hashable) -> int:
+        return self.seats[name]
+
+    def fire(self, target: int, coord: tuple[int, int]) -> int:
+        """Fire the current player's shot at seat ``target``.
+
+        Returns:
+            Resulting cell state (``MISS``, ``HIT`` or ``SUNK``).
+        """
+        scheduler = self.scheduler
+        if scheduler.is_over:
+            raise RuntimeError("The game is over.")
+        if target == scheduler.current or not scheduler.is_alive(target):
+            raise ValueError(f"Player {scheduler.current} cannot target "
+                             f"player {target}.")
+
+        board = self.boards[target]
+        result = board.receive_shot(coord)
+        scheduler.record_shot(result >= HIT)
+
+        if result == SUNK and not board.ships_afloat:
+            scheduler.eliminate(target)
+
+        return result
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Per-viewer projections of a `Board` that honour cloaked ships.
+
+A `Board` is seen differently by its owner and by everybody else: opponents
+and spectators must not see unhit ships, nor any hit on a ship whose
+`ShipSpec.is_cloaked` flag is set; such hits are shown to them as misses.
+`BoardViews` keeps one projected grid per distinct projection and serves
+every viewer a read-only, zero-copy NumPy view of it.
+
+Projections are maintained incrementally. `Board` notifies its listeners with
+the cells touched by each change, so a shot rewrites only those cells of each
+projection rather than recomputing the whole grid per request.
+
+Examples:
+    Serve a masked view to a spectator::
+
+        >>> board = Board(length=5, width=5)
+        >>> views = BoardViews(board, owner='alice')
+        >>> views.add_viewer('bob')
+        >>> grid = views.view('bob')
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/domain/views.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from typing import Hashable, Optional
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.domain.board import Board, EMPTY, SHIP, MISS, HIT
+from src.battleships.domain.registry import REGISTRY
+
+# Module-level constants
+FULL: int = 0
+PUBLIC: int = 1
+
+__all__ = ['BoardViews', 'FULL', 'PUBLIC']
+
+
+class BoardViews:
+    """Incrementally maintained viewer projections of one `Board`.
+
+    Two projections exist. ``FULL`` is the board's own grid, exposed
+    read-only, and is served to the owner and any viewer added with
+    ``reveal=True``. ``PUBLIC`` hides unhit ships and shows every hit or
+    sunk cell of a cloaked ship as ``MISS``. Viewers sharing a projection share one buffer, so
+    adding spectators costs nothing per shot.
+
+    Attributes:
+        board:          The board being projected.
+
+        version:        Incremented after every change to the board. Callers
+                        caching derived data can compare versions rather
+                        than arrays.
+    """
+
+    def __init__(self, board: Board, owner: Optional[Hashable] = None):
+        """Attach to ``board`` and optionally register its owner."""
+        self.board = board
+        self.version = 0
+
+        self._viewers: dict[Hashable, int] = {}
+        self._cloaked = np.zeros(board.grid.shape, dtype=bool)
+        self._public = np.empty_like(board.grid)
+        self._served = {FULL: self._readonly(board.grid),
+                        PUBLIC: self._readonly(self._public)}
+
+        self._rebuild()
+        board.subscribe(self._on_change)
+
+        if owner is not None:
+            self.add_viewer(owner, reveal=True)
+
+    def add_viewer(self, viewer: Hashable, *, reveal: bool = False) -> None:
+        """Register ``viewer``; ``reveal`` grants the full projection."""
+        self._viewers[viewer] = FULL if reveal else PUBLIC
+
+    def remove_viewer(self, viewer: Hashable) -> None:
+        """Stop serving ``viewer``."""
+        del self._viewers[viewer]
+
+    def view(self, viewer: Hashable) -> np.ndarray:
+        """Return the read-only projected grid for ``viewer``.
+
+        The returned array shares memory with the projection, so it reflects
+        later shots without being requested again.
+        """
+        try:
+            projection = self._viewers[viewer]
+        except KeyError:
+            raise KeyError(f"Viewer '{viewer}' is not registered.") from None
+
+        return self._served[projection]
+
+    def close(self) -> None:
+        """Detach from the board."""
+        self.board.unsubscribe(self._on_change)
+
+    def _rebuild(self) -> None:
+        """Recompute every projection from scratch."""
+        board = self.board
+        cloaked = [REGISTRY.cloaked[type_id] for type_id in board.ships]
+        if cloaked:
+            lookup = np.append(np.asarray(cloaked, dtype=bool), False)
+            # Unoccupied cells hold -1, which indexes the trailing ``False``.
+            self._cloaked[...] = lookup[board.occupants]
+        else:
+            self._cloaked.fill(False)
+
+        self._project(None)
+
+    def _project(self, cells: Optional[np.ndarray]) -> None:
+        """Write the public projection of ``cells`` (all cells if ``None``)."""
+        if cells is None:
+            state, cloaked = self.board.grid, self._cloaked
+        else:
+            state = self.board.grid.flat[cells]
+            cloaked = self._cloaked.flat[cells]
+
+        # A shot on a cloaked ship reads as a miss: showing it as EMPTY would
+        # single it out among the viewer's own shots.
+        projected = np.where(state == SHIP, EMPTY, state)
+        projected[cloaked & (state >= HIT)] = MISS
+
+        if cells is None:
+            self._public[...] = projected
+        else:
+            self._public.flat[cells] = projected
+
+    def _on_change(self, board: Board, cells: Optional[np.ndarray]) -> None:
+        """Board listener; ``cells`` are the flat indices that changed."""
+        self.version += 1
+
+        if cells is None:
+            self._rebuild()
+            return
+
+        # Cloaking is fixed once a ship is placed, so refreshing it for
+        # occupied cells is idempotent on later shots.
+        occupants = board.occupants.flat[cells]
+        if (occupants >= 0).any():
+            self._cloaked.flat[cells] = [
+                REGISTRY.cloaked[board.ships[i]] if i >= 0 else False
+                for i in occupants]
+
+        self._project(cells)
+
+    @staticmethod
+    def _readonly(array: np.ndarray) -> np.ndarray:
+        view = array.view()
+        view.flags.writeable = False
+        return view
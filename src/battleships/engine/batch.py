@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Batched move evaluation for serving many computer turns per call.
+
+`evaluate_batch` takes the knowledge grids of many games at once, together
+with the ships each opponent still has afloat, and returns one move per game
+from a single vectorised probability-density computation: every legal
+placement of every remaining ship that avoids known misses and sunk cells
+adds weight to the cells it covers, placements through unsunk hits are
+boosted, and the highest-weighted unknown cell is chosen.
+
+`MoveBatcher` sits in front of it on a server. Callers submit one game at a
+time and receive a `Future`; a background thread gathers requests until
+either ``max_batch`` are waiting or the oldest has waited ``max_latency``
+seconds, then evaluates them together.
+
+Attributes:
+    HIT_BONUS (float): Extra weight per unsunk hit covered by a placement.
+
+    INCIDENCE_BYTES (int): Largest dense placement-by-cell matrix cached
+        per ship size. Boards needing more accumulate weights with
+        `numpy.add.reduceat` over cached per-cell placement lists instead.
+        Also bounds the per-game placement gathers of one evaluation
+        step, by evaluating large stacks in slices of games.
+
+Examples:
+    Evaluate a stack of games directly::
+
+        >>> moves = evaluate_batch(knowledge, remaining, settings)
+
+    Or through the micro-batching queue::
+
+        >>> with MoveBatcher(settings) as batcher:
+        ...     move = batcher.submit(grid, ships).result()
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/engine/batch.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from concurrent.futures import Future
+from functools import lru_cache
+import queue
+import threading
+import time
+from typing import Optional, Sequence
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.domain.board import EMPTY, HIT, MISS, SUNK
+from src.battleships.engine.placement import candidate_placements
+from src.battleships.engine.strategies import Strategy, register_strategy
+from src.battleships.settings import (BoardSettings, FleetSettings,
+                                      GameSettings)
+
+# Module-level constants
+HIT_BONUS: float = 20.0
+INCIDENCE_BYTES: int = 1 << 22
+
+__all__ = ['evaluate_batch', 'remaining_vector', 'MoveBatcher',
+           'DensityStrategy', 'HIT_BONUS', 'INCIDENCE_BYTES']
+
+
+def remaining_vector(sizes: Sequence[int], max_size: int) -> np.ndarray:
+    """Count ships afloat by size: entry ``s`` is the number of size ``s``.
+
+    Arguments:
+        sizes: Size of every ship still afloat.
+        max_size: Largest ship size the vector must cover.
+    """
+    return np.bincount(np.asarray(sizes, dtype=np.intp),
+                       minlength=max_size + 1)[:max_size + 1]
+
+
+@lru_cache(maxsize=None)
+def _coverage(board: BoardSettings, fleet: FleetSettings, size: int
+              ) -> tuple[np.ndarray, Optional[np.ndarray], tuple]:
+    """Placements of ``size`` and how their weights reach the cells.
+
+    Returns:
+        ``(placements, incidence, groups)``. ``incidence`` is the dense
+        ``(placement, cell)`` 0/1 matrix if it fits in `INCIDENCE_BYTES`,
+        for a BLAS product, else ``None``. ``groups`` is ``(covering,
+        starts, covered)``, used otherwise: the index of each placement once
+        per cell it covers, grouped by cell; where each group starts in
+        ``covering``; and the cell of each group. Its memory is linear in
+        the placements.
+    """
+    placements = candidate_placements(board, fleet, size)
+    cells = board.height * board.width
+    if len(placements) * cells * 4 <= INCIDENCE_BYTES:
+        incidence = np.zeros((len(placements), cells), dtype=np.float32)
+        np.put_along_axis(incidence, placements, 1.0, axis=1)
+        incidence.flags.writeable = False
+        return placements, incidence, ()
+
+    flat = placements.ravel()
+    order = np.argsort(flat, kind='stable')
+    covered, starts = np.unique(flat[order], return_index=True)
+    return placements, None, (order // size, starts, covered)
+
+
+def evaluate_batch(knowledge: np.ndarray, remaining: np.ndarray,
+                   settings: GameSettings,
+                   rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Choose one move for each of a stack of games.
+
+    Arguments:
+        knowledge: ``(games, height, width)`` or ``(games, cells)`` cell
+            states known to each shooter (``EMPTY`` where unknown).
+        remaining: ``(games, max_size + 1)`` ships afloat by size, as built
+            by `remaining_vector`.
+        settings: Settings shared by every game in the stack.
+        rng: If given, breaks ties between equally weighted cells at random;
+            otherwise the lowest cell index wins.
+
+    Returns:
+        Flat cell index of the chosen move of each game.
+    """
+    games = knowledge.shape[0]
+    known = knowledge.reshape(games, -1)
+    cells = known.shape[1]
+    remaining = np.asarray(remaining, dtype=np.float32)
+
+    blocked = (known == MISS) | (known == SUNK)
+    hits = (known == HIT).astype(np.float32)
+    density = np.zeros(known.shape, dtype=np.float32)
+
+    for size in np.flatnonzero(remaining.any(axis=0)):
+        placements, incidence, groups = _coverage(
+            settings.Board, settings.Fleet, int(size))
+        if not len(placements):
+            continue
+        # Gathers hold one value per (game, placement, cell); taking games
+        # in slices keeps each within INCIDENCE_BYTES.
+        step = max(INCIDENCE_BYTES // (placements.size * 4), 1)
+        for lo in range(0, games, step):
+            rows = slice(lo, lo + step)
+            open_ = ~blocked[rows][:, placements].any(axis=2)
+            weight = open_ * remaining[rows, size, None]
+            weight *= 1.0 + HIT_BONUS * hits[rows][:, placements].sum(axis=2)
+            # Each cell gains the weights of the placements covering it.
+            if incidence is not None:
+                density[rows] += weight @ incidence
+            else:
+                covering, starts, covered = groups
+                density[rows, covered] += np.add.reduceat(
+                    weight[:, covering], starts, axis=1)
+
+    if rng is not None:
+        density += rng.random(density.shape, dtype=np.float32) * 1e-3
+    density[known != EMPTY] = -1.0
+    return density.argmax(axis=1)
+
+
+@register_strategy
+class DensityStrategy(Strategy):
+    """Shoots the cell most likely to hold a ship, per `evaluate_batch`."""
+    name = 'density'
+
+    def __init__(self, board: BoardSettings, sizes: Sequence[int],
+                 rng: np.random.Generator,
+                 fleet: Optional[FleetSettings] = None):
+        super().__init__(board, sizes, rng, fleet)
+        self.settings = GameSettings(Board=board, Fleet=self.fleet)
+        self._max_size = max(sizes)
+
+    def next_shot(self) -> int:
+        remaining = remaining_vector(self.remaining, self._max_size)
+        return int(evaluate_batch(self.knowledge[None], remaining[None],
+                                  self.settings, self.rng)[0])
+
+
+class MoveBatcher:
+    """Micro-batching queue in front of `evaluate_batch`.
+
+    Attributes:
+        max_batch:      Requests evaluated together at most.
+
+        max_latency:    Seconds the oldest waiting request may wait for the
+                        batch to fill.
+
+        batches:        Number of batches dispatched so far.
+    """
+
+    def __init__(self, settings: GameSettings, max_batch: int = 256,
+                 max_latency: float = 0.002, max_size: Optional[int] = None):
+        """Start the dispatch thread.
+
+        Arguments:
+            settings: Settings shared by every submitted game.
+            max_batch: Largest batch to evaluate at once.
+            max_latency: Longest wait, in seconds, for a batch to fill.
+            max_size: Largest ship size; the width of ``remaining`` vectors
+                is padded to it so games with different fleets stack.
+        """
+        self.settings = settings
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self.max_size = max_size
+        self.batches = 0
+
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='MoveBatcher')
+        self._thread.start()
+
+    def __enter__(self) -> "MoveBatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def submit(self, knowledge: np.ndarray, remaining: np.ndarray) -> Future:
+        """Queue one game; the future resolves to its flat move index.
+
+        Raises:
+            RuntimeError: The batcher has been closed.
+        """
+        future: Future = Future()
+        item = (np.asarray(knowledge).ravel(), np.asarray(remaining), future)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a closed MoveBatcher.")
+            self._queue.put(item)
+        return future
+
+    def close(self) -> None:
+        """Evaluate anything still queued, then stop the dispatch thread."""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            pending = [item]
+            deadline = time.monotonic() + self.max_latency
+            stop = False
+            while len(pending) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                pending.append(item)
+
+            self._dispatch(pending)
+            if stop:
+                return
+
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None:
+                self._dispatch([item])
+
+    def _dispatch(self, pending: list) -> None:
+        futures = [future for _, _, future in pending]
+        try:
+            width = max(len(r) for _, r, _ in pending)
+            if self.max_size is not None:
+                width = max(width, self.max_size + 1)
+            remaining = np.zeros((len(pending), width), dtype=np.float32)
+            for row, (_, r, _) in enumerate(pending):
+                remaining[row, :len(r)] = r
+            knowledge = np.stack([k for k, _, _ in pending])
+
+            moves = evaluate_batch(knowledge, remaining, self.settings)
+        except Exception as exc:
+            for future in futures:
+                future.set_exception(exc)
+            return
+
+        self.batches += 1
+        for future, move in zip(futures, moves.tolist()):
+            future.set_result(move)
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Proof, or refutation, that a fleet can be placed on a board.
+
+A `Fleet` that passes its own validation (every ship known, no more than
+``max_ships``) may still be impossible to place on the configured board
+under the `FleetSettings` orientation rules, and `random_layout` then burns
+through every restart before giving up. `check_feasibility` settles the
+question up front, in increasingly expensive steps:
+
+1. Every ship size must have at least one legal placement, and the ships'
+   total area must not exceed the board.
+2. When ships may only lie along one axis, placement is exactly bin packing
+   of ship sizes into rows (or columns). A line-capacity bound refutes it
+   quickly, and a memoised search over line loads settles the rest.
+3. Otherwise a first-fit packing, largest ships first, usually finds a
+   layout at once.
+4. Failing that, a depth-first search over placement bitmasks proves or
+   refutes it within ``node_limit`` search nodes. It fills the lowest empty
+   cell with a ship or leaves it empty, and memoises failed ``(occupied
+   cells, ships left)`` states.
+
+Feasible verdicts come with a witness layout. Verdicts are cached per board
+settings, fleet settings and multiset of ship sizes, so every game after the
+first costs a dictionary lookup.
+
+Attributes:
+    NODE_LIMIT (int): Search nodes explored before a verdict is given up
+        as undecided.
+
+Examples:
+    Check a fleet before hosting games with it::
+
+        >>> verdict = check_fleet(fleet, settings)
+        >>> verdict.feasible, verdict.reason
+        (True, 'first-fit packing')
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/engine/feasibility.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from functools import lru_cache
+from typing import NamedTuple, Optional, Sequence
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.domain.fleet import Fleet
+from src.battleships.engine.placement import candidate_placements
+from src.battleships.loaders import fleet_ships
+from src.battleships.settings import BoardSettings, FleetSettings, GameSettings
+
+# Module-level constants
+NODE_LIMIT: int = 200_000
+
+__all__ = ['Feasibility', 'check_feasibility', 'check_fleet',
+           'ensure_feasible', 'NODE_LIMIT']
+
+
+class Feasibility(NamedTuple):
+    """Verdict on whether a fleet fits a board.
+
+    Attributes:
+        feasible:       ``True`` if the ships fit, ``False`` if they provably
+                        do not, ``None`` if the search budget ran out.
+
+        layout:         Witness when feasible: flat array over the board of
+                        the index into ``sizes`` of the ship covering each
+                        cell, or ``-1``, as returned by `random_layout`.
+
+        reason:         How the verdict was reached.
+    """
+    feasible: Optional[bool]
+    layout: Optional[np.ndarray]
+    reason: str
+
+
+class _OutOfBudget(Exception):
+    pass
+
+
+def check_feasibility(sizes: Sequence[int], board: BoardSettings,
+                      fleet: FleetSettings,
+                      node_limit: int = NODE_LIMIT) -> Feasibility:
+    """Decide whether ships of ``sizes`` can all be placed on ``board``.
+
+    Arguments:
+        sizes: Size of every ship, in any order.
+        board: Board the ships must fit on.
+        fleet: Orientation rules the placements obey.
+        node_limit: Search nodes to explore before giving up.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i])
+    verdict = _check(tuple(sizes[i] for i in order), board, fleet,
+                     node_limit)
+    if verdict.layout is None:
+        return verdict
+
+    # Map sorted ship indices back to ``sizes`` order; -1 stays -1.
+    layout = np.asarray(order + [-1], dtype=np.int32)[verdict.layout]
+    return verdict._replace(layout=layout)
+
+
+def check_fleet(fleet: Fleet, settings: GameSettings,
+                node_limit: int = NODE_LIMIT) -> Feasibility:
+    """Check every ship of ``fleet``, indexed in `fleet_ships` order."""
+    sizes = [spec.size for _, spec in fleet_ships(fleet)]
+    return check_feasibility(sizes, settings.Board, settings.Fleet,
+                             node_limit)
+
+
+def ensure_feasible(fleet: Fleet, settings: GameSettings) -> None:
+    """Raise unless ``fleet`` is known to fit the board of ``settings``.
+
+    Raises:
+        ValueError: The fleet provably does not fit, or no layout was found
+            within the search budget.
+    """
+    verdict = check_fleet(fleet, settings)
+    if verdict.feasible:
+        return
+    board = settings.Board
+    outcome = ("cannot be placed" if verdict.feasible is False
+               else "could not be shown to fit")
+    raise ValueError(f"Fleet '{fleet.id}' {outcome} on a {board.height}x"
+                     f"{board.width} board: {verdict.reason}.")
+
+
+@lru_cache(maxsize=1024)
+def _check(sizes: tuple[int, ...], board: BoardSettings,
+           fleet: FleetSettings, node_limit: int) -> Feasibility:
+    """Verdict for ``sizes`` sorted largest first; cached."""
+    cells = board.height * board.width
+    if not sizes:
+        return Feasibility(True, _frozen(np.full(cells, -1, np.int32)),
+                           "no ships")
+
+    for size in sorted(set(sizes), reverse=True):
+        if not len(candidate_placements(board, fleet, size)):
+            return Feasibility(False, None, f"a ship of size {size} has no "
+                                            f"legal placement")
+    area = sum(sizes)
+    if area > cells:
+        return Feasibility(False, None, f"ships cover {area} cells, the "
+                                        f"board has {cells}")
+
+    horizontal = fleet.can_place_only_horizontal
+    vertical = fleet.can_place_only_vertical
+    if horizontal != vertical and not fleet.can_place_along_strict_diagonal:
+        return _pack_lines(sizes, board, horizontal, node_limit)
+
+    layout = _first_fit(sizes, board, fleet)
+    if layout is not None:
+        return Feasibility(True, layout, "first-fit packing")
+    return _search(sizes, board, fleet, node_limit)
+
+
+def _frozen(layout: np.ndarray) -> np.ndarray:
+    layout.flags.writeable = False
+    return layout
+
+
+def _pack_lines(sizes: tuple[int, ...], board: BoardSettings,
+                horizontal: bool, node_limit: int) -> Feasibility:
+    """Bin-pack ``sizes`` into rows (or columns) of the board."""
+    lines, capacity = ((board.height, board.width) if horizontal
+                       else (board.width, board.height))
+    needed = -(-sum(sizes) // capacity)
+    if needed > lines:
+        return Feasibility(False, None, f"ships need at least {needed} "
+                                        f"lines of {capacity} cells, the "
+                                        f"board has {lines}")
+
+    n = len(sizes)
+    loads = [0] * lines
+    assigned = [0] * n
+    failed: set[tuple[int, tuple[int, ...]]] = set()
+    nodes = 0
+
+    def place(i: int) -> bool:
+        nonlocal nodes
+        if i == n:
+            return True
+        key = (i, tuple(sorted(loads)))
+        if key in failed:
+            return False
+        nodes += 1
+        if nodes > node_limit:
+            raise _OutOfBudget
+        tried = set()
+        for line, load in enumerate(loads):
+            # Lines with equal loads are interchangeable.
+            if load in tried or load + sizes[i] > capacity:
+                continue
+            tried.add(load)
+            loads[line] += sizes[i]
+            assigned[i] = line
+            if place(i + 1):
+                return True
+            loads[line] -= sizes[i]
+        failed.add(key)
+        return False
+
+    try:
+        if not place(0):
+            return Feasibility(False, None, "no packing of ship sizes into "
+                                            "lines exists")
+    except _OutOfBudget:
+        return Feasibility(None, None, f"line packing exceeded {node_limit} "
+                                       f"nodes")
+
+    layout = np.full(board.height * board.width, -1, dtype=np.int32)
+    offsets = [0] * lines
+    for index, (size, line) in enumerate(zip(sizes, assigned)):
+        along = np.arange(offsets[line], offsets[line] + size)
+        offsets[line] += size
+        cells = (line * board.width + along if horizontal
+                 else along * board.width + line)
+        layout[cells] = index
+    return Feasibility(True, _frozen(layout), "line packing")
+
+
+def _first_fit(sizes: tuple[int, ...], board: BoardSettings,
+               fleet: FleetSettings) -> Optional[np.ndarray]:
+    """Place each ship at its first free placement; ``None`` on a dead end."""
+    layout = np.full(board.height * board.width, -1, dtype=np.int32)
+    for index, size in enumerate(sizes):
+        options = candidate_placements(board, fleet, size)
+        free = np.flatnonzero((layout[options] < 0).all(axis=1))
+        if not len(free):
+            return None
+        layout[options[free[0]]] = index
+    return _frozen(layout)
+
+
+def _search(sizes: tuple[int, ...], board: BoardSettings,
+            fleet: FleetSettings, node_limit: int) -> Feasibility:
+    """Exhaustive placement search over occupied-cell bitmasks.
+
+    The lowest empty cell is either covered by a ship starting there or left
+    empty, which spends one cell of the slack between board and fleet area.
+    """
+    cells = board.height * board.width
+    kinds = sorted(set(sizes), reverse=True)
+    # Bitmask of every placement of each size, by its lowest cell.
+    starts: dict[int, list[list[int]]] = {}
+    for size in kinds:
+        by_cell: list[list[int]] = [[] for _ in range(cells)]
+        for placement in candidate_placements(board, fleet, size).tolist():
+            by_cell[min(placement)].append(sum(1 << c for c in placement))
+        starts[size] = by_cell
+
+    chosen: list[tuple[int, int]] = []
+    failed: set[tuple[int, tuple[int, ...]]] = set()
+    nodes = 0
+
+    def place(occupied: int, left: tuple[int, ...], slack: int) -> bool:
+        nonlocal nodes
+        if not any(left):
+            return True
+        cell = (~occupied & (occupied + 1)).bit_length() - 1
+        if cell >= cells or (occupied, left) in failed:
+            return False
+        nodes += 1
+        if nodes > node_limit:
+            raise _OutOfBudget
+
+        for k, size in enumerate(kinds):
+            if not left[k]:
+                continue
+            fewer = left[:k] + (left[k] - 1,) + left[k + 1:]
+            for mask in starts[size][cell]:
+                if not mask & occupied:
+                    chosen.append((size, mask))
+                    if place(occupied | mask, fewer, slack):
+                        return True
+                    chosen.pop()
+        if slack and place(occupied | 1 << cell, left, slack - 1):
+            return True
+        failed.add((occupied, left))
+        return False
+
+    try:
+        if not place(0, tuple(sizes.count(k) for k in kinds),
+                     cells - sum(sizes)):
+            return Feasibility(False, None, f"exhaustive search of {nodes} "
+                                            f"nodes found no layout")
+    except _OutOfBudget:
+        return Feasibility(None, None, f"search exceeded {node_limit} nodes")
+
+    layout = np.full(cells, -1, dtype=np.int32)
+    unused = {size: [i for i, s in enumerate(sizes) if s == size]
+              for size in kinds}
+    for size, mask in chosen:
+        bits = np.unpackbits(np.frombuffer(
+            mask.to_bytes(-(-cells // 8), 'little'), dtype=np.uint8),
+            bitorder='little')
+        layout[np.flatnonzero(bits[:cells])] = unused[size].pop(0)
+    return Feasibility(True, _frozen(layout), "exhaustive search")
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Precomputed opening books of the first shots per settings combination.
+
+Until a ship sinks, the shots of `DensityStrategy` depend only on the board
+settings, the fleet settings, the sizes of the ships and whether each
+earlier shot hit. Those first ``K`` shots can be computed once, for every
+hit/miss history, instead of running a heatmap at the start of each game.
+
+A book is a complete binary tree of depth ``K`` stored as a flat ``uint16``
+array of ``2 ** K - 1`` cell indices. Node ``0`` is the first shot; after
+the shot of node ``i``, a miss leads to node ``2 * i + 1`` and a hit to node
+``2 * i + 2``. `build_book` fills the tree one level at a time, each level
+being a single `evaluate_batch` call over every history of that length.
+
+Books live in a `BookShelf`: one ``.npy`` file per combination, named by
+the `REGISTRY` digests of the settings and the ship sizes, and memory-mapped
+on first use. `BookStrategy` (``'book'``) plays from the book on `SHELF`,
+and then continues as `DensityStrategy` after a sinking, an unexpected
+shot or the last book move.
+
+Attributes:
+    BOOK_DEPTH (int): Shots covered by a book unless stated otherwise.
+
+    SHELF (BookShelf): Books used by `BookStrategy`. Kept in memory only,
+        unless given a directory with `BookShelf.use`.
+
+Examples:
+    Precompute books for a configuration::
+
+        $ python -m src.battleships.battleships books --out books/
+
+    Then play from them::
+
+        $ python -m src.battleships.battleships simulate --books books/ \\
+              --strategies book parity
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/engine/openings.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from pathlib import Path
+import threading
+from typing import Optional, Sequence
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.domain.board import EMPTY, HIT, MISS, SUNK
+from src.battleships.domain.registry import REGISTRY
+from src.battleships.engine.batch import (DensityStrategy, evaluate_batch,
+                                          remaining_vector)
+from src.battleships.engine.strategies import register_strategy
+from src.battleships.settings import (BoardSettings, FleetSettings,
+                                      GameSettings)
+
+# Module-level constants
+BOOK_DEPTH: int = 8
+
+__all__ = ['build_book', 'BookShelf', 'BookStrategy', 'SHELF', 'BOOK_DEPTH']
+
+
+def build_book(board: BoardSettings, fleet: FleetSettings,
+               sizes: Sequence[int], depth: int = BOOK_DEPTH) -> np.ndarray:
+    """Compute the opening book of ``depth`` shots.
+
+    Returns:
+        ``uint16`` array of ``2 ** depth - 1`` flat cell indices, in the
+        node order described in the module docstring.
+    """
+    cells = board.height * board.width
+    if cells > np.iinfo(np.uint16).max:
+        raise ValueError(f"Books index cells as uint16; a {board.height}x"
+                         f"{board.width} board is too large.")
+    depth = min(depth, cells)
+
+    settings = GameSettings(Board=board, Fleet=fleet)
+    remaining = remaining_vector(sizes, max(sizes))[None]
+    moves = np.empty(2 ** depth - 1, dtype=np.uint16)
+
+    knowledge = np.zeros((1, cells), dtype=np.int8)
+    for level in range(depth):
+        first = 2 ** level - 1
+        shots = evaluate_batch(knowledge, remaining.repeat(len(knowledge), 0),
+                               settings)
+        moves[first:2 * first + 1] = shots
+
+        # Children of node i sit at 2i+1 (miss) and 2i+2 (hit), so the
+        # next level interleaves each history's miss and hit copies.
+        knowledge = knowledge.repeat(2, axis=0)
+        rows = np.arange(len(knowledge))
+        knowledge[rows, shots.repeat(2)] = np.where(rows % 2, HIT, MISS)
+    return moves
+
+
+class BookShelf:
+    """Opening books by settings combination, loaded on first use.
+
+    Attributes:
+        root:           Directory holding the book files, or ``None`` to
+                        keep books in memory only.
+
+        depth:          Depth of books built on demand.
+    """
+
+    def __init__(self, root: Optional[Path] = None,
+                 depth: int = BOOK_DEPTH):
+        self.root = Path(root) if root is not None else None
+        self.depth = depth
+        self._books: dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def use(self, root: Optional[Path]) -> None:
+        """Switch to the books in ``root``, forgetting those loaded."""
+        with self._lock:
+            self.root = Path(root) if root is not None else None
+            self._books.clear()
+
+    @staticmethod
+    def key(board: BoardSettings, fleet: FleetSettings,
+            sizes: Sequence[int]) -> str:
+        """File stem identifying a settings combination."""
+        return (f"{REGISTRY.digest(board):016x}-{REGISTRY.digest(fleet):016x}"
+                f"-{'.'.join(map(str, sorted(sizes, reverse=True)))}")
+
+    def path(self, key: str) -> Optional[Path]:
+        return self.root / f"{key}.npy" if self.root is not None else None
+
+    def get(self, board: BoardSettings, fleet: FleetSettings,
+            sizes: Sequence[int], build: bool = True
+            ) -> Optional[np.ndarray]:
+        """Return the book of a combination.
+
+        A book already loaded is returned directly; otherwise it is
+        memory-mapped from ``root`` or, if ``build`` is set, built (and
+        saved when there is a ``root``).
+        """
+        key = self.key(board, fleet, sizes)
+        book = self._books.get(key)
+        if book is not None:
+            return book
+
+        with self._lock:
+            book = self._books.get(key)
+            if book is not None:
+                return book
+            path = self.path(key)
+            if path is not None and path.exists():
+                book = np.load(path, mmap_mode='r')
+            elif build:
+                book = build_book(board, fleet, sizes, self.depth)
+                book.flags.writeable = False
+                if path is not None:
+                    self._save(path, book)
+            else:
+                return None
+            self._books[key] = book
+        return book
+
+    def build(self, board: BoardSettings, fleet: FleetSettings,
+              sizes: Sequence[int]) -> Path:
+        """Build and save the book of a combination, replacing any other."""
+        if self.root is None:
+            raise ValueError("A shelf without a directory cannot save books.")
+        key = self.key(board, fleet, sizes)
+        path = self.path(key)
+        book = build_book(board, fleet, sizes, self.depth)
+        with self._lock:
+            self._save(path, book)
+            self._books.pop(key, None)
+        return path
+
+    @staticmethod
+    def _save(path: Path, book: np.ndarray) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix('.tmp')
+        with open(partial, 'wb') as file:
+            np.save(file, book)
+        partial.replace(path)
+
+
+SHELF = BookShelf()
+
+
+@register_strategy
+class BookStrategy(DensityStrategy):
+    """`DensityStrategy` whose opening shots come from `SHELF`."""
+    name = 'book'
+
+    def __init__(self, board: BoardSettings, sizes: Sequence[int],
+                 rng: np.random.Generator,
+                 fleet: Optional[FleetSettings] = None):
+        super().__init__(board, sizes, rng, fleet)
+        self._book = SHELF.get(board, self.fleet, sizes)
+        self._node: Optional[int] = 0
+
+    def next_shot(self) -> int:
+        node = self._node
+        if node is not None and node < len(self._book):
+            cell = int(self._book[node])
+            if self.knowledge[cell] == EMPTY:
+                return cell
+            self._node = None
+        return super().next_shot()
+
+    def observe(self, cell: int, result: int,
+                sunk: Optional[int] = None) -> None:
+        node = self._node
+        if node is not None:
+            if (node >= len(self._book) or cell != self._book[node]
+                    or result == SUNK):
+                self._node = None
+            else:
+                self._node = 2 * node + (2 if result == HIT else 1)
+        super().observe(cell, result, sunk)
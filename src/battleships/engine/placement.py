@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Random fleet placement under `FleetSettings` orientation rules.
+
+Every legal position of a ship of a given size is enumerated once per
+``(board, size, orientation rules)`` and cached as an array of flat cell
+indices. Placing a fleet then only filters those arrays against the cells
+already occupied and draws one row per ship.
+
+Attributes:
+    MAX_ATTEMPTS (int): Restarts allowed before `random_layout` gives up.
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/engine/placement.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from functools import lru_cache
+from typing import Sequence
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.settings import BoardSettings, FleetSettings
+
+# Module-level constants
+MAX_ATTEMPTS: int = 1000
+
+__all__ = ['candidate_placements', 'random_layout', 'MAX_ATTEMPTS']
+
+
+def _directions(settings: FleetSettings) -> tuple[tuple[int, int], ...]:
+    """``(d_row, d_col)`` steps permitted by ``settings``."""
+    steps = []
+    if settings.can_place_only_horizontal:
+        steps.append((0, 1))
+    if settings.can_place_only_vertical:
+        steps.append((1, 0))
+    if settings.can_place_along_strict_diagonal:
+        steps.extend([(1, 1), (1, -1)])
+    return tuple(steps)
+
+
+@lru_cache(maxsize=None)
+def _placements(height: int, width: int, size: int,
+                directions: tuple[tuple[int, int], ...]) -> np.ndarray:
+    rows, cols = np.mgrid[0:height, 0:width]
+    offsets = np.arange(size)
+    found = []
+    for d_row, d_col in directions:
+        # Size-one ships look the same in every direction.
+        if size == 1 and found:
+            break
+        end_row = rows + d_row * (size - 1)
+        end_col = cols + d_col * (size - 1)
+        fits = ((end_row < height) & (end_col >= 0) & (end_col < width))
+        start = (rows * width + cols)[fits]
+        found.append(start[:, None] + (d_row * width + d_col) * offsets)
+
+    placements = (np.concatenate(found) if found
+                  else np.empty((0, size), dtype=np.intp))
+    placements.flags.writeable = False
+    return placements
+
+
+def candidate_placements(board: BoardSettings, fleet: FleetSettings,
+                         size: int) -> np.ndarray:
+    """Return every legal position of a ship of ``size`` cells.
+
+    Returns:
+        Read-only array of shape ``(n, size)`` holding flat cell indices
+        (``row * width + col``).
+    """
+    return _placements(board.height, board.width, size, _directions(fleet))
+
+
+def random_layout(sizes: Sequence[int], board: BoardSettings,
+                  fleet: FleetSettings, rng: np.random.Generator,
+                  max_attempts: int = MAX_ATTEMPTS) -> np.ndarray:
+    """Place ships of ``sizes`` at random without overlaps.
+
+    Ships are placed largest first; a dead end restarts the layout.
+
+    Returns:
+        Flat array over the board holding the index into ``sizes`` of the
+        ship covering each cell, or ``-1``.
+
+    Raises:
+        RuntimeError: No layout was found within ``max_attempts`` restarts.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i])
+    occupants = np.full(board.height * board.width, -1, dtype=np.int32)
+
+    for _ in range(max_attempts):
+        occupants.fill(-1)
+        for index in order:
+            options = candidate_placements(board, fleet, sizes[index])
+            free = options[(occupants[options] < 0).all(axis=1)]
+            if not len(free):
+                break
+            occupants[free[rng.integers(len(free))]] = index
+        else:
+            return occupants
+
+    raise RuntimeError(f"Could not place ships of sizes {list(sizes)} on a "
+                       f"{board.height}x{board.width} board in "
+                       f"{max_attempts} attempts.")
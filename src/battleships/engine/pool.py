@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Shared-memory pool of board slots for multi-process game hosting.
+
+Pickling `Board` grids between worker processes costs more than playing the
+shots. `BoardPool` instead lays out a single `multiprocessing.shared_memory`
+slab of fixed-size slots, each sized from `BoardSettings` and
+`FleetSettings.max_ships`, holding everything a `Board` needs: the cell-state
+grid, the ship occupying each cell and the ship-type id of each ship.
+
+The creating process owns the pool and hands out slots from a free list kept
+in the slab. Every slot carries a generation counter, bumped whenever it is
+allocated or freed, so a `SlotRef` held after its game ended is detected as
+stale instead of silently reading another game. Any process can attach to the
+pool by name and to a game by its `SlotRef`, and gets a `Board` whose arrays
+are zero-copy views into the slab.
+
+Ship-type ids stored in a slot are those of `REGISTRY`. Forked workers
+inherit them; spawned workers must register the same fleets in the same
+order, for example by loading the same configuration.
+
+Each slot also has a version counter, bumped on every change made through an
+attached `Board`. A process that kept a `Board` across turns compares
+versions and calls `Board.resync` if another process has moved the game on.
+
+Examples:
+    Host process::
+
+        >>> pool = BoardPool.create(GameSettings(), slots=1024)
+        >>> ref = pool.allocate()
+        >>> pool.name, ref   # send these to a worker
+
+    Worker process::
+
+        >>> pool = BoardPool.attach(name)
+        >>> board = pool.board(ref)
+        >>> board.receive_shot((3, 4))
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/engine/pool.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from multiprocessing import shared_memory
+import sys
+from threading import Lock
+from typing import NamedTuple, Optional
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.domain.board import Board
+from src.battleships.settings import GameSettings
+
+# Module-level constants
+_MAGIC = 0x42534850  # "BSHP"
+_HEADER = ('magic', 'slots', 'height', 'width', 'max_ships', 'free_head')
+_GENERATION, _VERSION, _N_SHIPS = range(3)
+
+__all__ = ['BoardPool', 'SlotRef']
+
+
+class SlotRef(NamedTuple):
+    """Handle on one allocated slot, valid while its generation matches."""
+    slot: int
+    generation: int
+
+
+def _layout(slots: int, height: int, width: int, max_ships: int):
+    """Return ``(name, dtype, shape, offset)`` of each array, and the size."""
+    arrays = [('header', np.int64, (len(_HEADER),)),
+              ('meta', np.int64, (slots, 3)),
+              ('next_free', np.int64, (slots,)),
+              ('ships', np.int32, (slots, max_ships)),
+              ('occupants', np.int32, (slots, height, width)),
+              ('grid', np.int8, (slots, height, width))]
+
+    layout, offset = [], 0
+    for name, dtype, shape in arrays:
+        layout.append((name, dtype, shape, offset))
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        offset += -(-nbytes // 8) * 8
+    return layout, offset
+
+
+class BoardPool:
+    """Fixed-size board slots in one shared-memory slab.
+
+    Attributes:
+        name:           Shared-memory name, used by other processes to
+                        `attach`.
+
+        slots:          Number of slots in the pool.
+
+        is_owner:       ``True`` in the creating process, which alone may
+                        `allocate`, `free` and `unlink`.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, is_owner: bool):
+        """Wrap an existing slab; use `create` or `attach` instead."""
+        self._shm = shm
+        self.is_owner = is_owner
+        self._lock = Lock()
+
+        header = np.ndarray((len(_HEADER),), np.int64, shm.buf)
+        if header[0] != _MAGIC:
+            raise ValueError(f"Shared memory '{shm.name}' is not a board "
+                             f"pool.")
+        _, slots, height, width, max_ships, _ = header.tolist()
+        self.slots = slots
+        self.shape = (height, width)
+
+        layout, _ = _layout(slots, height, width, max_ships)
+        for name, dtype, shape, offset in layout:
+            setattr(self, f"_{name}",
+                    np.ndarray(shape, dtype, shm.buf, offset))
+
+    @classmethod
+    def create(cls, settings: GameSettings, slots: int) -> "BoardPool":
+        """Allocate a new slab of ``slots`` empty slots."""
+        height, width = settings.Board.height, settings.Board.width
+        max_ships = settings.Fleet.max_ships
+        _, size = _layout(slots, height, width, max_ships)
+
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        header = np.ndarray((len(_HEADER),), np.int64, shm.buf)
+        header[:] = (_MAGIC, slots, height, width, max_ships, 0)
+
+        pool = cls(shm, is_owner=True)
+        pool._meta.fill(0)
+        pool._next_free[:] = np.arange(1, slots + 1)
+        pool._next_free[-1] = -1
+        return pool
+
+    @classmethod
+    def attach(cls, name: str) -> "BoardPool":
+        """Open the pool called ``name`` from another process."""
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            # Worker processes share their parent's resource tracker, which
+            # already tracks the slab; registering again is harmless.
+            shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, is_owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def nbytes(self) -> int:
+        return self._shm.size
+
+    def __enter__(self) -> "BoardPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+        if self.is_owner:
+            self.unlink()
+
+    def __reduce__(self):
+        return type(self).attach, (self.name,)
+
+    def allocate(self) -> SlotRef:
+        """Take a free slot, clear it and return its reference.
+
+        Raises:
+            MemoryError: Every slot is in use.
+        """
+        self._require_owner()
+        with self._lock:
+            slot = int(self._header[-1])
+            if slot < 0:
+                raise MemoryError(f"All {self.slots} board slots are in use.")
+            self._header[-1] = self._next_free[slot]
+            self._next_free[slot] = -2  # In use.
+
+            meta = self._meta[slot]
+            meta[_GENERATION] += 1
+            meta[_VERSION] = 0
+            meta[_N_SHIPS] = 0
+        self._grid[slot].fill(0)
+        self._occupants[slot].fill(-1)
+        return SlotRef(slot, int(meta[_GENERATION]))
+
+    def free(self, ref: SlotRef) -> None:
+        """Return the slot of ``ref`` to the free list."""
+        self._require_owner()
+        with self._lock:
+            self._check(ref)
+            self._meta[ref.slot, _GENERATION] += 1
+            self._next_free[ref.slot] = self._header[-1]
+            self._header[-1] = ref.slot
+
+    def in_use(self) -> int:
+        """Number of allocated slots."""
+        return int((self._next_free == -2).sum())
+
+    def version(self, ref: SlotRef) -> int:
+        """Number of changes made to the slot's board since allocation."""
+        self._check(ref)
+        return int(self._meta[ref.slot, _VERSION])
+
+    def board(self, ref: SlotRef) -> Board:
+        """Return a `Board` whose state lives in the slot of ``ref``.
+
+        The board's ``grid`` and ``occupants`` are views into the slab, so
+        shots are visible to every process attached to the slot. Once the
+        slot is freed, any further change through the board raises
+        `LookupError`.
+        """
+        self._check(ref)
+        slot = ref.slot
+        height, width = self.shape
+        meta, ships = self._meta[slot], self._ships[slot]
+
+        board = Board(length=height, width=width, max_ships=len(ships))
+        board.grid = self._grid[slot]
+        board.occupants = self._occupants[slot]
+        # A board outliving its game must not write into the slot's next one.
+        board.bind(lambda: self._check(ref),
+                   lambda: ships[:meta[_N_SHIPS]].tolist())
+        board.resync()
+
+        def mirror(changed: Board, cells: Optional[np.ndarray]) -> None:
+            meta[_VERSION] += 1
+            n = len(changed.ships)
+            if n != meta[_N_SHIPS]:
+                ships[:n] = changed.ships
+                meta[_N_SHIPS] = n
+
+        board.subscribe(mirror)
+        return board
+
+    def close(self) -> None:
+        """Release this process's mapping of the slab.
+
+        Boards returned by `board` hold views into the slab and must be
+        released first.
+        """
+        for name in ('header', 'meta', 'next_free', 'ships', 'occupants',
+                     'grid'):
+            setattr(self, f"_{name}", None)
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the slab once every process has closed it."""
+        self._require_owner()
+        self._shm.unlink()
+
+    def _check(self, ref: SlotRef) -> None:
+        if not 0 <= ref.slot < self.slots:
+            raise IndexError(f"Slot {ref.slot} is outside the pool.")
+        if self._meta[ref.slot, _GENERATION] != ref.generation:
+            raise LookupError(f"Slot reference {tuple(ref)} is stale.")
+
+    def _require_owner(self) -> None:
+        if not self.is_owner:
+            raise RuntimeError("Only the process that created the pool may "
+                               "allocate, free or unlink slots.")
@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Vectorised verification of recorded games against the game rules.
+
+`verify` re-plays the games of a replay log written by
+`src.battleships.engine.simulation.simulate` and confirms each one: that
+every shot comes from the player whose turn it is, that it targets a live
+opponent at a cell not yet shot, that its hit, miss or sinking matches the
+recorded result, that ``hot_streak`` keeps the turn with the shooter,
+that ``shots_limit`` retires players, and that the game ends exactly when
+the log does, with the recorded winner. Before any shot is replayed, each
+recorded layout is checked against the placement rules and, when given, the
+ship sizes of the fleet, and the player count against ``max_players``.
+
+Log entries that cannot be read at all, such as invalid JSON, missing fields
+or shots of mixed widths, are reported as a divergence of their game rather
+than aborting the run.
+
+Games are stacked in batches and replayed in lockstep: move ``m`` of every
+game in a batch is checked with a handful of array operations, so the cost
+per move shrinks as the batch grows. A game stops being checked at its first
+divergence, which is reported with the game index and move number.
+
+Attributes:
+    BATCH_SIZE (int): Games replayed together by default.
+
+Examples:
+    From the repository root::
+
+        $ python -m src.battleships.battleships simulate --games 10000 \\
+              --replay replays.jsonl
+        $ python -m src.battleships.battleships verify replays.jsonl
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/engine/replay.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from dataclasses import dataclass, field
+from itertools import chain, islice
+import json
+from pathlib import Path
+import time
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence, Union
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.domain.board import HIT, MISS, SUNK
+from src.battleships.engine.placement import candidate_placements
+from src.battleships.settings import GameSettings
+
+# Module-level constants
+BATCH_SIZE: int = 4096
+
+_NAMES = {MISS: 'MISS', HIT: 'HIT', SUNK: 'SUNK'}
+
+__all__ = ['Divergence', 'ReplayBatch', 'VerificationReport', 'load_batches',
+           'verify_batch', 'verify', 'BATCH_SIZE']
+
+
+class Divergence(NamedTuple):
+    """First point at which a recorded game breaks the rules.
+
+    Attributes:
+        game:           Index of the game, as recorded.
+
+        move:           Index of the offending shot in the game; equal to the
+                        number of shots for a wrong ending or winner, and
+                        ``0`` for an illegal layout or a malformed entry.
+
+        reason:         What went wrong.
+    """
+    game: int
+    move: int
+    reason: str
+
+
+@dataclass
+class ReplayBatch:
+    """Recorded games stacked into padded arrays.
+
+    Attributes:
+        games:          ``(G,)`` recorded game index of each row.
+
+        winners:        ``(G,)`` recorded winning seat, or ``-1``.
+
+        layouts:        ``(G, players, cells)`` ship index per cell, ``-1``
+                        for water.
+
+        shots:          ``(G, moves, 3)`` shooter, target and cell of each
+                        shot, padded with ``-1``.
+
+        results:        ``(G, moves)`` recorded cell state after each shot,
+                        or ``-1`` where not recorded.
+
+        lengths:        ``(G,)`` number of shots in each game.
+    """
+    games: np.ndarray
+    winners: np.ndarray
+    layouts: np.ndarray
+    shots: np.ndarray
+    results: np.ndarray
+    lengths: np.ndarray
+
+    @classmethod
+    def from_entries(cls, entries: list[dict]) -> "ReplayBatch":
+        """Stack replay log entries, which must share their player count."""
+        n = len(entries)
+        players = len(entries[0]['layouts'])
+        cells = len(entries[0]['layouts'][0])
+        lengths = np.fromiter((len(e['shots']) for e in entries),
+                              dtype=np.intp, count=n)
+        moves = int(lengths.max(initial=0))
+
+        flat = np.fromiter(chain.from_iterable(
+            chain.from_iterable(e['layouts']) for e in entries),
+            dtype=np.int16)
+        if flat.size != n * players * cells:
+            raise ValueError("Every game of a batch needs the same number "
+                             "of players and cells.")
+        layouts = flat.reshape(n, players, cells)
+
+        shots = np.full((n, moves, 3), -1, dtype=np.int32)
+        results = np.full((n, moves), -1, dtype=np.int8)
+        total = int(lengths.sum())
+        if total:
+            width = len(next(e['shots'][0] for e in entries if e['shots']))
+            flat = np.fromiter(chain.from_iterable(
+                chain.from_iterable(e['shots']) for e in entries),
+                dtype=np.int32)
+            if flat.size != total * width:
+                raise ValueError("Every shot of a batch needs the same "
+                                 "number of fields.")
+            flat = flat.reshape(total, width)
+            rows = np.repeat(np.arange(n), lengths)
+            starts = np.cumsum(lengths) - lengths
+            move = np.arange(total) - np.repeat(starts, lengths)
+            shots[rows, move] = flat[:, :3]
+            if width > 3:
+                results[rows, move] = flat[:, 3]
+
+        return cls(games=np.array([e['game'] for e in entries]),
+                   winners=np.array([e['winner'] for e in entries]),
+                   layouts=layouts, shots=shots, results=results,
+                   lengths=lengths)
+
+
+@dataclass
+class VerificationReport:
+    """Totals of a `verify` run."""
+    games: int = 0
+    moves: int = 0
+    load_time: float = 0.0
+    verify_time: float = 0.0
+    divergences: list[Divergence] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.divergences
+
+    def summary(self) -> str:
+        rate = self.moves / self.verify_time if self.verify_time else 0.0
+        lines = [f"{self.games:,} games, {self.moves:,} moves verified in "
+                 f"{self.verify_time:.2f} s ({rate:,.0f} moves/s; loading "
+                 f"took {self.load_time:.2f} s)",
+                 f"{len(self.divergences):,} divergent games"]
+        lines += [f"  game {d.game}, move {d.move}: {d.reason}"
+                  for d in self.divergences[:20]]
+        return '\n'.join(lines)
+
+
+def load_batches(lines: Iterable[str], batch_size: int = BATCH_SIZE
+                 ) -> Iterator[Union[ReplayBatch, Divergence]]:
+    """Parse replay log lines into batches of up to ``batch_size`` games.
+
+    Games are batched with others of the same player count, board size and
+    shot width, so logs with and without recorded results may be mixed.
+    Each malformed entry is yielded as a `Divergence` of its game instead.
+    """
+    lines = (line for line in lines if line.strip())
+    while True:
+        chunk = list(islice(lines, batch_size))
+        if not chunk:
+            return
+        groups: dict[tuple[int, int, int], list[dict]] = {}
+        for line in chunk:
+            entry = None
+            try:
+                entry = json.loads(line)
+                shape = _shape(entry)
+            except (KeyError, TypeError, ValueError) as exc:
+                yield _malformed(entry, exc)
+                continue
+            groups.setdefault(shape, []).append(entry)
+        for group in groups.values():
+            yield from _stack(group)
+
+
+def _shape(entry: dict) -> tuple[int, int, int]:
+    """``(players, cells, shot width)`` of a log entry.
+
+    Raises:
+        ValueError: The entry is malformed.
+    """
+    for key in ('game', 'winner', 'layouts', 'shots'):
+        if key not in entry:
+            raise ValueError(f"missing '{key}'")
+    layouts, shots = entry['layouts'], entry['shots']
+    cells = {len(layout) for layout in layouts}
+    if len(cells) != 1:
+        raise ValueError("layouts must be equally sized and non-empty")
+    widths = {len(shot) for shot in shots} or {4}
+    if len(widths) != 1 or not widths <= {3, 4}:
+        raise ValueError("shots must all have 3 fields, or all have 4")
+    return len(layouts), cells.pop(), widths.pop()
+
+
+def _stack(entries: list[dict]) -> Iterator[Union[ReplayBatch, Divergence]]:
+    """Stack ``entries``, isolating any that hold values out of range."""
+    try:
+        batch = ReplayBatch.from_entries(entries)
+    except (OverflowError, TypeError, ValueError) as exc:
+        if len(entries) == 1:
+            yield _malformed(entries[0], exc)
+            return
+        half = len(entries) // 2
+        yield from _stack(entries[:half])
+        yield from _stack(entries[half:])
+        return
+    yield batch
+
+
+def _malformed(entry: Optional[dict], exc: Exception) -> Divergence:
+    game = entry.get('game') if isinstance(entry, dict) else None
+    return Divergence(game if isinstance(game, int) else -1, 0,
+                      f"malformed log entry: {exc}")
+
+
+def _check_layouts(batch: ReplayBatch, settings: GameSettings,
+                   sizes: Optional[Sequence[int]]) -> dict[int, str]:
+    """Reason each illegal layout is illegal, by row of ``batch``.
+
+    A layout must hold ships ``0`` to ``k - 1``, each on a legal placement
+    under ``settings.Fleet``; with ``sizes``, ``k`` must be ``len(sizes)``
+    and ship ``i`` must cover ``sizes[i]`` cells.
+    """
+    n, players, cells = batch.layouts.shape
+    board = settings.Board
+    if not 2 <= players <= board.max_players:
+        return dict.fromkeys(range(n), f"{players} players; between 2 and "
+                                       f"{board.max_players} are allowed")
+    area = board.height * board.width
+    if cells != area:
+        return dict.fromkeys(range(n), f"layouts have {cells} cells, the "
+                                       f"board has {area}")
+
+    reasons: dict[int, str] = {}
+
+    def reject(boards: np.ndarray, reason) -> None:
+        for b in boards.tolist():
+            reasons.setdefault(b // players, (
+                f"player {b % players}: "
+                f"{reason(b) if callable(reason) else reason}"))
+
+    layouts = batch.layouts.reshape(n * players, cells).astype(np.intp)
+    n_ships = len(sizes) if sizes is not None else int(layouts.max()) + 1
+    unknown = ((layouts < -1) | (layouts >= n_ships)).any(axis=1)
+    reject(np.flatnonzero(unknown), f"ship indices must lie in -1 to "
+                                    f"{n_ships - 1}")
+    known = np.where(unknown[:, None], -1, layouts)
+
+    for ship in range(n_ships):
+        covers = known == ship
+        counts = covers.sum(axis=1)
+        if sizes is not None:
+            expected = np.full(len(counts), sizes[ship])
+        else:
+            expected = np.maximum(counts, 1)
+        wrong = counts != expected
+        reject(np.flatnonzero(wrong & ~unknown), lambda b: (
+            f"ship {ship} covers {counts[b]} cells, expected "
+            f"{expected[b]}"))
+
+        for size in np.unique(counts[~wrong]).tolist():
+            boards = np.flatnonzero(~wrong & (counts == size))
+            occupied = np.nonzero(covers[boards])[1].reshape(-1, size)
+            legal = candidate_placements(board, settings.Fleet, size)
+            legal = np.sort(legal, axis=1)
+            # A placement is a run of equally spaced cells, so its first
+            # cell and spacing identify it.
+            allowed = legal[:, 0] * cells + (legal[:, 1] - legal[:, 0]
+                                             if size > 1 else 0)
+            key = occupied[:, 0] * cells + (occupied[:, 1] - occupied[:, 0]
+                                            if size > 1 else 0)
+            steps = np.diff(occupied, axis=1)
+            even = (steps == steps[:, :1]).all(axis=1) if size > 1 else True
+            bad = ~(even & np.isin(key, allowed))
+            reject(boards[bad], f"ship {ship} is not on a legal placement")
+    return reasons
+
+
+def _next_shooting(shooting: np.ndarray, rows: np.ndarray,
+                   seats: np.ndarray) -> np.ndarray:
+    """First seat after each of ``seats``, cyclically, still shooting."""
+    players = shooting.shape[1]
+    order = (seats[:, None] + np.arange(1, players + 1)) % players
+    flags = shooting[rows[:, None], order]
+    first = flags.argmax(axis=1)
+    return np.where(flags.any(axis=1),
+                    order[np.arange(len(rows)), first], -1)
+
+
+def verify_batch(batch: ReplayBatch, settings: GameSettings,
+                 sizes: Optional[Sequence[int]] = None
+                 ) -> tuple[int, list[Divergence]]:
+    """Replay ``batch`` in lockstep and return ``(moves, divergences)``.
+
+    State is kept in flat arrays indexed by board, ``game * players +
+    seat``, so each move of the whole batch costs a fixed number of array
+    operations.
+
+    Arguments:
+        batch: Games to replay.
+        settings: Settings the games were played under.
+        sizes: Size of each ship of the fleet, in `fleet_ships` order. If
+            omitted, layouts are only checked against the placement rules.
+    """
+    hot_streak = settings.Player.hot_streak
+    shots_limit = settings.Player.shots_limit
+    n, players, cells = batch.layouts.shape
+    lengths = batch.lengths
+
+    illegal = _check_layouts(batch, settings, sizes)
+    layouts = batch.layouts.astype(np.intp)
+    layouts[list(illegal)] = -1
+    layouts = layouts.reshape(-1)
+    n_ships = max(int(layouts.max(initial=-1)) + 1, 1)
+    occupied = np.flatnonzero(layouts >= 0)
+    sizes = np.bincount(occupied // cells * n_ships + layouts[occupied],
+                        minlength=n * players * n_ships).astype(np.int16)
+    hits = np.zeros_like(sizes)
+    afloat = np.count_nonzero(sizes.reshape(n * players, n_ships), axis=1)
+
+    shot = np.zeros(n * players * cells, dtype=bool)
+    alive = np.ones(n * players, dtype=bool)
+    shooting = alive.copy()
+    by_game = shooting.reshape(n, players)
+    n_alive = np.full(n, players)
+    n_shooting = n_alive.copy()
+    shots_used = np.zeros(n * players, dtype=np.int32)
+    streak = np.zeros(n * players, dtype=np.int32)
+    current = np.zeros(n, dtype=np.intp)
+
+    divergences = [Divergence(int(batch.games[row]), 0,
+                              f"illegal layout: {reason}")
+                   for row, reason in illegal.items()]
+    pending = np.ones(n, dtype=bool)
+    pending[list(illegal)] = False
+    verified = 0
+
+    def diverge(rows: np.ndarray, moves, reasons) -> None:
+        moves = np.broadcast_to(moves, rows.shape).tolist()
+        if isinstance(reasons, str):
+            reasons = [reasons] * len(rows)
+        for row, move, reason in zip(rows.tolist(), moves, reasons):
+            divergences.append(Divergence(int(batch.games[row]), move,
+                                          reason))
+        pending[rows] = False
+
+    for move in range(batch.shots.shape[1]):
+        rows = np.flatnonzero(pending & (lengths > move))
+        if not len(rows):
+            break
+        shooter, target, cell = batch.shots[rows, move].T.astype(np.intp)
+
+        in_turn = shooter == current[rows]
+        in_range = ((0 <= target) & (target < players) & (target != shooter)
+                    & (0 <= cell) & (cell < cells))
+        board = rows * players + np.where(in_range, target, 0)
+        index = board * cells + np.where(in_range, cell, 0)
+        live = alive[board]
+        fresh = ~shot[index]
+
+        legal = in_turn & in_range & live & fresh
+        if not legal.all():
+            bad = ~legal
+            reasons = np.select(
+                [~in_turn[bad], ~in_range[bad], ~live[bad]],
+                ['turn', "target or cell is out of range",
+                 "target has already been eliminated"],
+                "cell has already been shot").tolist()
+            for i, (s, e) in enumerate(zip(shooter[bad].tolist(),
+                                           current[rows[bad]].tolist())):
+                if reasons[i] == 'turn':
+                    reasons[i] = (f"player {s} shot out of turn; expected "
+                                  f"player {e}")
+            diverge(rows[bad], move, reasons)
+            rows, shooter, target = rows[legal], shooter[legal], target[legal]
+            board, index = board[legal], index[legal]
+
+        shot[index] = True
+        ship = layouts[index]
+        hit = ship >= 0
+        key = board[hit] * n_ships + ship[hit]
+        hits[key] += 1
+        sunk = np.zeros(len(rows), dtype=bool)
+        sunk[hit] = hits[key] == sizes[key]
+
+        recorded = batch.results[rows, move]
+        if (recorded >= 0).any():
+            result = np.where(sunk, SUNK, np.where(hit, HIT, MISS))
+            bad = (recorded >= 0) & (recorded != result)
+            if bad.any():
+                diverge(rows[bad], move,
+                        [f"shot resolves to {_NAMES[r]}, recorded "
+                         f"{_NAMES.get(x, x)}"
+                         for r, x in zip(result[bad].tolist(),
+                                         recorded[bad].tolist())])
+                keep = ~bad
+                rows, shooter, target = rows[keep], shooter[keep], target[keep]
+                board, hit, sunk = board[keep], hit[keep], sunk[keep]
+        verified += len(rows)
+
+        afloat[board[sunk]] -= 1
+        seat = rows * players + shooter
+        used = shots_used[seat] + 1
+        shots_used[seat] = used
+        run = np.where(hit, streak[seat] + 1, 0)
+        streak[seat] = run
+
+        retired = used >= shots_limit
+        if retired.any():
+            shooting[seat[retired]] = False
+            n_shooting[rows[retired]] -= 1
+        passes = ~(hit & (run >= hot_streak)) | retired
+        if passes.any():
+            current[rows[passes]] = _next_shooting(by_game, rows[passes],
+                                                   shooter[passes])
+
+        eliminated = sunk & (afloat[board] == 0)
+        if eliminated.any():
+            out_rows, out_seats = rows[eliminated], target[eliminated]
+            out = board[eliminated]
+            alive[out] = False
+            n_alive[out_rows] -= 1
+            n_shooting[out_rows[shooting[out]]] -= 1
+            shooting[out] = False
+            passed = current[out_rows] == out_seats
+            if passed.any():
+                current[out_rows[passed]] = _next_shooting(
+                    by_game, out_rows[passed], out_seats[passed])
+
+        over = (n_alive[rows] <= 1) | (n_shooting[rows] == 0)
+        bad = over & (lengths[rows] > move + 1)
+        if bad.any():
+            diverge(rows[bad], move + 1, "shot fired after the game ended")
+
+    rows = np.flatnonzero(pending)
+    unfinished = (n_alive[rows] > 1) & (n_shooting[rows] > 0)
+    if unfinished.any():
+        diverge(rows[unfinished], lengths[rows[unfinished]],
+                "log ends before the game is over")
+
+    rows = np.flatnonzero(pending)
+    survivors = alive.reshape(n, players)[rows]
+    winners = np.where(n_alive[rows] == 1, survivors.argmax(axis=1), -1)
+    bad = winners != batch.winners[rows]
+    if bad.any():
+        diverge(rows[bad], lengths[rows[bad]],
+                [f"winner is {w}, recorded {x}"
+                 for w, x in zip(winners[bad].tolist(),
+                                 batch.winners[rows[bad]].tolist())])
+
+    return verified, divergences
+
+
+def verify(path: Path, settings: GameSettings,
+           batch_size: int = BATCH_SIZE,
+           limit: Optional[int] = None,
+           sizes: Optional[Sequence[int]] = None) -> VerificationReport:
+    """Verify every game of the replay log at ``path``.
+
+    Arguments:
+        path: JSON lines replay log written by `simulate`.
+        settings: Settings the games were played under.
+        batch_size: Games replayed together.
+        limit: If given, verify only the first ``limit`` games.
+        sizes: Ship sizes of the fleet, as for `verify_batch`.
+    """
+    report = VerificationReport()
+    with open(path) as lines:
+        if limit is not None:
+            lines = islice(lines, limit)
+        batches = load_batches(lines, batch_size)
+        while True:
+            start = time.perf_counter()
+            batch = next(batches, None)
+            loaded = time.perf_counter()
+            report.load_time += loaded - start
+            if batch is None:
+                break
+            if isinstance(batch, Divergence):
+                report.games += 1
+                report.divergences.append(batch)
+                continue
+
+            moves, divergences = verify_batch(batch, settings, sizes)
+            report.verify_time += time.perf_counter() - loaded
+            report.games += len(batch.games)
+            report.moves += moves
+            report.divergences += divergences
+
+    report.divergences.sort()
+    return report
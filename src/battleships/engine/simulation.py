@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Headless batch simulation of computer-versus-computer games.
+
+`simulate` plays many games between named strategies with no printing in the
+game loop. Games are shared between workers in chunks and each game draws its
+randomness from ``(seed, game index)``, so results do not depend on the
+number or kind of workers. Results stream to a CSV file and, optionally, a JSON
+lines replay log holding every layout and shot, while live progress is
+written to ``stderr``. Each replay entry records the ship index of every cell
+of each player's layout (``-1`` for water) and every shot as ``[shooter,
+target, cell, result]``; `src.battleships.engine.replay` re-checks them.
+
+Time spent inside each game is split into three phases:
+
+* ``placement``: random fleet layouts and board set-up.
+* ``targeting``: strategies choosing shots and absorbing their outcomes.
+* ``resolution``: resolving shots against boards and advancing turns.
+
+Workers are either threads or processes. Processes pay start-up and pickling
+costs, but threads only run in parallel where the GIL is released (inside
+NumPy kernels) or absent (free-threaded builds). With ``backend='auto'`` a
+short calibration run times both and picks the one expected to finish the
+requested games first. Runs too short to repay a calibration use threads,
+which start fastest. Each worker keeps its own preallocated boards, which
+are cleared in place between games.
+
+Attributes:
+    PHASES (tuple[str, ...]): Names of the timed phases, in report order.
+
+    CHUNK_SIZE (int): Games handed to a worker per task.
+
+    BACKENDS (tuple[str, ...]): Accepted values of ``backend``.
+
+    CALIBRATION_GAMES (int): Games each backend plays when calibrating.
+
+    AUTO_MIN_GAMES (int): Fewest games for which ``backend='auto'``
+        calibrates; shorter runs use threads.
+
+Examples:
+    From the repository root::
+
+        $ python -m src.battleships.battleships simulate --games 10000 \\
+              --strategies hunt random --workers 4 --seed 7 --out results.csv
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/engine/simulation.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from contextlib import nullcontext
+import csv
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import NamedTuple, Optional, Sequence, TextIO
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.domain.board import Board, SUNK
+from src.battleships.domain.fleet import Fleet
+from src.battleships.domain.registry import REGISTRY
+from src.battleships.domain.ship import ShipSpec
+from src.battleships.domain.turns import Arena
+from src.battleships.engine import batch  # noqa: F401 - registers 'density'
+from src.battleships.engine.feasibility import ensure_feasible
+from src.battleships.engine import openings  # noqa: F401 - registers 'book'
+from src.battleships.engine.placement import random_layout
+from src.battleships.engine.store import ResultStore
+from src.battleships.engine.strategies import Strategy, get_strategy
+from src.battleships.instrumentation import INSTRUMENTS
+from src.battleships.loaders import fleet_ships
+from src.battleships.settings import GameSettings
+
+# Module-level constants
+PHASES: tuple[str, ...] = ('placement', 'targeting', 'resolution')
+CHUNK_SIZE: int = 64
+BACKENDS: tuple[str, ...] = ('auto', 'threads', 'processes')
+CALIBRATION_GAMES: int = 128
+AUTO_MIN_GAMES: int = 8 * CALIBRATION_GAMES
+
+__all__ = ['GameResult', 'SimulationReport', 'play_game', 'simulate',
+           'select_backend', 'PHASES', 'CHUNK_SIZE', 'BACKENDS',
+           'CALIBRATION_GAMES', 'AUTO_MIN_GAMES']
+
+
+class GameResult(NamedTuple):
+    """Outcome of one simulated game.
+
+    Attributes:
+        game:           Index of the game within its run.
+
+        seed:           Seed of the run; with ``game`` it fixes every random
+                        draw in the game.
+
+        winner:         Seat of the winning player, or ``-1`` if the shot
+                        limits ran out first.
+
+        shots_to_win:   Shots fired by the winner, or ``-1``.
+
+        total_shots:    Shots fired by all players.
+
+        max_streak:     Longest run of consecutive hits by any player.
+    """
+    game: int
+    seed: int
+    winner: int
+    shots_to_win: int
+    total_shots: int
+    max_streak: int
+
+
+@dataclass
+class SimulationReport:
+    """Totals of a `simulate` run.
+
+    Attributes:
+        games:          Games played.
+
+        moves:          Shots fired across all games.
+
+        wall_time:      Elapsed seconds for the whole run.
+
+        phase_times:    Seconds spent in each of `PHASES`, summed over
+                        workers.
+
+        backend:        Kind of worker that played the games.
+    """
+    games: int = 0
+    moves: int = 0
+    wall_time: float = 0.0
+    phase_times: dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    backend: str = 'serial'
+
+    def summary(self) -> str:
+        """Human-readable throughput and per-phase timing breakdown."""
+        wall = self.wall_time or float('nan')
+        lines = [f"{self.games:,} games, {self.moves:,} moves in "
+                 f"{self.wall_time:.2f} s ({self.games / wall:,.0f} games/s, "
+                 f"{self.moves / wall:,.0f} moves/s, {self.backend})"]
+
+        busy = sum(self.phase_times.values()) or float('nan')
+        for phase in PHASES:
+            seconds = self.phase_times[phase]
+            lines.append(f"  {phase:<11} {seconds:9.3f} s  "
+                         f"{seconds / busy:6.1%}")
+        return '\n'.join(lines)
+
+
+def play_game(game: int, seed: int, settings: GameSettings,
+              ships: Sequence[tuple[str, ShipSpec]],
+              strategies: Sequence[type[Strategy]],
+              timings: list[int],
+              replay: Optional[dict] = None,
+              boards: Optional[Sequence[Board]] = None) -> GameResult:
+    """Play one game between ``strategies``, one player per strategy.
+
+    Arguments:
+        game: Index of the game; with ``seed`` it seeds the game's RNG.
+        seed: Seed of the run.
+        settings: Settings of the game.
+        ships: One ``(name, spec)`` entry per ship in each player's fleet.
+        strategies: Strategy of each seat.
+        timings: Nanoseconds per phase of `PHASES`, incremented in place.
+        replay: If given, filled with the layouts and shot sequence.
+        boards: If given, one board per seat to clear and reuse instead of
+            allocating new ones.
+    """
+    clock = time.perf_counter_ns
+    start = clock()
+
+    rng = np.random.default_rng([seed, game])
+    board_settings = settings.Board
+    width = board_settings.width
+    sizes = [spec.size for _, spec in ships]
+
+    spare = list(boards) if boards is not None else []
+    boards, layouts = [], []
+    for seat in range(len(strategies)):
+        occupants = random_layout(sizes, board_settings, settings.Fleet, rng)
+        if seat < len(spare):
+            board = spare[seat]
+            board.reset_grid(inplace=True)
+        else:
+            board = Board.from_settings(board_settings)
+        for index, (name, spec) in enumerate(ships):
+            cells = np.flatnonzero(occupants == index)
+            board.place_ship(name, spec, [divmod(c, width) for c in cells])
+        boards.append(board)
+        layouts.append(occupants)
+
+    arena = Arena(boards, settings=settings)
+    scheduler = arena.scheduler
+    aims: dict[tuple[int, int], Strategy] = {}
+    # Shots each board has received, replayed to a strategy that switches
+    # to it after its previous target is eliminated.
+    received: list[list[tuple[int, int, Optional[int]]]] = [
+        [] for _ in strategies]
+    shots = [] if replay is not None else None
+
+    placed = clock()
+    timings[0] += placed - start
+    targeting = resolution = 0
+    total_shots = max_streak = 0
+
+    while not scheduler.is_over:
+        t0 = clock()
+        shooter = scheduler.current
+        target = scheduler.next_target(shooter)
+        strategy = aims.get((shooter, target))
+        if strategy is None:
+            strategy = strategies[shooter](board_settings, sizes, rng,
+                                           settings.Fleet)
+            for seen in received[target]:
+                strategy.observe(*seen)
+            aims[shooter, target] = strategy
+        cell = strategy.next_shot()
+
+        t1 = clock()
+        result = arena.fire(target, divmod(cell, width))
+        t2 = clock()
+
+        sunk = (sizes[boards[target].occupants.flat[cell]]
+                if result == SUNK else None)
+        strategy.observe(cell, result, sunk)
+        received[target].append((cell, result, sunk))
+        t3 = clock()
+
+        targeting += (t1 - t0) + (t3 - t2)
+        resolution += t2 - t1
+        total_shots += 1
+        if scheduler.streak[shooter] > max_streak:
+            max_streak = scheduler.streak[shooter]
+        if shots is not None:
+            shots.append((shooter, target, cell, result))
+
+    timings[1] += targeting
+    timings[2] += resolution
+
+    winner = -1
+    if scheduler.n_alive == 1:
+        winner = next(seat for seat in range(scheduler.n_players)
+                      if scheduler.is_alive(seat))
+    shots_to_win = scheduler.shots_used[winner] if winner >= 0 else -1
+
+    if replay is not None:
+        replay.update(game=game, seed=seed, winner=winner,
+                      strategies=[s.name for s in strategies],
+                      layouts=[layout.tolist() for layout in layouts],
+                      shots=shots)
+
+    return GameResult(game, seed, winner, shots_to_win, total_shots,
+                      max_streak)
+
+
+# Per-worker state, set once by `_init_worker` rather than pickled per task.
+# Thread-local so that each worker thread has its own boards.
+_LOCAL = threading.local()
+
+
+def _init_worker(settings: GameSettings, ships, strategy_names, seed,
+                 record_replays: bool, instrumented: bool = False) -> None:
+    if instrumented:
+        # A worker process records into its own `INSTRUMENTS`, which
+        # `_run_chunk` drains back to the parent; forked workers start
+        # with a copy of the parent's records, dropped here.
+        INSTRUMENTS.enable()
+        INSTRUMENTS.reset()
+    _LOCAL.worker = dict(
+        settings=settings, ships=ships, seed=seed,
+        strategies=[get_strategy(n) for n in strategy_names],
+        record_replays=record_replays, instrumented=instrumented,
+        boards=[Board.from_settings(settings.Board) for _ in strategy_names])
+
+
+def _run_chunk(games: range):
+    """Play ``games`` in this worker.
+
+    Returns:
+        Results, phase timings, replays and, in an instrumented worker
+        process, its `Instrumentation.drain` records (else ``None``).
+    """
+    worker = _LOCAL.worker
+    timings = [0] * len(PHASES)
+    results, replays = [], []
+    for game in games:
+        replay = {} if worker['record_replays'] else None
+        results.append(play_game(game, worker['seed'], worker['settings'],
+                                 worker['ships'], worker['strategies'],
+                                 timings, replay, worker['boards']))
+        if replay is not None:
+            replays.append(replay)
+    records = INSTRUMENTS.drain() if worker['instrumented'] else None
+    return results, timings, replays, records
+
+
+def _executor(backend: str, workers: int, init_args: tuple) -> Executor:
+    if backend == 'threads':
+        return ThreadPoolExecutor(workers, thread_name_prefix='simulate',
+                                  initializer=_init_worker,
+                                  initargs=init_args)
+    return ProcessPoolExecutor(workers, initializer=_init_worker,
+                               initargs=init_args)
+
+
+def select_backend(settings: GameSettings, fleet: Fleet,
+                   strategy_names: Sequence[str], games: int,
+                   workers: int,
+                   calibration_games: int = CALIBRATION_GAMES) -> str:
+    """Pick the backend expected to play ``games`` games soonest.
+
+    Each backend starts ``workers`` workers and plays ``calibration_games``
+    games, at most ``games``, in small chunks. Its estimated time for the real run is its
+    start-up time plus ``games`` at the throughput it reached.
+
+    Returns:
+        ``'threads'`` or ``'processes'``.
+    """
+    init_args = (settings, fleet_ships(fleet), list(strategy_names), 0,
+                 False)
+    calibration_games = max(min(calibration_games, games), 1)
+    size = max(calibration_games // (4 * workers), 1)
+    chunks = [range(i, min(i + size, calibration_games))
+              for i in range(0, calibration_games, size)]
+
+    estimates = {}
+    for backend in ('threads', 'processes'):
+        start = time.perf_counter()
+        with _executor(backend, workers, init_args) as executor:
+            # Let the workers start before timing throughput.
+            list(executor.map(time.sleep, [0.0] * workers))
+            ready = time.perf_counter()
+            for _ in executor.map(_run_chunk, chunks):
+                pass
+            done = time.perf_counter()
+        rate = calibration_games / max(done - ready, 1e-9)
+        estimates[backend] = (ready - start) + games / rate
+    return min(estimates, key=estimates.get)
+
+
+class _Progress:
+    """Throttled single-line progress meter."""
+
+    def __init__(self, total: int, stream: Optional[TextIO],
+                 interval: float = 0.2):
+        self.total = total
+        self.stream = stream
+        self.interval = interval
+        self.start = time.perf_counter()
+        self._last = 0.0
+
+    def update(self, games: int, moves: int, final: bool = False) -> None:
+        if self.stream is None:
+            return
+        now = time.perf_counter()
+        if not final and now - self._last < self.interval:
+            return
+        self._last = now
+
+        elapsed = max(now - self.start, 1e-9)
+        rate = games / elapsed
+        eta = (self.total - games) / rate if rate else float('inf')
+        self.stream.write(f"\r{games:>{len(str(self.total))}}/{self.total} "
+                          f"games  {rate:,.0f} games/s  "
+                          f"{moves / elapsed:,.0f} moves/s  ETA {eta:5.1f} s")
+        if final:
+            self.stream.write('\n')
+        self.stream.flush()
+
+
+def simulate(settings: GameSettings, fleet: Fleet,
+             strategy_names: Sequence[str], games: int, *,
+             workers: int = 1, seed: int = 0,
+             out: Optional[Path] = None, replay: Optional[Path] = None,
+             store: Optional[Path] = None,
+             progress: Optional[TextIO] = sys.stderr,
+             backend: str = 'auto') -> SimulationReport:
+    """Play ``games`` games between ``strategy_names``.
+
+    Arguments:
+        settings: Settings shared by every game.
+        fleet: Fleet given to every player.
+        strategy_names: Registered strategy of each player, in seat order.
+        games: Number of games to play.
+        workers: Worker threads or processes; ``1`` plays in this thread.
+        seed: Seed of the run.
+        out: CSV file receiving one `GameResult` row per game.
+        replay: JSON lines file receiving each game's layouts and shots.
+        store: `ResultStore` directory receiving one row per game.
+        progress: Stream for the live progress line, or ``None``.
+        backend: One of `BACKENDS`; ``'auto'`` calibrates first, or uses
+            threads below `AUTO_MIN_GAMES` games. Ignored when ``workers``
+            is ``1``.
+    """
+    if len(strategy_names) < 2:
+        raise ValueError("At least two strategies are required.")
+    if len(strategy_names) > settings.Board.max_players:
+        raise ValueError(f"{len(strategy_names)} players exceeds the maximum "
+                         f"[{settings.Board.max_players}] permitted.")
+    for name in strategy_names:
+        get_strategy(name)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Choose from: "
+                         f"{list(BACKENDS)}")
+    ensure_feasible(fleet, settings)
+
+    init_args = (settings, fleet_ships(fleet), list(strategy_names), seed,
+                 replay is not None)
+    chunks = [range(i, min(i + CHUNK_SIZE, games))
+              for i in range(0, games, CHUNK_SIZE)]
+
+    report = SimulationReport()
+    meter = _Progress(games, progress)
+    if workers > 1 and backend == 'auto':
+        backend = ('threads' if games < AUTO_MIN_GAMES
+                   else select_backend(settings, fleet, strategy_names,
+                                       games, workers))
+    timings = [0] * len(PHASES)
+
+    digest = REGISTRY.digest(settings)
+
+    with open(out, 'w', newline='') if out else nullcontext() as out_file, \
+            open(replay, 'w') if replay else nullcontext() as replay_file, \
+            ResultStore(store).writer() if store else nullcontext() \
+            as store_writer:
+        writer = csv.writer(out_file) if out_file else None
+        if writer:
+            writer.writerow(GameResult._fields)
+
+        if workers > 1:
+            if backend == 'processes' and INSTRUMENTS.enabled:
+                init_args += (True,)
+            pool = _executor(backend, workers, init_args)
+            batches = pool.map(_run_chunk, chunks)
+            report.backend = f"{workers} {backend}"
+        else:
+            pool = None
+            _init_worker(*init_args)
+            batches = map(_run_chunk, chunks)
+
+        try:
+            for results, chunk_timings, replays, records in batches:
+                if records is not None:
+                    INSTRUMENTS.merge(*records)
+                for i, ns in enumerate(chunk_timings):
+                    timings[i] += ns
+                report.games += len(results)
+                report.moves += sum(r.total_shots for r in results)
+                if writer:
+                    writer.writerows(results)
+                if store_writer:
+                    store_writer.append_results(results, digest,
+                                                strategy_names)
+                for entry in replays:
+                    replay_file.write(json.dumps(entry) + '\n')
+                meter.update(report.games, report.moves)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    report.wall_time = time.perf_counter() - meter.start
+    report.phase_times = {phase: ns / 1e9
+                          for phase, ns in zip(PHASES, timings)}
+    meter.update(report.games, report.moves, final=True)
+    return report
+
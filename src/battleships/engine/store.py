@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Columnar store of simulation results with a filter/group-by query API.
+
+Results from tournaments and parameter sweeps are appended as rows of the
+NumPy structured dtype `RESULT_DTYPE` to a directory of chunk files. Each
+chunk is a plain ``.npy`` file of at most ``chunk_rows`` rows, memory-mapped
+when read, with a JSON sidecar holding a zone map: the minimum, maximum and,
+for low-cardinality columns, the sorted distinct values of every column.
+
+Strategy names are stored as 32-bit codes derived from a digest of the name,
+so independent writers agree on codes without coordinating; each writer
+appends the names it introduced to ``names.jsonl`` for decoding. Settings
+are identified by their 64-bit `REGISTRY` digest.
+
+Writers only ever add complete chunks (written under a temporary name, then
+renamed), so several worker processes may append to one store while others
+query it.
+
+`ResultStore.query` filters, groups and aggregates one chunk at a time. The
+zone maps let it skip chunks that cannot match a filter, and give each chunk's
+distinct group keys up front, so grouping is a binary search and a
+`numpy.bincount` rather than a sort.
+
+Attributes:
+    RESULT_DTYPE (numpy.dtype): Row layout of the store.
+
+    CHUNK_ROWS (int): Default maximum rows per chunk.
+
+Examples:
+    Mean shots-to-win per matchup and winning strategy::
+
+        >>> store = ResultStore('results/')
+        >>> store.query(where={'settings': digest},
+        ...             group_by=['matchup', 'winner_strategy'],
+        ...             agg={'shots_to_win': ['mean', 'max']})
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/engine/store.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from hashlib import blake2b
+import json
+import os
+from pathlib import Path
+from typing import (Any, Callable, Iterable, Mapping, Optional, Sequence,
+                    Union)
+import uuid
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+
+# Module-level constants
+RESULT_DTYPE = np.dtype([('settings', '<u8'),
+                         ('matchup', '<u4'),
+                         ('winner_strategy', '<u4'),
+                         ('seed', '<i8'),
+                         ('game', '<i8'),
+                         ('winner', 'i1'),
+                         ('shots_to_win', '<i2'),
+                         ('total_shots', '<i4'),
+                         ('max_streak', '<i2')])
+CHUNK_ROWS: int = 1 << 20
+
+_ENCODED = ('matchup', 'winner_strategy')
+_MAX_DISTINCT = 4096
+_AGGREGATES = ('count', 'sum', 'mean', 'min', 'max')
+
+__all__ = ['ResultStore', 'ResultWriter', 'RESULT_DTYPE', 'CHUNK_ROWS',
+           'encode_name', 'matchup_name']
+
+Filter = Union[Any, Sequence[Any], Callable[[np.ndarray], np.ndarray]]
+
+
+def encode_name(name: str) -> int:
+    """Stable 32-bit code of a strategy or matchup name (``0`` for none)."""
+    if not name:
+        return 0
+    code = int.from_bytes(blake2b(name.encode(), digest_size=4).digest(),
+                          'little')
+    return code or 1
+
+
+def matchup_name(strategies: Sequence[str]) -> str:
+    """Name of a matchup: its seat-ordered strategy names joined by ``|``."""
+    return '|'.join(strategies)
+
+
+def _factorize(values: np.ndarray, distinct: np.ndarray) -> np.ndarray:
+    """Position of each of ``values`` within the sorted ``distinct``.
+
+    Every value must occur in ``distinct``. For short ``distinct`` arrays a
+    modulus giving each distinct value its own residue is found, turning the
+    lookup into one ``%`` and one gather instead of a binary search.
+    """
+    k = len(distinct)
+    if k <= 256:
+        wide = np.int64 if values.dtype.kind == 'i' else np.uint64
+        keys = distinct.astype(wide)
+        for modulus in range(k, 64 * k + 1):
+            residues = keys % wide(modulus)
+            if len(np.unique(residues)) == k:
+                table = np.zeros(modulus, dtype=np.intp)
+                table[residues] = np.arange(k)
+                return table[values.astype(wide) % wide(modulus)]
+    return np.searchsorted(distinct, values)
+
+
+def _offsets(values: np.ndarray, low: int) -> np.ndarray:
+    """``values - low`` as ``int64``, for integer ``values`` not below ``low``.
+
+    The subtraction happens in the 64-bit type of the column's own sign, so
+    ``uint64`` values such as settings digests never pass through ``int64``.
+    """
+    wide = np.uint64 if values.dtype.kind == 'u' else np.int64
+    return (values.astype(wide) - wide(low)).astype(np.int64)
+
+
+def _extreme(func: str, index: np.ndarray, values: np.ndarray,
+             n_groups: int, stats: dict) -> np.ndarray:
+    """Per-group minimum or maximum of ``values`` (``inf`` if empty).
+
+    Integer columns with a narrow range, per the zone map, are counted into a
+    ``(group, value)`` table, which is much faster than `numpy.ufunc.at`.
+    """
+    span = stats['max'] - stats['min'] + 1
+    if (values.dtype.kind in 'iu' and stats['max'] < 1 << 63
+            and n_groups * span <= 1 << 22):
+        offset = _offsets(values, stats['min'])
+        table = np.bincount(index * span + offset,
+                            minlength=n_groups * span).reshape(n_groups, span)
+        present = table > 0
+        found = present.any(axis=1)
+        position = (present.argmax(axis=1) if func == 'min'
+                    else span - 1 - present[:, ::-1].argmax(axis=1))
+        return np.where(found, position + stats['min'],
+                        np.inf if func == 'min' else -np.inf)
+
+    ufunc, fill = ((np.minimum, np.inf) if func == 'min'
+                   else (np.maximum, -np.inf))
+    extreme = np.full(n_groups, fill)
+    ufunc.at(extreme, index, values)
+    return extreme
+
+
+class ResultWriter:
+    """Buffered appender of result rows; one per worker.
+
+    Rows are written out as a chunk whenever ``chunk_rows`` are buffered,
+    and on `flush` or `close`.
+    """
+
+    def __init__(self, store: "ResultStore"):
+        self.store = store
+        self._buffer = np.empty(store.chunk_rows, dtype=RESULT_DTYPE)
+        self._filled = 0
+        self._names: dict[int, str] = {}
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append(self, rows: np.ndarray) -> None:
+        """Append rows of `RESULT_DTYPE`."""
+        rows = np.asarray(rows, dtype=RESULT_DTYPE)
+        while len(rows):
+            take = min(len(rows), len(self._buffer) - self._filled)
+            self._buffer[self._filled:self._filled + take] = rows[:take]
+            self._filled += take
+            rows = rows[take:]
+            if self._filled == len(self._buffer):
+                self.flush()
+
+    def append_results(self, results: Iterable, settings_digest: int,
+                       strategies: Sequence[str]) -> None:
+        """Append `GameResult` rows from one `simulate` configuration.
+
+        Arguments:
+            results: Results of games between ``strategies``.
+            settings_digest: `REGISTRY` digest of the games' settings.
+            strategies: Strategy name of each seat.
+        """
+        results = list(results)
+        matchup = self._encode(matchup_name(strategies))
+        seat_codes = np.array([self._encode(name) for name in strategies]
+                              + [0], dtype=np.uint32)
+
+        rows = np.zeros(len(results), dtype=RESULT_DTYPE)
+        if not len(rows):
+            return
+        columns = np.array([(r.game, r.seed, r.winner, r.shots_to_win,
+                             r.total_shots, r.max_streak) for r in results],
+                           dtype=np.int64)
+        rows['settings'] = settings_digest
+        rows['matchup'] = matchup
+        rows['game'], rows['seed'], rows['winner'] = columns[:, :3].T
+        rows['shots_to_win'], rows['total_shots'], rows['max_streak'] = \
+            columns[:, 3:].T
+        # A draw (winner -1) indexes the trailing 0 code.
+        rows['winner_strategy'] = seat_codes[columns[:, 2]]
+        self.append(rows)
+
+    def flush(self) -> None:
+        """Write buffered rows, if any, as a new chunk."""
+        if self._filled:
+            self.store._write_chunk(self._buffer[:self._filled])
+            self._filled = 0
+        if self._names:
+            self.store._add_names(self._names)
+            self._names = {}
+
+    def close(self) -> None:
+        self.flush()
+
+    def _encode(self, name: str) -> int:
+        code = encode_name(name)
+        if code not in self.store.names:
+            self._names[code] = name
+        return code
+
+
+class ResultStore:
+    """Directory of memory-mapped result chunks.
+
+    Attributes:
+        root:           Directory holding the chunks.
+
+        chunk_rows:     Maximum rows per chunk written by this store's
+                        writers.
+
+        names:          Decoded names of strategy and matchup codes.
+    """
+
+    def __init__(self, root: Union[str, Path], chunk_rows: int = CHUNK_ROWS):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.chunk_rows = chunk_rows
+        self.names: dict[int, str] = {0: ''}
+        self._load_names()
+
+    def writer(self) -> ResultWriter:
+        return ResultWriter(self)
+
+    def append(self, rows: np.ndarray) -> None:
+        """Append rows of `RESULT_DTYPE` as one or more chunks."""
+        with self.writer() as writer:
+            writer.append(rows)
+
+    def chunk_paths(self) -> list[Path]:
+        return sorted(self.root.glob('chunk-*.npy'))
+
+    def chunks(self) -> Iterable[tuple[np.ndarray, dict]]:
+        """Yield each chunk, memory-mapped, with its zone map."""
+        for path in self.chunk_paths():
+            zone = json.loads(path.with_suffix('.json').read_text())
+            yield np.load(path, mmap_mode='r'), zone
+
+    def __len__(self) -> int:
+        return sum(zone['rows'] for _, zone in self.chunks())
+
+    def read(self, where: Optional[Mapping[str, Filter]] = None
+             ) -> np.ndarray:
+        """Return every row matching ``where`` as one in-memory array."""
+        parts = []
+        for chunk, zone in self.chunks():
+            mask = self._mask(chunk, zone, where or {})
+            if mask is not None:
+                parts.append(np.asarray(chunk[mask]))
+        return (np.concatenate(parts) if parts
+                else np.empty(0, dtype=RESULT_DTYPE))
+
+    def query(self, where: Optional[Mapping[str, Filter]] = None,
+              group_by: Sequence[str] = (),
+              agg: Optional[Mapping[str, Union[str, Sequence[str]]]] = None
+              ) -> dict[str, np.ndarray]:
+        """Filter, group and aggregate the whole store.
+
+        Arguments:
+            where: Column filters, all of which must hold. A filter is a
+                value (equality), a list, set or array of values
+                (membership) or a function of the column returning a
+                boolean mask. Strategy and matchup columns accept names.
+            group_by: Columns to group on.
+            agg: Aggregates per column, from ``count``, ``sum``, ``mean``,
+                ``min`` and ``max``.
+
+        Returns:
+            One array per group column, plus ``rows`` (rows per group) and
+            ``<column>_<aggregate>`` for each aggregate. Strategy and
+            matchup columns are decoded to names.
+        """
+        agg = {column: [funcs] if isinstance(funcs, str) else list(funcs)
+               for column, funcs in (agg or {}).items()}
+        for column, funcs in agg.items():
+            unknown = set(funcs) - set(_AGGREGATES)
+            if unknown or column not in RESULT_DTYPE.names:
+                raise ValueError(f"Cannot aggregate '{column}' by "
+                                 f"{sorted(unknown) or funcs}.")
+
+        groups: dict[tuple, dict[str, list]] = {}
+        for chunk, zone in self.chunks():
+            mask = self._mask(chunk, zone, where or {})
+            if mask is None:
+                continue
+            self._aggregate(chunk, zone, mask, list(group_by), agg, groups)
+
+        return self._finish(groups, list(group_by), agg)
+
+    def _mask(self, chunk: np.ndarray, zone: dict,
+              where: Mapping[str, Filter]) -> Optional[Any]:
+        """Boolean mask of matching rows, ``None`` if the chunk is pruned."""
+        mask: Any = slice(None)
+        for column, wanted in where.items():
+            if column not in RESULT_DTYPE.names:
+                raise KeyError(f"Unknown column '{column}'.")
+            stats = zone['columns'][column]
+
+            if callable(wanted):
+                selected = wanted(chunk[column])
+            else:
+                if isinstance(wanted, np.ndarray):
+                    wanted = wanted.ravel().tolist()
+                values = (set(wanted)
+                          if isinstance(wanted, (list, tuple, set, frozenset))
+                          else {wanted})
+                if column in _ENCODED:
+                    values = {encode_name(v) if isinstance(v, str) else v
+                              for v in values}
+                values = [v for v in sorted(values)
+                          if stats['min'] <= v <= stats['max']]
+                if stats['distinct'] is not None:
+                    values = [v for v in values if v in stats['distinct']]
+                if not values:
+                    return None
+                if (stats['distinct'] is not None
+                        and len(stats['distinct']) == len(values)):
+                    continue  # Every row of the chunk matches.
+                selected = (chunk[column] == values[0] if len(values) == 1
+                            else np.isin(chunk[column], values))
+
+            mask = selected if isinstance(mask, slice) else mask & selected
+            if not isinstance(mask, slice) and not mask.any():
+                return None
+        return mask
+
+    @staticmethod
+    def _aggregate(chunk: np.ndarray, zone: dict, mask: Any,
+                   group_by: list[str], agg: dict[str, list[str]],
+                   groups: dict[tuple, dict[str, list]]) -> None:
+        """Fold the rows of one chunk selected by ``mask`` into ``groups``."""
+        inverses, distincts = [], []
+        for column in group_by:
+            values = chunk[column][mask]
+            distinct = zone['columns'][column]['distinct']
+            if distinct is None:
+                distinct, inverse = np.unique(values, return_inverse=True)
+            else:
+                distinct = np.asarray(distinct, dtype=values.dtype)
+                inverse = _factorize(values, distinct)
+            inverses.append(inverse)
+            distincts.append(distinct)
+
+        shape = tuple(len(d) for d in distincts)
+        n_groups = int(np.prod(shape))
+        if group_by:
+            index = inverses[0]
+            for inverse, size in zip(inverses[1:], shape[1:]):
+                index = index * size + inverse
+        else:
+            index = np.zeros(chunk['game'][mask].size, dtype=np.intp)
+        rows = np.bincount(index, minlength=n_groups)
+
+        partial: dict[str, np.ndarray] = {}
+        for column, funcs in agg.items():
+            values = chunk[column][mask]
+            if {'sum', 'mean'} & set(funcs):
+                partial[f"{column}:sum"] = np.bincount(
+                    index, weights=values, minlength=n_groups)
+            for func in ('min', 'max'):
+                if func in funcs:
+                    partial[f"{column}:{func}"] = _extreme(
+                        func, index, values, n_groups,
+                        zone['columns'][column])
+
+        for g in np.flatnonzero(rows):
+            flat = np.unravel_index(g, shape) if group_by else ()
+            key = tuple(d[i].item() for d, i in zip(distincts, flat))
+            state = groups.setdefault(key, {'rows': []})
+            state['rows'].append(int(rows[g]))
+            for name, values in partial.items():
+                state.setdefault(name, []).append(values[g].item())
+
+    def _finish(self, groups: dict[tuple, dict[str, list]],
+                group_by: list[str], agg: dict[str, list[str]]
+                ) -> dict[str, np.ndarray]:
+        keys = sorted(groups)
+        out: dict[str, np.ndarray] = {}
+        for position, column in enumerate(group_by):
+            values = [key[position] for key in keys]
+            if column in _ENCODED:
+                out[column] = np.array([self.names.get(v, str(v))
+                                        for v in values], dtype=object)
+            else:
+                out[column] = np.array(values,
+                                       dtype=RESULT_DTYPE[column])
+
+        out['rows'] = np.array([sum(groups[k]['rows']) for k in keys],
+                               dtype=np.int64)
+        for column, funcs in agg.items():
+            for func in funcs:
+                if func == 'count':
+                    merged = out['rows']
+                elif func == 'min':
+                    merged = [min(groups[k][f"{column}:min"]) for k in keys]
+                elif func == 'max':
+                    merged = [max(groups[k][f"{column}:max"]) for k in keys]
+                else:
+                    merged = np.array([sum(groups[k][f"{column}:sum"])
+                                       for k in keys])
+                    if func == 'mean':
+                        merged = merged / out['rows']
+                out[f"{column}_{func}"] = np.asarray(merged)
+        return out
+
+    def _write_chunk(self, rows: np.ndarray) -> None:
+        columns = {}
+        for column in RESULT_DTYPE.names:
+            values = rows[column]
+            low, high = values.min().item(), values.max().item()
+            if high - low < _MAX_DISTINCT:
+                counts = np.bincount(_offsets(values, low))
+                distinct = [low + offset
+                            for offset in np.flatnonzero(counts).tolist()]
+            elif column in _ENCODED or column == 'settings':
+                distinct = np.unique(values)
+                distinct = (distinct.tolist()
+                            if len(distinct) <= _MAX_DISTINCT else None)
+            else:
+                distinct = None
+            columns[column] = {'min': low, 'max': high, 'distinct': distinct}
+
+        stem = self.root / f"chunk-{uuid.uuid4().hex}"
+        zone = stem.with_suffix('.json')
+        zone.write_text(json.dumps({'rows': len(rows), 'columns': columns}))
+        # Publish the data last, atomically, so readers never see a partial
+        # chunk or a chunk without its zone map.
+        partial = stem.with_suffix('.npy.tmp')
+        with open(partial, 'wb') as file:
+            np.save(file, rows)
+        os.replace(partial, stem.with_suffix('.npy'))
+
+    def _add_names(self, names: Mapping[int, str]) -> None:
+        with open(self.root / 'names.jsonl', 'a') as file:
+            for code, name in names.items():
+                file.write(json.dumps([code, name]) + '\n')
+        self.names.update(names)
+
+    def _load_names(self) -> None:
+        path = self.root / 'names.jsonl'
+        if path.exists():
+            with open(path) as file:
+                for line in file:
+                    code, name = json.loads(line)
+                    self.names[code] = name
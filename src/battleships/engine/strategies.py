@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Targeting strategies used by computer players.
+
+A strategy aims at one opponent board. It proposes the next cell to shoot
+with `Strategy.next_shot` and is told the outcome through
+`Strategy.observe`; between the two it keeps its own knowledge of the
+opponent board using the cell states of `src.battleships.domain.board`.
+
+Strategies are looked up by name, so command-line tools and result stores can
+refer to them as plain strings.
+
+Attributes:
+    STRATEGIES (dict[str, type[Strategy]]): Registered strategies by name.
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/engine/strategies.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from functools import lru_cache
+from typing import ClassVar, Optional, Sequence
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.domain.board import EMPTY, HIT
+from src.battleships.settings import BoardSettings, FleetSettings
+
+# Module-level constants
+STRATEGIES: dict[str, type['Strategy']] = {}
+
+__all__ = ['Strategy', 'RandomStrategy', 'HuntTargetStrategy',
+           'ParityStrategy', 'STRATEGIES', 'register_strategy', 'get_strategy']
+
+
+def register_strategy(cls: type['Strategy']) -> type['Strategy']:
+    """Class decorator adding a strategy to `STRATEGIES` under its name."""
+    STRATEGIES[cls.name] = cls
+    return cls
+
+
+def get_strategy(name: str) -> type['Strategy']:
+    """Return the strategy registered as ``name``."""
+    try:
+        return STRATEGIES[name]
+    except KeyError:
+        raise KeyError(f"Unknown strategy '{name}'. Choose from: "
+                       f"{sorted(STRATEGIES)}") from None
+
+
+class Strategy:
+    """Base class for targeting strategies.
+
+    Attributes:
+        knowledge:      Flat cell states observed so far on the opponent
+                        board (``EMPTY`` where unknown).
+
+        remaining:      Sizes of the opponent ships not yet sunk.
+
+        fleet:          Placement rules the opponent's ships obey.
+    """
+    name: ClassVar[str] = ''
+
+    def __init__(self, board: BoardSettings, sizes: Sequence[int],
+                 rng: np.random.Generator,
+                 fleet: Optional[FleetSettings] = None):
+        """Prepare to aim at an empty board holding ships of ``sizes``."""
+        self.fleet = fleet or FleetSettings()
+        self.height = board.height
+        self.width = board.width
+        self.rng = rng
+        self.knowledge = np.zeros(board.height * board.width, dtype=np.int8)
+        self.remaining = sorted(sizes)
+
+    def next_shot(self) -> int:
+        """Return the flat index of the next cell to shoot."""
+        raise NotImplementedError
+
+    def observe(self, cell: int, result: int,
+                sunk: Optional[int] = None) -> None:
+        """Record the ``result`` of shooting ``cell``.
+
+        Arguments:
+            cell: Flat index of the cell shot.
+            result: Cell state after the shot (``MISS``, ``HIT`` or
+                ``SUNK``).
+            sunk: Size of the ship sunk by this shot, if any.
+        """
+        self.knowledge[cell] = result
+        if sunk is not None:
+            self.remaining.remove(sunk)
+
+
+@register_strategy
+class RandomStrategy(Strategy):
+    """Shoots every cell once, in a random order."""
+    name = 'random'
+
+    def __init__(self, board: BoardSettings, sizes: Sequence[int],
+                 rng: np.random.Generator,
+                 fleet: Optional[FleetSettings] = None):
+        super().__init__(board, sizes, rng, fleet)
+        self._order = rng.permutation(self.knowledge.size).tolist()
+
+    def next_shot(self) -> int:
+        knowledge = self.knowledge
+        while True:
+            cell = self._order.pop()
+            if knowledge[cell] == EMPTY:
+                return cell
+
+
+@register_strategy
+class HuntTargetStrategy(Strategy):
+    """Random hunting; after a hit, works through the hit's neighbours."""
+    name = 'hunt'
+
+    def __init__(self, board: BoardSettings, sizes: Sequence[int],
+                 rng: np.random.Generator,
+                 fleet: Optional[FleetSettings] = None):
+        super().__init__(board, sizes, rng, fleet)
+        self._order = rng.permutation(self.knowledge.size).tolist()
+        self._targets: list[int] = []
+
+    def next_shot(self) -> int:
+        knowledge = self.knowledge
+        while self._targets:
+            cell = self._targets.pop()
+            if knowledge[cell] == EMPTY:
+                return cell
+
+        while True:
+            cell = self._order.pop()
+            if knowledge[cell] == EMPTY:
+                return cell
+
+    def observe(self, cell: int, result: int,
+                sunk: Optional[int] = None) -> None:
+        super().observe(cell, result, sunk)
+        if result != HIT:
+            return
+
+        row, col = divmod(cell, self.width)
+        if row > 0:
+            self._targets.append(cell - self.width)
+        if row < self.height - 1:
+            self._targets.append(cell + self.width)
+        if col > 0:
+            self._targets.append(cell - 1)
+        if col < self.width - 1:
+            self._targets.append(cell + 1)
+
+
+@lru_cache(maxsize=None)
+def _lattice(board: BoardSettings, k: int) -> tuple[int, ...]:
+    """Flat cells with ``(row + col) % k == 0``, in a fixed scattered order."""
+    rows, cols = np.divmod(np.arange(board.height * board.width), board.width)
+    cells = np.flatnonzero((rows + cols) % k == 0)
+    order = np.random.default_rng(k).permutation(len(cells))
+    return tuple(cells[order].tolist())
+
+
+@register_strategy
+class ParityStrategy(Strategy):
+    """Hunts on the parity lattice of the smallest ship afloat.
+
+    While hunting it only shoots cells with ``(row + col) % k == 0``, where
+    ``k`` is the smallest remaining size, since every horizontal or vertical
+    placement of ``k`` cells covers one of them. Each game walks the cached
+    lattice of its board from a random starting point. After a hit it works
+    through the hit's neighbours, and once no hit is left unsunk it drops
+    whatever is still queued.
+
+    Diagonal placements can miss the lattice entirely, so when a lattice is
+    exhausted with ships still afloat the strategy falls back to every cell.
+    Cells already shot are skipped by looking them up in ``knowledge``, so
+    each move costs O(1) amortised, whatever the size of the board.
+    """
+    name = 'parity'
+
+    def __init__(self, board: BoardSettings, sizes: Sequence[int],
+                 rng: np.random.Generator,
+                 fleet: Optional[FleetSettings] = None):
+        super().__init__(board, sizes, rng, fleet)
+        self._board = board
+        self._open_hits = 0
+        self._targets: list[int] = []
+        self._start = int(rng.integers(self.knowledge.size))
+
+        self._steps = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        if self.fleet.can_place_along_strict_diagonal:
+            self._steps += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        self._use_lattice(self.remaining[0] if self.remaining else 1)
+
+    def _use_lattice(self, k: int) -> None:
+        self._k = k
+        self._lattice = _lattice(self._board, k)
+        self._offset = self._start % len(self._lattice)
+        self._position = 0
+
+    def next_shot(self) -> int:
+        knowledge, targets = self.knowledge, self._targets
+        while targets:
+            cell = targets.pop()
+            if knowledge[cell] == EMPTY:
+                return cell
+
+        while True:
+            lattice, n = self._lattice, len(self._lattice)
+            while self._position < n:
+                cell = lattice[(self._offset + self._position) % n]
+                self._position += 1
+                if knowledge[cell] == EMPTY:
+                    return cell
+            if self._k == 1:
+                raise RuntimeError("Every cell has already been shot.")
+            self._use_lattice(1)
+
+    def observe(self, cell: int, result: int,
+                sunk: Optional[int] = None) -> None:
+        super().observe(cell, result, sunk)
+
+        if result == HIT:
+            self._open_hits += 1
+            row, col = divmod(cell, self.width)
+            for dr, dc in self._steps:
+                r, c = row + dr, col + dc
+                if 0 <= r < self.height and 0 <= c < self.width:
+                    neighbour = r * self.width + c
+                    if self.knowledge[neighbour] == EMPTY:
+                        self._targets.append(neighbour)
+            return
+
+        if sunk is not None:
+            self._open_hits = max(self._open_hits - (sunk - 1), 0)
+            if not self._open_hits:
+                self._targets.clear()
+            if (self.remaining and self._k != 1
+                    and self.remaining[0] != self._k):
+                self._use_lattice(self.remaining[0])
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Opt-in timers and counters for the game engine's hot paths.
+
+Instrumentation is off by default and then costs nothing: no call site in the
+engine checks a flag. `enable` wraps each probed function or method in place
+with a timing shim and `disable` puts the originals back, so a disabled
+engine runs exactly the code it would run without this module.
+
+Probes cover `Board` (ship placement and shot resolution), `Fleet.create`,
+random fleet placement, every registered strategy's targeting calls,
+`Arena.fire` and `REGISTRY.intern`. Each probe feeds a log-bucketed
+`Histogram` of monotonic ``perf_counter_ns`` durations and a call counter.
+Further counters record shots, validations and interning cache hits and
+misses. ``enable(memory=True)`` also traces allocations with `tracemalloc`
+and records the peak bytes allocated during each move; tracing slows every
+allocation, so it is off unless asked for.
+
+Probes record into the process that runs them. `simulate` merges what its
+worker processes recorded into `INSTRUMENTS` with each chunk of results;
+the ``caches`` section of `stats` still covers the calling process only.
+
+Attributes:
+    INSTRUMENTS (Instrumentation): Process-wide collector used by `enable`,
+        `disable`, `stats` and `dump`.
+
+Examples:
+    Profile a batch of games::
+
+        >>> enable()
+        >>> simulate(settings, fleet, ['hunt', 'random'], 1000, progress=None)
+        >>> dump('stats.json')
+        >>> disable()
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/instrumentation.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import functools
+import json
+from pathlib import Path
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Optional
+
+# Third-party imports
+
+# Local application imports
+
+# Module-level constants
+_BUCKETS = 64
+_NO_MIN = 1 << (_BUCKETS - 1)
+
+__all__ = ['Histogram', 'Instrumentation', 'INSTRUMENTS', 'enable',
+           'disable', 'stats', 'dump']
+
+
+class Histogram:
+    """Histogram of non-negative integers in power-of-two buckets.
+
+    Bucket ``b`` counts values whose bit length is ``b``, i.e. values in
+    ``[2 ** (b - 1), 2 ** b)``. Percentiles are reported as the upper edge
+    of the bucket they fall in.
+    """
+    __slots__ = ('buckets', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget every recorded value, keeping this object in place."""
+        self.buckets = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min = _NO_MIN
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        if value < 0:
+            value = 0
+        elif value >= _NO_MIN:
+            value = _NO_MIN - 1
+        self.buckets[value.bit_length()] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "Histogram") -> None:
+        """Add the values recorded by ``other``."""
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> int:
+        """Upper bucket edge below which ``q`` of the values fall."""
+        rank, seen = q * self.count, 0
+        for bucket, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                return (1 << bucket) - 1
+        return 0
+
+    def summary(self) -> dict[str, Any]:
+        return {'count': self.count,
+                'total': self.total,
+                'mean': self.total / self.count if self.count else 0.0,
+                'min': self.min if self.count else None,
+                'max': self.max if self.count else None,
+                'p50': self.percentile(0.50),
+                'p90': self.percentile(0.90),
+                'p99': self.percentile(0.99)}
+
+
+class Instrumentation:
+    """Collector of timers and counters, with probe installation.
+
+    Attributes:
+        enabled:        ``True`` while probes are installed.
+
+        timers:         Histogram of nanosecond durations per probe.
+
+        counters:       Named event counts.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.timers: dict[str, Histogram] = {}
+        self.counters: dict[str, int] = {}
+        self._patched: list[tuple[Any, str, Any, bool]] = []
+        self._tracing = False
+        self._dumper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # Guards every histogram and counter; worker threads record at once.
+        self._lock = threading.Lock()
+        # Names of the probes running in the current thread.
+        self._active = threading.local()
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def timer(self, name: str) -> Histogram:
+        with self._lock:
+            histogram = self.timers.get(name)
+            if histogram is None:
+                histogram = self.timers[name] = Histogram()
+            return histogram
+
+    def reset(self) -> None:
+        """Discard everything recorded so far.
+
+        Histograms are cleared in place, since installed probes hold them.
+        """
+        with self._lock:
+            for histogram in self.timers.values():
+                histogram.clear()
+            self.counters.clear()
+
+    def drain(self) -> tuple[dict[str, Histogram], dict[str, int]]:
+        """Return what was recorded since the last drain, then `reset`.
+
+        Used by worker processes to ship their records to `merge`.
+        """
+        timers = {}
+        with self._lock:
+            for name, histogram in self.timers.items():
+                if histogram.count:
+                    timers[name] = copy = Histogram()
+                    copy.merge(histogram)
+                    histogram.clear()
+            counters = dict(self.counters)
+            self.counters.clear()
+        return timers, counters
+
+    def merge(self, timers: dict[str, Histogram],
+              counters: dict[str, int]) -> None:
+        """Add records returned by `drain` in another process."""
+        for name, histogram in timers.items():
+            timer = self.timer(name)
+            with self._lock:
+                timer.merge(histogram)
+        for name, n in counters.items():
+            self.count(name, n)
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of every timer, counter and cache."""
+        from src.battleships.engine import placement
+
+        cache = placement._placements.cache_info()
+        return {'enabled': self.enabled,
+                'timers_ns': {name: h.summary()
+                              for name, h in sorted(self.timers.items())},
+                'counters': dict(sorted(self.counters.items())),
+                'caches': {'placements': {'hits': cache.hits,
+                                          'misses': cache.misses,
+                                          'size': cache.currsize}}}
+
+    def dump(self, path: Path) -> None:
+        """Write `stats` to ``path`` as JSON."""
+        Path(path).write_text(json.dumps(self.stats(), indent=2))
+
+    def start_dumping(self, path: Path, interval: float = 10.0) -> None:
+        """Dump to ``path`` every ``interval`` seconds until `stop_dumping`."""
+        self.stop_dumping()
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.wait(interval):
+                self.dump(path)
+
+        self._dumper = threading.Thread(target=loop, daemon=True,
+                                        name='InstrumentationDump')
+        self._dumper.start()
+
+    def stop_dumping(self) -> None:
+        if self._dumper is not None:
+            self._stop.set()
+            self._dumper.join()
+            self._dumper = None
+
+    def enable(self, memory: bool = False) -> None:
+        """Install every probe. Calling it again has no effect.
+
+        Arguments:
+            memory: Also record ``move.peak_bytes``, the peak bytes
+                allocated during each move, by tracing with `tracemalloc`.
+        """
+        if self.enabled:
+            return
+
+        from src.battleships.domain.board import Board
+        from src.battleships.domain.fleet import Fleet
+        from src.battleships.domain.registry import REGISTRY
+        from src.battleships.domain.turns import Arena
+        from src.battleships.engine import placement
+        from src.battleships.engine.strategies import STRATEGIES
+
+        self._wrap(Board, 'place_ship', 'board.place_ship',
+                   counter='validations')
+        self._wrap(Board, 'receive_shot', 'board.receive_shot',
+                   counter='shots')
+        self._wrap(Fleet, 'create', 'fleet.create', counter='validations',
+                   is_classmethod=True)
+        self._wrap_function(placement, 'random_layout',
+                            'placement.random_layout')
+        for attr in ('next_shot', 'observe'):
+            # Wrap each class that defines the method once; inherited
+            # copies would shadow, and re-time, their base's probe.
+            owners = {next(k for k in cls.__mro__ if attr in vars(k))
+                      for cls in STRATEGIES.values()}
+            for owner in owners:
+                self._wrap(owner, attr, f"targeting.{attr}", nested=True)
+        self._wrap_arena(Arena, memory)
+        self._wrap_intern(REGISTRY)
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Remove every probe, restoring the original functions."""
+        for owner, attr, original, owned in reversed(self._patched):
+            if owned:
+                setattr(owner, attr, original)
+            else:
+                delattr(owner, attr)
+        self._patched.clear()
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+        self.enabled = False
+
+    def _install(self, owner: Any, attr: str, replacement: Any) -> None:
+        owned = attr in vars(owner)
+        original = vars(owner)[attr] if owned else None
+        self._patched.append((owner, attr, original, owned))
+        setattr(owner, attr, replacement)
+
+    def _shim(self, func: Callable, name: str, counter: Optional[str],
+              nested: bool = False) -> Callable:
+        """Wrap ``func`` to record into the probe ``name``.
+
+        With ``nested``, a call made while the same probe is already running
+        in this thread, such as an override calling ``super()``, is not
+        recorded again.
+        """
+        histogram = self.timer(name)
+        counters, lock, local = self.counters, self._lock, self._active
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                with lock:
+                    histogram.record(elapsed)
+                    if counter is not None:
+                        counters[counter] = counters.get(counter, 0) + 1
+
+        if not nested:
+            return timed
+
+        @functools.wraps(func)
+        def timed_once(*args, **kwargs):
+            active = local.__dict__
+            if name in active:
+                return func(*args, **kwargs)
+            active[name] = True
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                del active[name]
+                with lock:
+                    histogram.record(elapsed)
+                    if counter is not None:
+                        counters[counter] = counters.get(counter, 0) + 1
+
+        return timed_once
+
+    def _wrap(self, owner: type, attr: str, name: str,
+              counter: Optional[str] = None,
+              is_classmethod: bool = False, nested: bool = False) -> None:
+        if is_classmethod:
+            func = vars(owner)[attr].__func__
+            self._install(owner, attr, classmethod(
+                self._shim(func, name, counter, nested)))
+        else:
+            self._install(owner, attr, self._shim(
+                getattr(owner, attr), name, counter, nested))
+
+    def _wrap_function(self, module: Any, attr: str, name: str) -> None:
+        """Wrap a module-level function, including copies imported by name."""
+        original = getattr(module, attr)
+        timed = self._shim(original, name, None)
+        for loaded in list(sys.modules.values()):
+            if (getattr(loaded, '__name__', '').startswith('src.battleships')
+                    and vars(loaded).get(attr) is original):
+                self._install(loaded, attr, timed)
+
+    def _wrap_arena(self, arena: type, memory: bool) -> None:
+        """Time `Arena.fire` and, if ``memory``, its peak allocation."""
+        if not memory:
+            self._wrap(arena, 'fire', 'resolution.fire')
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        fire = arena.fire
+        histogram = self.timer('resolution.fire')
+        peaks = self.timer('move.peak_bytes')
+        clock, traced = time.perf_counter_ns, tracemalloc.get_traced_memory
+        lock = self._lock
+
+        @functools.wraps(fire)
+        def timed(*args, **kwargs):
+            tracemalloc.reset_peak()
+            before, start = traced()[0], clock()
+            try:
+                return fire(*args, **kwargs)
+            finally:
+                elapsed, peak = clock() - start, traced()[1] - before
+                with lock:
+                    histogram.record(elapsed)
+                    peaks.record(peak)
+
+        self._install(arena, 'fire', timed)
+
+    def _wrap_intern(self, registry: Any) -> None:
+        """Count `SpecRegistry.intern` cache hits and misses."""
+        intern = registry.intern
+        histogram = self.timer('registry.intern')
+        counters, clock = self.counters, time.perf_counter_ns
+        lock = self._lock
+
+        @functools.wraps(intern)
+        def timed(model):
+            size, start = len(registry), clock()
+            try:
+                return intern(model)
+            finally:
+                elapsed = clock() - start
+                key = ('intern.misses' if len(registry) > size
+                       else 'intern.hits')
+                with lock:
+                    histogram.record(elapsed)
+                    counters[key] = counters.get(key, 0) + 1
+
+        self._install(registry, 'intern', timed)
+
+
+INSTRUMENTS = Instrumentation()
+
+
+def enable(memory: bool = False) -> None:
+    """Install the probes of `INSTRUMENTS`."""
+    INSTRUMENTS.enable(memory)
+
+
+def disable() -> None:
+    """Remove the probes of `INSTRUMENTS`."""
+    INSTRUMENTS.disable()
+
+
+def stats() -> dict[str, Any]:
+    """Snapshot of `INSTRUMENTS`."""
+    return INSTRUMENTS.stats()
+
+
+def dump(path: Path) -> None:
+    """Write the stats of `INSTRUMENTS` to ``path`` as JSON."""
+    INSTRUMENTS.dump(path)
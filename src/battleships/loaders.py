@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Load settings and fleets from the YAML files in ``config/``.
+
+Attributes:
+    CONFIG_DIR (Path): Directory holding the bundled YAML configuration.
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/loaders.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+from pathlib import Path
+from typing import Optional
+
+# Third-party imports
+import yaml
+
+# Local application imports
+from src.battleships.domain.fleet import Fleet
+from src.battleships.domain.ship import ShipSpec
+from src.battleships.settings import FleetSettings, GameSettings
+
+# Module-level constants
+CONFIG_DIR = Path(__file__).resolve().parent / 'config'
+
+__all__ = ['CONFIG_DIR', 'load_game_settings', 'load_fleet', 'fleet_ships']
+
+
+def load_game_settings(path: Optional[Path] = None) -> GameSettings:
+    """Read `GameSettings` from ``path``, or return the defaults.
+
+    The file maps ``Fleet``, ``Board`` and ``Player`` to the fields of the
+    matching settings class; omitted sections keep their defaults.
+    """
+    if path is None:
+        return GameSettings()
+
+    return GameSettings.model_validate(
+        yaml.safe_load(Path(path).read_text()) or {})
+
+
+def load_fleet(settings: FleetSettings,
+               fleet_path: Path = CONFIG_DIR / 'fleet.yml',
+               rosters_path: Path = CONFIG_DIR / 'rosters.yml') -> Fleet:
+    """Build the validated, interned `Fleet` described by ``fleet_path``."""
+    fleet = yaml.safe_load(Path(fleet_path).read_text())
+    rosters = yaml.safe_load(Path(rosters_path).read_text())
+
+    roster_id = fleet['roster']
+    if roster_id not in rosters:
+        raise KeyError(f"Roster id [{roster_id}] not found.")
+
+    return Fleet.create(
+        settings=settings,
+        id=roster_id,
+        roster=dict(id=roster_id, **rosters[roster_id]),
+        counts={name: ship['quantity']
+                for name, ship in fleet['ships'].items()})
+
+
+def fleet_ships(fleet: Fleet) -> list[tuple[str, ShipSpec]]:
+    """Expand ``fleet`` into one ``(name, spec)`` entry per ship."""
+    return [(name, spec)
+            for name, spec in fleet.roster.roster.items()
+            for _ in range(fleet.count(name))]
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Buffered and diff-based terminal rendering of board grids.
+
+`render_frame` formats one or more grids, side by side, into a single string
+so a frame costs one write instead of one `print` per row. `BoardRenderer`
+adds a live mode for spectating: after the first full frame it emits only
+the cells that changed since the previous frame, as ANSI cursor moves,
+skips frames that arrive faster than ``max_fps``, and caches each formatted
+row so unchanged rows are never re-formatted.
+
+Grids hold the cell states of `src.battleships.domain.board`; a symbol table
+maps each state to the character drawn for it.
+
+Attributes:
+    DIGITS (str): Symbol of each cell state as its digit, matching the
+        historical output of `Board.show`.
+
+    GLYPHS (str): Symbol of each cell state for live spectating, in state
+        order: empty, ship, miss, hit, sunk.
+
+Examples:
+    Spectate several games, redrawing as fast as allowed::
+
+        >>> renderer = BoardRenderer(max_fps=20)
+        >>> while playing:
+        ...     renderer.draw([board.grid for board in boards])
+
+References:
+    Style guide: `Google Python Style Guide`_
+
+Notes:
+    File version
+        0.1.0
+    Project
+        SimpleGames
+    Path
+        src/battleships/render.py
+    Author
+        Cameron Aidan McEleney < c.mceleney.1@research.gla.ac.uk >
+    Created
+        19 Oct 2026
+    IDE
+        PyCharm
+
+.. _Google Python Style Guide:
+   https://google.github.io/styleguide/pyguide.html
+"""
+
+from __future__ import annotations
+
+# Standard library imports
+import sys
+import time
+from typing import Optional, Sequence, TextIO
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+
+# Module-level constants
+DIGITS: str = '01234'
+GLYPHS: str = '~#o*X'
+
+_CLEAR = '\x1b[2J\x1b[H'
+_HIDE_CURSOR = '\x1b[?25l'
+
+__all__ = ['render_frame', 'BoardRenderer', 'DIGITS', 'GLYPHS']
+
+
+def _format_row(row: np.ndarray, symbols: str) -> str:
+    return ' '.join([symbols[state] for state in row.tolist()])
+
+
+def render_frame(grids: Sequence[np.ndarray], symbols: str = DIGITS,
+                 gap: int = 4) -> str:
+    """Format ``grids`` side by side as one newline-terminated string."""
+    renderer = BoardRenderer(symbols=symbols, gap=gap)
+    return renderer.frame(grids)
+
+
+class BoardRenderer:
+    """Renderer of one or more grids, with an optional live diff mode.
+
+    Attributes:
+        stream:         Where frames are written.
+
+        symbols:        Character drawn for each cell state, indexed by
+                        state.
+
+        gap:            Columns of space between neighbouring boards.
+
+        max_fps:        Frames per second above which `draw` drops frames.
+
+        live:           If ``True``, frames after the first are drawn as
+                        in-place cell updates.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None,
+                 symbols: str = DIGITS, gap: int = 4,
+                 max_fps: float = 30.0, live: bool = True):
+        self.stream = stream
+        self.symbols = symbols
+        self.gap = gap
+        self.max_fps = max_fps
+        self.live = live
+
+        self._previous: Optional[list[np.ndarray]] = None
+        self._rows: list[list[str]] = []
+        self._offsets: list[int] = []
+        self._last_draw = float('-inf')
+
+    def frame(self, grids: Sequence[np.ndarray]) -> str:
+        """Format a full frame, re-formatting only rows that changed."""
+        self._update_rows(grids)
+
+        height = max(len(rows) for rows in self._rows)
+        padding = [' ' * (2 * grid.shape[1] - 1) for grid in grids]
+        spacer = ' ' * self.gap
+        lines = []
+        for r in range(height):
+            lines.append(spacer.join(
+                rows[r] if r < len(rows) else padding[i]
+                for i, rows in enumerate(self._rows)).rstrip())
+        return '\n'.join(lines) + '\n'
+
+    def draw(self, grids: Sequence[np.ndarray], force: bool = False) -> bool:
+        """Write a frame of ``grids`` in one write.
+
+        Returns:
+            ``False`` if the frame was dropped to respect ``max_fps``.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_draw < 1.0 / self.max_fps:
+            return False
+        self._last_draw = now
+
+        stream = self.stream or sys.stdout
+        if not self.live or not self._same_layout(grids):
+            text = self.frame(grids)
+            if self.live:
+                text = _HIDE_CURSOR + _CLEAR + text
+        else:
+            text = self._diff(grids)
+
+        if text:
+            stream.write(text)
+            stream.flush()
+        return True
+
+    def _same_layout(self, grids: Sequence[np.ndarray]) -> bool:
+        return (self._previous is not None
+                and len(grids) == len(self._previous)
+                and all(g.shape == p.shape
+                        for g, p in zip(grids, self._previous)))
+
+    def _update_rows(self, grids: Sequence[np.ndarray]) -> None:
+        """Refresh cached row strings and the previous-frame snapshot."""
+        if not self._same_layout(grids):
+            self._rows = [[_format_row(row, self.symbols) for row in grid]
+                          for grid in grids]
+            self._offsets = []
+            offset = 0
+            for grid in grids:
+                self._offsets.append(offset)
+                offset += 2 * grid.shape[1] - 1 + self.gap
+            self._previous = [grid.copy() for grid in grids]
+            return
+
+        for rows, grid, previous in zip(self._rows, grids, self._previous):
+            for r in np.flatnonzero((grid != previous).any(axis=1)):
+                rows[r] = _format_row(grid[r], self.symbols)
+            previous[...] = grid
+
+    def _diff(self, grids: Sequence[np.ndarray]) -> str:
+        """ANSI cursor moves redrawing only the cells changed since last."""
+        parts = []
+        symbols = self.symbols
+        for index, (grid, previous) in enumerate(zip(grids, self._previous)):
+            changed = np.argwhere(grid != previous)
+            if not len(changed):
+                continue
+            offset, rows = self._offsets[index], self._rows[index]
+            for r, c in changed.tolist():
+                state = grid[r, c]
+                parts.append(f"\x1b[{r + 1};{offset + 2 * c + 1}H"
+                             f"{symbols[state]}")
+            for r in np.unique(changed[:, 0]).tolist():
+                rows[r] = _format_row(grid[r], symbols)
+            previous[...] = grid
+
+        if parts:
+            height = max(len(rows) for rows in self._rows)
+            # Park the cursor below the boards.
+            parts.append(f"\x1b[{height + 1};1H")
+        return ''.join(parts)
@@ -0,0 +1,66 @@
+"""Tests for `src.battleships.engine.feasibility`."""
+
+# Standard library imports
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from src.battleships.engine.feasibility import (check_feasibility,
+                                                check_fleet, ensure_feasible)
+from src.battleships.loaders import fleet_ships, load_fleet
+from src.battleships.settings import BoardSettings, FleetSettings, \
+    GameSettings
+
+
+def _assert_witness(layout, sizes, board):
+    assert layout.shape == (board.height * board.width,)
+    for index, size in enumerate(sizes):
+        rows, cols = np.divmod(np.flatnonzero(layout == index), board.width)
+        assert len(rows) == size
+        # Every ship covers one straight, unbroken run of cells.
+        assert (rows == rows[0]).all() or (cols == cols[0]).all()
+        line = cols if (rows == rows[0]).all() else rows
+        np.testing.assert_array_equal(np.diff(line), np.ones(size - 1))
+
+
+def test_default_fleet_fits_with_a_witness_layout():
+    settings = GameSettings()
+    fleet = load_fleet(settings.Fleet)
+    sizes = [spec.size for _, spec in fleet_ships(fleet)]
+
+    verdict = check_fleet(fleet, settings)
+
+    assert verdict.feasible
+    _assert_witness(verdict.layout, sizes, settings.Board)
+    ensure_feasible(fleet, settings)
+
+
+def test_tightly_packed_board_is_feasible():
+    board = BoardSettings(width=4, height=3)
+    sizes = [4, 4, 2, 2]
+
+    verdict = check_feasibility(sizes, board, FleetSettings())
+
+    assert verdict.feasible
+    _assert_witness(verdict.layout, sizes, board)
+
+
+@pytest.mark.parametrize('sizes', [[4] * 5, [5], [2] * 9])
+def test_fleets_that_cannot_fit_are_infeasible(sizes):
+    board = BoardSettings(width=4, height=4)
+
+    verdict = check_feasibility(sizes, board, FleetSettings())
+
+    assert verdict.feasible is False
+    assert verdict.layout is None
+    assert verdict.reason
+
+
+def test_ensure_feasible_raises_for_an_oversized_fleet():
+    settings = GameSettings(Board=BoardSettings(width=3, height=3))
+    fleet = load_fleet(settings.Fleet)
+
+    with pytest.raises(ValueError):
+        ensure_feasible(fleet, settings)
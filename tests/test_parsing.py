@@ -0,0 +1,52 @@
+"""Tests for `src.battleships.domain.parsing`."""
+
+# Standard library imports
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from src.battleships.domain.coordinates import Placement
+from src.battleships.domain.parsing import (parse_a1, to_a1, parse_coords,
+                                            parse_cells, parse_batch)
+
+
+def test_both_notations_give_the_same_cells():
+    np.testing.assert_array_equal(parse_cells('((0, 0), (1, 2))', 10, 10),
+                                  [0, 12])
+    np.testing.assert_array_equal(parse_cells('A1 b3', 10, 10), [0, 12])
+
+
+def test_a1_round_trips_past_z():
+    for row, col in [(0, 0), (25, 9), (26, 0), (701, 3)]:
+        assert parse_a1(to_a1(row, col)) == (row, col)
+
+
+@pytest.mark.parametrize('text', ['(1.5, 2.0)', '((0, 0), (1, x))',
+                                  '((0, 0), (1))', 'A0', 'A1 (0, 1)'])
+def test_malformed_input_is_rejected(text):
+    with pytest.raises(ValueError):
+        parse_coords(text)
+
+
+def test_out_of_bounds_cells_are_rejected():
+    with pytest.raises(ValueError):
+        parse_cells('((0, 10))', width=10, height=10)
+
+
+def test_parse_batch_offsets_index_each_string():
+    cells, offsets = parse_batch(['((0, 0), (0, 1))', 'C1', '', 'A2 A3'],
+                                 width=10, height=10)
+
+    np.testing.assert_array_equal(offsets, [0, 2, 3, 3, 5])
+    np.testing.assert_array_equal(cells, [0, 1, 20, 1, 2])
+
+
+def test_placement_gives_one_cell_list_per_ship():
+    placement = Placement(position=['((0, 0), (0, 1))',
+                                    '((2, 0), (3, 0), (4, 0))'])
+
+    assert placement.positions == [[(0, 0), (0, 1)],
+                                   [(2, 0), (3, 0), (4, 0)]]
+    assert Placement(position='A1 A2').positions == [[(0, 0), (0, 1)]]
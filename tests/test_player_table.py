@@ -0,0 +1,66 @@
+"""Tests for `src.battleships.domain.player.PlayerTable`."""
+
+# Standard library imports
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from src.battleships.domain.player import PlayerTable
+from src.battleships.settings import BoardSettings
+
+
+def test_shots_are_recorded_per_player():
+    table = PlayerTable(BoardSettings(width=10, height=10), capacity=2)
+    for name in 'abc':
+        table.add(name, ships_afloat=2)
+
+    table.record_shots([0, 2], [5, 99], [True, False])
+    table.record_shots([0], [70], [True])
+
+    np.testing.assert_array_equal(table.shots_used[:3], [2, 0, 1])
+    np.testing.assert_array_equal(table.streak[:3], [2, 0, 0])
+    np.testing.assert_array_equal(table.guessed_cells(0), [5, 70])
+    np.testing.assert_array_equal(
+        table.has_guessed([0, 0, 1, 2], [70, 99, 5, 99]),
+        [True, False, False, True])
+    np.testing.assert_array_equal(table.out_of_shots(2), [True, False, False])
+
+
+def test_table_grows_without_losing_state():
+    table = PlayerTable(BoardSettings(width=10, height=10), capacity=1)
+    table.add('a', ships_afloat=1, slot=(3, 7))
+    table.record_shots([0], [64], [False])
+
+    table.add('b', ships_afloat=1)
+
+    assert table.capacity == 2
+    assert table[0].slot == (3, 7)
+    assert table[1].slot is None
+    assert table[0].has_guessed(6, 4)
+
+
+def test_sinking_removes_players():
+    table = PlayerTable(BoardSettings(width=10, height=10))
+    table.add('a', ships_afloat=2)
+    table.add('b', ships_afloat=1)
+
+    table.sink([0, 1, 0])
+
+    assert table.n_alive == 0
+    np.testing.assert_array_equal(table.alive, [False, False])
+
+
+def test_views_proxy_rows():
+    table = PlayerTable(BoardSettings(width=10, height=10))
+    table.add('a', ships_afloat=1)
+
+    player = table[-1]
+    player.record_shot(1, 2, hit=True)
+
+    assert player.name == 'a'
+    assert player.guesses == [(1, 2)]
+    assert table.streak[0] == 1
+    with pytest.raises(IndexError):
+        table[1]
@@ -0,0 +1,30 @@
+"""Tests for `src.battleships.domain.registry`."""
+
+# Third-party imports
+from pydantic import BaseModel, ConfigDict
+
+# Local application imports
+from src.battleships.domain.registry import REGISTRY
+from src.battleships.domain.ship import ShipSpec
+
+
+def _spec_class() -> type[BaseModel]:
+    class Spec(BaseModel):
+        model_config = ConfigDict(frozen=True)
+        size: int = 3
+
+    return Spec
+
+
+def test_equal_models_share_one_instance():
+    first, second = ShipSpec(size=4), ShipSpec(size=4)
+    assert REGISTRY.intern(first) is REGISTRY.intern(second)
+    assert REGISTRY.digest(first) == REGISTRY.digest(second)
+
+
+def test_same_qualname_classes_do_not_collide():
+    one, other = _spec_class(), _spec_class()
+    assert one.__qualname__ == other.__qualname__
+
+    assert type(REGISTRY.intern(one())) is one
+    assert type(REGISTRY.intern(other())) is other
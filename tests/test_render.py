@@ -0,0 +1,56 @@
+"""Tests for `src.battleships.render`."""
+
+# Standard library imports
+import io
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.render import BoardRenderer, GLYPHS, render_frame
+
+
+def test_frame_places_boards_side_by_side():
+    left = np.array([[0, 1], [2, 3]], dtype=np.int8)
+    right = np.array([[4, 0, 0]], dtype=np.int8)
+
+    frame = render_frame([left, right], symbols=GLYPHS, gap=2)
+
+    assert frame == '~ #  X ~ ~\no *\n'
+
+
+def test_live_renderer_redraws_only_changed_cells():
+    stream = io.StringIO()
+    renderer = BoardRenderer(stream, gap=2, max_fps=float('inf'))
+    grids = [np.zeros((2, 2), dtype=np.int8), np.zeros((2, 2), dtype=np.int8)]
+    renderer.draw(grids)
+    stream.seek(0)
+    stream.truncate()
+
+    grids[1][1, 0] = 3
+    assert renderer.draw(grids)
+
+    # One cursor move to row 2, column 6 (second board), then park below.
+    assert stream.getvalue() == '\x1b[2;6H3\x1b[3;1H'
+    assert renderer.frame(grids) == '0 0  0 0\n0 0  3 0\n'
+
+
+def test_unchanged_frames_write_nothing():
+    stream = io.StringIO()
+    renderer = BoardRenderer(stream, live=True, max_fps=float('inf'))
+    grid = np.zeros((2, 2), dtype=np.int8)
+    renderer.draw([grid])
+    written = stream.getvalue()
+
+    renderer.draw([grid])
+
+    assert stream.getvalue() == written
+
+
+def test_frames_above_max_fps_are_dropped():
+    renderer = BoardRenderer(io.StringIO(), max_fps=1e-6)
+    grid = np.zeros((2, 2), dtype=np.int8)
+
+    assert renderer.draw([grid])
+    assert not renderer.draw([grid])
+    assert renderer.draw([grid], force=True)
@@ -0,0 +1,81 @@
+"""Tests for `src.battleships.engine.replay`."""
+
+# Standard library imports
+import json
+
+# Third-party imports
+import pytest
+
+# Local application imports
+from src.battleships.engine.replay import verify
+from src.battleships.engine.simulation import simulate
+from src.battleships.loaders import fleet_ships, load_fleet
+from src.battleships.settings import GameSettings
+
+
+@pytest.fixture(scope='module')
+def recorded(tmp_path_factory):
+    """Settings, ship sizes and the entries of a small replay log."""
+    settings = GameSettings()
+    fleet = load_fleet(settings.Fleet)
+    path = tmp_path_factory.mktemp('replay') / 'games.jsonl'
+    simulate(settings, fleet, ['parity', 'hunt'], 8, replay=path,
+             progress=None)
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    return settings, [spec.size for _, spec in fleet_ships(fleet)], entries
+
+
+def _verify(tmp_path, settings, sizes, entries, tail=''):
+    path = tmp_path / 'log.jsonl'
+    path.write_text(''.join(json.dumps(e) + '\n' for e in entries) + tail)
+    return verify(path, settings, sizes=sizes)
+
+
+def test_untouched_log_verifies(tmp_path, recorded):
+    report = _verify(tmp_path, *recorded)
+    assert report.ok and report.games == 8
+
+
+def test_mixed_result_fields_are_accepted(tmp_path, recorded):
+    settings, sizes, entries = recorded
+    entries = json.loads(json.dumps(entries))
+    for entry in entries[::2]:
+        entry['shots'] = [shot[:3] for shot in entry['shots']]
+
+    report = _verify(tmp_path, settings, sizes, entries)
+    assert report.ok and report.games == 8
+
+
+def test_tampered_result_diverges(tmp_path, recorded):
+    settings, sizes, entries = recorded
+    entries = json.loads(json.dumps(entries))
+    shot = entries[2]['shots'][0]
+    shot[3] = 3 if shot[3] == 2 else 2
+
+    report = _verify(tmp_path, settings, sizes, entries)
+    assert [(d.game, d.move) for d in report.divergences] == [(2, 0)]
+
+
+def test_illegal_layouts_diverge_before_shots(tmp_path, recorded):
+    settings, sizes, entries = recorded
+    entries = json.loads(json.dumps(entries))
+    entries[1]['layouts'][0] = [-1] * len(entries[1]['layouts'][0])
+    layout = entries[3]['layouts'][1]
+    empty = len(layout) - 1 - layout[::-1].index(-1)
+    layout[layout.index(0)], layout[empty] = -1, 0
+
+    report = _verify(tmp_path, settings, sizes, entries)
+    assert [(d.game, d.move) for d in report.divergences] == [(1, 0), (3, 0)]
+    assert all('illegal layout' in d.reason for d in report.divergences)
+
+
+def test_malformed_entries_are_reported(tmp_path, recorded):
+    settings, sizes, entries = recorded
+    entries = json.loads(json.dumps(entries))
+    entries[4]['shots'][0] = entries[4]['shots'][0][:2]
+    entries[5]['layouts'][0][0] = 1 << 20
+
+    report = _verify(tmp_path, settings, sizes, entries, tail='{oops\n')
+    assert sorted(d.game for d in report.divergences) == [-1, 4, 5]
+    assert all('malformed' in d.reason for d in report.divergences)
+    assert report.games == 9
@@ -0,0 +1,53 @@
+"""Tests for `src.battleships.engine.simulation`."""
+
+# Standard library imports
+import csv
+
+# Third-party imports
+import pytest
+
+# Local application imports
+from src.battleships.engine.simulation import simulate
+from src.battleships.loaders import load_fleet
+from src.battleships.settings import GameSettings
+
+
+def _simulate(path, **kwargs):
+    settings = GameSettings()
+    report = simulate(settings, load_fleet(settings.Fleet),
+                      ['parity', 'hunt'], 20, out=path, progress=None,
+                      seed=3, **kwargs)
+    return report, path.read_text()
+
+
+def test_report_counts_every_game_and_move(tmp_path):
+    report, text = _simulate(tmp_path / 'games.csv')
+
+    rows = list(csv.DictReader(text.splitlines()))
+    assert report.games == len(rows) == 20
+    assert report.moves == sum(int(row['total_shots']) for row in rows)
+    assert report.backend == 'serial'
+    assert report.wall_time > 0
+    assert 'games/s' in report.summary()
+
+
+@pytest.mark.parametrize('backend', ['threads', 'processes'])
+def test_backends_play_the_same_games(tmp_path, backend):
+    _, serial = _simulate(tmp_path / 'serial.csv')
+
+    report, pooled = _simulate(tmp_path / 'pooled.csv', workers=2,
+                               backend=backend)
+
+    assert report.backend == f"2 {backend}"
+    assert pooled == serial
+
+
+def test_invalid_runs_are_rejected(tmp_path):
+    settings = GameSettings()
+    fleet = load_fleet(settings.Fleet)
+
+    with pytest.raises(ValueError):
+        simulate(settings, fleet, ['parity'], 1, progress=None)
+    with pytest.raises(ValueError):
+        simulate(settings, fleet, ['parity', 'hunt'], 1, progress=None,
+                 backend='gpu')
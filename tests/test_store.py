@@ -0,0 +1,45 @@
+"""Tests for `src.battleships.engine.store`."""
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.battleships.engine.store import RESULT_DTYPE, ResultStore
+
+
+def _rows(n: int, settings: int) -> np.ndarray:
+    rows = np.zeros(n, dtype=RESULT_DTYPE)
+    rows['settings'] = settings
+    rows['game'] = np.arange(n)
+    rows['winner'] = np.arange(n) % 2
+    rows['shots_to_win'] = 17 + np.arange(n)
+    return rows
+
+
+def test_settings_digest_above_int64(tmp_path):
+    digest = 2 ** 64 - 5
+    store = ResultStore(tmp_path, chunk_rows=4)
+    store.append(np.concatenate([_rows(4, digest), _rows(4, 2 ** 63)]))
+
+    assert len(store.read(where={'settings': digest})) == 4
+    result = store.query(group_by=['settings'], agg={'shots_to_win': 'max'})
+    assert result['settings'].tolist() == [2 ** 63, digest]
+    assert result['rows'].tolist() == [4, 4]
+
+
+def test_duplicate_filter_values(tmp_path):
+    store = ResultStore(tmp_path)
+    store.append(_rows(10, 1))
+
+    assert len(store.read(where={'winner': [1, 1]})) == 5
+    assert len(store.read(where={'winner': (0, 1, 1)})) == 10
+    assert len(store.read(where={'winner': [2, 2]})) == 0
+
+
+def test_array_filter_is_membership(tmp_path):
+    store = ResultStore(tmp_path)
+    store.append(_rows(10, 2 ** 64 - 1))
+
+    assert len(store.read(where={'game': np.array([1, 3, 3, 20])})) == 2
+    assert len(store.read(where={'settings': np.array([2 ** 64 - 1],
+                                                      dtype=np.uint64)})) == 10
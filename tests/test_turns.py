@@ -0,0 +1,78 @@
+"""Tests for `src.battleships.domain.turns`."""
+
+# Standard library imports
+
+# Third-party imports
+import pytest
+
+# Local application imports
+from src.battleships.domain.turns import TurnScheduler
+from src.battleships.settings import PlayerSettings
+
+
+def _scheduler(n_players, hot_streak=2, shots_limit=40):
+    settings = PlayerSettings(hot_streak=hot_streak, shots_limit=shots_limit)
+    return TurnScheduler(n_players, settings)
+
+
+def test_turns_rotate_through_every_seat():
+    turns = _scheduler(3)
+
+    assert [turns.record_shot(False) for _ in range(4)] == [1, 2, 0, 1]
+
+
+def test_hot_streak_keeps_the_turn_until_a_miss():
+    turns = _scheduler(3, hot_streak=2)
+
+    assert turns.record_shot(True) == 1      # A streak of one passes on.
+    assert turns.record_shot(False) == 2
+    assert turns.record_shot(False) == 0
+    assert turns.record_shot(True) == 0      # Seat 0 reaches the streak.
+    assert turns.record_shot(True) == 0
+    assert turns.record_shot(False) == 1
+    assert turns.streak == [0, 0, 0]
+
+
+def test_shots_limit_retires_the_shooter():
+    turns = _scheduler(3, shots_limit=2)
+
+    order = [turns.record_shot(False) for _ in range(5)]
+
+    # Seats 0 and 1 retire after their second shot, passing the turn on.
+    assert order == [1, 2, 0, 1, 2]
+    assert turns.shots_used == [2, 2, 1]
+    assert not turns.is_over
+    turns.record_shot(False)
+    assert turns.is_over
+
+
+def test_eliminated_players_are_skipped():
+    turns = _scheduler(4)
+
+    turns.eliminate(1)
+    turns.eliminate(1)                      # Idempotent.
+
+    assert turns.n_alive == 3
+    assert not turns.is_alive(1)
+    assert turns.next_target(0) == 2
+    assert turns.record_shot(False) == 2
+    assert turns.record_shot(False) == 3
+    assert turns.record_shot(False) == 0
+
+
+def test_game_ends_with_one_player_left():
+    turns = _scheduler(3)
+    turns.record_shot(False)                # Seat 1 to shoot.
+
+    turns.eliminate(1)
+    assert turns.current == 2
+    turns.eliminate(2)
+
+    assert turns.is_over
+    with pytest.raises(RuntimeError):
+        turns.next_target(0)
+
+
+def test_single_player_is_rejected():
+    with pytest.raises(ValueError):
+        _scheduler(1)
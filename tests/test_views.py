@@ -0,0 +1,56 @@
+"""Tests for `src.battleships.domain.views`."""
+
+# Standard library imports
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from src.battleships.domain.board import Board, EMPTY, SHIP, MISS, HIT, SUNK
+from src.battleships.domain.ship import ShipSpec
+from src.battleships.domain.views import BoardViews
+
+
+def _board():
+    board = Board(length=5, width=5)
+    board.place_ship('sub', ShipSpec(size=2, is_cloaked=True),
+                     [(0, 0), (0, 1)])
+    board.place_ship('boat', ShipSpec(size=2), [(2, 0), (2, 1)])
+    return board
+
+
+def test_public_view_hides_unhit_ships():
+    views = BoardViews(_board(), owner='owner')
+    views.add_viewer('spectator')
+
+    assert (views.view('spectator') == EMPTY).all()
+    assert views.view('owner')[0, 0] == SHIP
+
+
+def test_public_view_shows_cloaked_hits_as_misses():
+    board = _board()
+    views = BoardViews(board, owner='owner')
+    views.add_viewer('spectator')
+    public = views.view('spectator')
+
+    board.receive_shot((0, 0))
+    board.receive_shot((2, 0))
+    assert public[0, 0] == MISS
+    assert public[2, 0] == HIT
+
+    board.receive_shot((0, 1))
+    board.receive_shot((2, 1))
+    np.testing.assert_array_equal(public[0, :2], [MISS, MISS])
+    np.testing.assert_array_equal(public[2, :2], [SUNK, SUNK])
+    np.testing.assert_array_equal(views.view('owner')[0, :2], [SUNK, SUNK])
+
+
+def test_views_are_read_only_and_registered():
+    views = BoardViews(_board())
+    views.add_viewer('ally', reveal=True)
+
+    with pytest.raises(ValueError):
+        views.view('ally')[0, 0] = EMPTY
+    with pytest.raises(KeyError):
+        views.view('stranger')